@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Compile encounter slot weights into Walker/Vose alias tables and check them.
+
+For every area's grass, surf and fishing slots, builds the same integer alias
+table as EncounterAliasTable.cs: with n slots and total weight W, column i
+keeps slot i for rolls below threshold[i] (out of W) and hands the rest to
+alias[i]. Picking a slot is Next(n) for the column and Next(W) for the roll,
+and slot i comes up with probability exactly weight[i] / W. Output is
+data/tables/encounter_alias.json:
+
+  {"areas": {area id: {method: {"total": W, "threshold": [...], "alias": [...],
+                                "speciesId": [...], "minLevel": [...], "maxLevel": [...]}}}}
+
+pick() replays EncounterSystem.PickSlot draw for draw with dotnet_random, for
+simulators that need the game's exact sequence.
+
+--verify checks every table two ways: the probability mass it gives each slot
+must equal weight * n exactly, and a large vectorized sample must pass a
+chi-square goodness-of-fit test against the weights.
+
+Usage:
+    python scripts/alias_tables.py [--data-dir DIR] [--out PATH]
+    python scripts/alias_tables.py --verify [--samples 1000000] [--seed 1]
+"""
+import argparse, json, math, os
+
+import numpy as np
+
+from gamedata import DATA_DIR, load_json
+
+METHODS = ("grass", "surf", "fishing")
+DEFAULT_SAMPLES = 1_000_000
+# Per-table p-value below which --verify fails; with ~100 tables a correct
+# sampler trips this about once in ten thousand runs
+MIN_P_VALUE = 1e-6
+
+
+def build_alias(weights):
+    """(total, threshold, alias) built exactly like EncounterAliasTable's constructor."""
+    n = len(weights)
+    total = sum(weights)
+    threshold, alias = [0] * n, [0] * n
+    scaled = [w * n for w in weights]
+    small = [i for i in range(n) if scaled[i] < total]
+    large = [i for i in range(n) if scaled[i] >= total]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        threshold[less] = scaled[less]
+        alias[less] = more
+        scaled[more] -= total - scaled[less]
+        (small if scaled[more] < total else large).append(more)
+    while large:
+        i = large.pop()
+        threshold[i], alias[i] = total, i
+    return total, threshold, alias
+
+
+def compile_tables(encounters):
+    areas = {}
+    for table in encounters:
+        methods = {}
+        for method in METHODS:
+            slots = table.get(method) or []
+            if not slots:
+                continue
+            total, threshold, alias = build_alias([s["weight"] for s in slots])
+            methods[method] = {
+                "total": total, "threshold": threshold, "alias": alias,
+                "speciesId": [s["speciesId"] for s in slots],
+                "minLevel": [s["minLevel"] for s in slots],
+                "maxLevel": [s["maxLevel"] for s in slots],
+            }
+        if methods:
+            areas[table["areaId"]] = methods
+    return {"areas": areas}
+
+
+def pick(table, rng):
+    """Slot index chosen by EncounterSystem.PickSlot from a DotNetRandom."""
+    n = len(table["threshold"])
+    if table["total"] <= 0:
+        return n - 1
+    column = rng.next(n)
+    return column if rng.next(table["total"]) < table["threshold"][column] else table["alias"][column]
+
+
+def slot_mass(table):
+    """Probability of each slot in units of 1 / (n * total), read back from the table."""
+    mass = [0] * len(table["threshold"])
+    for column, (threshold, alias) in enumerate(zip(table["threshold"], table["alias"])):
+        mass[column] += threshold
+        mass[alias] += table["total"] - threshold
+    return mass
+
+
+def sample(table, count, generator):
+    """count slot indexes drawn with the two-draw alias method, vectorized."""
+    threshold = np.asarray(table["threshold"])
+    alias = np.asarray(table["alias"])
+    columns = generator.integers(len(threshold), size=count)
+    rolls = generator.integers(table["total"], size=count)
+    return np.where(rolls < threshold[columns], columns, alias[columns])
+
+
+def chi_square_p(statistic, dof):
+    """Upper tail of the chi-square distribution (Wilson-Hilferty approximation)."""
+    if dof <= 0:
+        return 1.0
+    z = ((statistic / dof) ** (1 / 3) - (1 - 2 / (9 * dof))) / math.sqrt(2 / (9 * dof))
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def verify(compiled, weights, samples=DEFAULT_SAMPLES, seed=1):
+    """[(area, method, exact ok, chi-square, dof, p)] for every table."""
+    generator = np.random.default_rng(seed)
+    results = []
+    for area_id, methods in compiled["areas"].items():
+        for method, table in methods.items():
+            w = np.asarray(weights[area_id, method], dtype=float)
+            n = len(w)
+            exact = slot_mass(table) == [int(x) * n for x in w]
+            counts = np.bincount(sample(table, samples, generator), minlength=n)
+            expected = samples * w / w.sum()
+            used = expected > 0
+            statistic = float((((counts - expected) ** 2)[used] / expected[used]).sum())
+            zero_hits = int(counts[~used].sum())
+            dof = int(used.sum()) - 1
+            p = chi_square_p(statistic, dof) if not zero_hits else 0.0
+            results.append((area_id, method, exact, statistic, dof, p))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--out", default=os.path.join(DATA_DIR, "tables", "encounter_alias.json"))
+    parser.add_argument("--verify", action="store_true", help="check the tables against the weights")
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES, help="draws per table for --verify")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    encounters = load_json(args.data_dir, "encounters", [])
+    compiled = compile_tables(encounters)
+    os.makedirs(os.path.dirname(args.out), exist_ok=True)
+    with open(args.out, "w") as f:
+        json.dump(compiled, f, separators=(",", ":"))
+    count = sum(len(m) for m in compiled["areas"].values())
+    print(f"{count} alias tables for {len(compiled['areas'])} areas written to {args.out}")
+
+    if args.verify:
+        weights = {(t["areaId"], m): [s["weight"] for s in t[m]]
+                   for t in encounters for m in METHODS if t.get(m)}
+        results = verify(compiled, weights, args.samples, args.seed)
+        failed = [r for r in results if not r[2] or r[5] < MIN_P_VALUE]
+        for area_id, method, exact, statistic, dof, p in failed:
+            print(f"FAIL {area_id}/{method}: exact={exact} chi2={statistic:.2f} dof={dof} p={p:.2e}")
+        worst = min(results, key=lambda r: r[5])
+        print(f"{len(results)} tables, {args.samples} draws each: {len(failed)} failed; "
+              f"lowest p = {worst[5]:.3g} ({worst[0]}/{worst[1]})")
+        if failed:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
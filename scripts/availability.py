@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""Which species a player can have before each trainer battle, by progression stage.
+
+Stages are progression.battle_stages: the moment before each gym leader, Elite
+Four member and the Champion, with the flags held and areas reachable then.
+For every stage the index holds the species obtainable within the stage's level
+cap (starters, grass/surf/fishing slots of the reachable areas and their
+level-up evolutions, see progression.obtainable_levels) as:
+
+  bits        uint8 [stage, (max dex + 8) // 8]: species bitset, bit d % 8 of
+              byte d // 8 set when dex number d is obtainable
+  min_level   uint8 [stage, max dex + 1]: lowest level it can be obtained at
+  max_level   uint8 [stage, max dex + 1]: highest level it can be caught at or
+              evolve into without training past the wild ranges, 0 when absent
+
+Every trainer is assigned the first stage at which its area is reachable and
+its requiredFlag held (a gate trainer gets its own stage); trainers only
+reachable after the Champion get stage -1. Lookups by stage and species are
+array indexing.
+
+The index is cached in .cache/availability/ under a hash of the data files and
+code it is built from, so it is computed once per data change.
+
+Usage:
+    python scripts/availability.py                   # stage timeline
+    python scripts/availability.py --trainer 201     # species before one battle
+    python scripts/availability.py --stage 3 --json
+"""
+import argparse, hashlib, json, os
+
+import numpy as np
+
+from gamedata import DATA_DIR, ROOT_DIR, GameData, data_path
+from progression import battle_stages, obtainable_levels
+
+CACHE_DIR = os.path.join(ROOT_DIR, ".cache", "availability")
+INPUT_FILES = ("species", "evolutions", "areas", "encounters", "trainers", "progression")
+SOURCES = ("availability.py", "progression.py")
+
+
+def input_hash(data_dir):
+    digest = hashlib.sha256()
+    here = os.path.dirname(os.path.abspath(__file__))
+    paths = [data_path(data_dir, name) for name in INPUT_FILES] + [os.path.join(here, s) for s in SOURCES]
+    for path in paths:
+        digest.update(os.path.basename(path).encode() + b"\0")
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def trainer_stages(data, stages):
+    """{trainer id: index of the first stage it can be fought at, or -1}."""
+    gates = {s["trainerId"]: s["index"] for s in stages}
+    result = {}
+    for trainer in data.trainers.values():
+        if trainer["id"] in gates:
+            result[trainer["id"]] = gates[trainer["id"]]
+            continue
+        required = trainer.get("requiredFlag")
+        result[trainer["id"]] = next(
+            (s["index"] for s in stages
+             if trainer.get("areaId") in s["areas"] and (required is None or required in s["flags"])), -1)
+    return result
+
+
+class Availability:
+    """Per-stage species bitsets and level ranges; see the module docstring."""
+
+    def __init__(self, stages, bits, min_level, max_level, trainer_stage):
+        self.stages = stages              # [{"index", "trainerId", "name", "areaId", "levelCap"}]
+        self.bits = bits
+        self.min_level = min_level
+        self.max_level = max_level
+        self.trainer_stage = trainer_stage
+
+    @classmethod
+    def build(cls, data):
+        stages = battle_stages(data)
+        size = max(data.species) + 1
+        bits = np.zeros((len(stages), (size + 7) // 8), dtype=np.uint8)
+        min_level = np.zeros((len(stages), size), dtype=np.uint8)
+        max_level = np.zeros((len(stages), size), dtype=np.uint8)
+        for stage in stages:
+            levels = obtainable_levels(data, stage["areas"], stage["flags"], stage["levelCap"])
+            row = stage["index"]
+            for species_id, (low, high) in levels.items():
+                bits[row, species_id >> 3] |= 1 << (species_id & 7)
+                min_level[row, species_id] = low
+                max_level[row, species_id] = high
+        summary = [{k: s[k] for k in ("index", "trainerId", "name", "areaId", "levelCap")} for s in stages]
+        return cls(summary, bits, min_level, max_level, trainer_stages(data, stages))
+
+    @classmethod
+    def load(cls, data_dir=DATA_DIR, cache_dir=CACHE_DIR):
+        """The index for data_dir, from the cache when the inputs are unchanged."""
+        path = os.path.join(cache_dir, input_hash(data_dir) + ".npz")
+        try:
+            with np.load(path) as f:
+                meta = json.loads(f["meta"].tobytes())
+                return cls(meta["stages"], f["bits"], f["min_level"], f["max_level"],
+                           {int(k): v for k, v in meta["trainerStage"].items()})
+        except (FileNotFoundError, KeyError, ValueError):
+            pass
+        index = cls.build(GameData.load_from_directory(data_dir))
+        index.save(path)
+        return index
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        meta = json.dumps({"stages": self.stages, "trainerStage": self.trainer_stage}).encode()
+        tmp = path + ".tmp.npz"
+        np.savez(tmp, bits=self.bits, min_level=self.min_level, max_level=self.max_level,
+                 meta=np.frombuffer(meta, dtype=np.uint8))
+        os.replace(tmp, path)
+        # Only the index for the current inputs is worth keeping
+        for name in os.listdir(os.path.dirname(path)):
+            if name.endswith(".npz") and name != os.path.basename(path):
+                os.remove(os.path.join(os.path.dirname(path), name))
+
+    def has(self, stage, species_id):
+        if species_id >= self.min_level.shape[1]:
+            return False
+        return bool(self.bits[stage, species_id >> 3] >> (species_id & 7) & 1)
+
+    def levels(self, stage, species_id):
+        """(lowest, highest) obtainable level at a stage, or None."""
+        if not self.has(stage, species_id):
+            return None
+        return int(self.min_level[stage, species_id]), int(self.max_level[stage, species_id])
+
+    def species(self, stage):
+        """Dex numbers obtainable at a stage, ascending."""
+        flat = np.unpackbits(self.bits[stage], bitorder="little")
+        return np.flatnonzero(flat).tolist()
+
+    def stage_for_trainer(self, trainer_id):
+        return self.trainer_stage.get(trainer_id, -1)
+
+
+def stage_record(index, stage, data=None):
+    record = dict(index.stages[stage])
+    record["species"] = {s: list(index.levels(stage, s)) for s in index.species(stage)}
+    if data:
+        record["names"] = {s: data.species[s]["Name"] for s in record["species"] if s in data.species}
+    return record
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    parser.add_argument("--stage", type=int, help="list the species of one stage")
+    parser.add_argument("--trainer", type=int, help="list the species available before a trainer")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    index = Availability.load(args.data_dir, args.cache_dir)
+    stage = args.stage
+    if args.trainer is not None:
+        stage = index.stage_for_trainer(args.trainer)
+        if stage < 0:
+            raise SystemExit(f"trainer {args.trainer} is not reachable before the Champion")
+
+    if stage is not None:
+        if not 0 <= stage < len(index.stages):
+            raise SystemExit(f"no stage {stage} (have 0-{len(index.stages) - 1})")
+        record = stage_record(index, stage, GameData.load_from_directory(args.data_dir))
+        if args.json:
+            print(json.dumps(record, indent=2))
+            return
+        print(f"stage {stage}: before {record['name']} (cap {record['levelCap']}), "
+              f"{len(record['species'])} species")
+        for s, (low, high) in record["species"].items():
+            print(f"  {s:>3} {record['names'].get(s, '?'):<12} L{low}-{high}")
+        return
+
+    counts = {}
+    for stage_index in index.trainer_stage.values():
+        counts[stage_index] = counts.get(stage_index, 0) + 1
+    if args.json:
+        print(json.dumps([{**s, "species": index.species(s["index"]),
+                           "trainers": counts.get(s["index"], 0)} for s in index.stages], indent=2))
+        return
+    print(f"{'stage':>5} {'before':<14} {'cap':>3} {'species':>7} {'new':>4} {'trainers':>8}")
+    previous = set()
+    for s in index.stages:
+        current = set(index.species(s["index"]))
+        print(f"{s['index']:>5} {s['name']:<14} {s['levelCap']:>3} {len(current):>7} "
+              f"{len(current - previous):>4} {counts.get(s['index'], 0):>8}")
+        previous = current
+    if counts.get(-1):
+        print(f"{counts[-1]} trainers are only reachable after the Champion")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""Monte Carlo balance simulation of every trainer against a reference team.
+
+Each trainer is fought over a fixed seed set with battle_engine.py, using the
+same policy as BattleRecorder: both sides pick a random move with PP left from
+a generator seeded with ~seed, the engine rolls from one seeded with seed, and
+the player sends out the next Pokemon after a faint. The reference team is a
+list of species at the trainer's highest level with TRAINER_DV and default
+moves, so results are comparable across trainers.
+
+Results are cached on disk by content: the key hashes everything a trainer's
+result depends on - its party and resolved moves, the reference team, the
+species and move records of both parties, the type chart, the seed set and the
+engine source - so after an edit to generate_trainers.py or to one species
+only the trainers it touches are simulated again. The cache is trimmed to a
+size limit, least recently used entries first.
+
+Usage:
+    python scripts/balance_sim.py                          # all trainers, cached
+    python scripts/balance_sim.py --trainer 1 --trainer 2 --seeds 500
+    python scripts/balance_sim.py --stale                  # list trainers needing a rerun
+    python scripts/balance_sim.py --check                  # trainers sharing a cache key keep their ids
+    python scripts/generate_trainers.py --stale            # same, for freshly generated records
+"""
+import argparse, hashlib, json, os, tempfile
+from multiprocessing import Pool
+
+from battle_calc import TRAINER_DV
+from battle_engine import PLAYER, BattleEngine, BattleState, Pokemon
+from dotnet_random import DotNetRandom
+from gamedata import DATA_DIR, ROOT_DIR, GameData
+
+# Bump when the simulation policy changes in a way the engine hash cannot see
+SIM_VERSION = 1
+ENGINE_SOURCES = ("battle_engine.py", "dotnet_random.py", "battle_calc.py")
+
+REFERENCE_TEAM = (3, 6, 9)     # Venusaur, Charizard, Blastoise
+DEFAULT_SEEDS = 200
+MAX_TURNS = 200
+CACHE_DIR = os.path.join(ROOT_DIR, ".cache", "balance_sim")
+DEFAULT_CACHE_MB = 64
+STRUGGLE_ID = 165
+METRONOME_EFFECT = "Metronome"
+
+_data = None
+_engine_hash = None
+
+
+def engine_hash():
+    global _engine_hash
+    if _engine_hash is None:
+        digest = hashlib.sha256()
+        here = os.path.dirname(os.path.abspath(__file__))
+        for name in ENGINE_SOURCES:
+            with open(os.path.join(here, name), "rb") as f:
+                digest.update(f.read())
+        _engine_hash = digest.hexdigest()
+    return _engine_hash
+
+
+def opponent_moves(data, member):
+    return member.get("moveOverrides") or data.default_moves(member["speciesId"], member["level"])
+
+
+def parties(data, trainer, team):
+    """(opponent, player) as [(species id, level, move ids)]."""
+    opponent = [(p["speciesId"], p["level"], list(opponent_moves(data, p))) for p in trainer["party"]]
+    level = max(p["level"] for p in trainer["party"])
+    player = [(s, level, data.default_moves(s, level)) for s in team]
+    return opponent, player
+
+
+def trainer_key(data, trainer, team=REFERENCE_TEAM, seeds=range(1, DEFAULT_SEEDS + 1)):
+    """Content hash of every input a trainer's simulated result depends on."""
+    opponent, player = parties(data, trainer, team)
+    species_ids = sorted({s for s, _, _ in opponent + player})
+    move_ids = {m for _, _, moves in opponent + player for m in moves} | {STRUGGLE_ID}
+    metronome = any(data.moves[m]["effect"] == METRONOME_EFFECT for m in move_ids if m in data.moves)
+    if metronome:
+        move_ids = set(data.moves)
+    payload = {
+        "version": SIM_VERSION,
+        "engine": engine_hash(),
+        "opponent": opponent,
+        "player": player,
+        "species": [data.species[s] for s in species_ids],
+        "moves": [data.moves[m] for m in sorted(move_ids) if m in data.moves],
+        # Metronome draws from the moves in file order
+        "moveOrder": list(data.moves) if metronome else None,
+        "typeChart": sorted([a, d, m] for (a, d), m in data.type_chart.items()),
+        "seeds": [seeds.start, seeds.stop],
+        "maxTurns": MAX_TURNS,
+    }
+    text = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class ResultCache:
+    """Directory of JSON results named by key; file mtimes record last use."""
+
+    def __init__(self, path=CACHE_DIR, max_bytes=DEFAULT_CACHE_MB << 20):
+        self.path = path
+        self.max_bytes = max_bytes
+        os.makedirs(path, exist_ok=True)
+
+    def _file(self, key):
+        return os.path.join(self.path, key[:2], key + ".json")
+
+    def __contains__(self, key):
+        return os.path.exists(self._file(key))
+
+    def get(self, key):
+        path = self._file(key)
+        try:
+            with open(path) as f:
+                result = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        os.utime(path)
+        return result
+
+    def put(self, key, result):
+        path = self._file(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(result, f)
+        os.replace(tmp, path)
+
+    def entries(self):
+        """(mtime, size, path) of every cached result."""
+        found = []
+        for root, _, files in os.walk(self.path):
+            for name in files:
+                if name.endswith(".json"):
+                    st = os.stat(os.path.join(root, name))
+                    found.append((st.st_mtime, st.st_size, os.path.join(root, name)))
+        return found
+
+    def evict(self):
+        """Delete least recently used results until the cache fits; returns the count removed."""
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+            removed += 1
+        return removed
+
+
+def choose_move(pokemon, rng):
+    usable = [i for i, move in enumerate(pokemon.pokemon.moves) if move[1] > 0]
+    return usable[rng.next(len(usable))] if usable else -1
+
+
+def simulate_battle(data, opponent, player, seed):
+    """(outcome, turns, player HP fraction left) of one battle."""
+    setup = DotNetRandom(~seed)
+
+    def build(specs):
+        return [Pokemon(s, level, (TRAINER_DV,) * 4, moves, data) for s, level, moves in specs]
+
+    state = BattleState(build(player), build(opponent), data)
+    engine = BattleEngine(state, data, DotNetRandom(seed))
+    turns = 0
+    while not state.is_over and turns < MAX_TURNS:
+        turns += 1
+        engine.execute_turn(("fight", choose_move(state.player_active, setup)),
+                            ("fight", choose_move(state.opponent_active, setup)))
+        if not state.is_over and state.player_active.pokemon.is_fainted:
+            engine.send_out(PLAYER, next(i for i, p in enumerate(state.player_party) if not p.is_fainted))
+    hp = sum(p.current_hp for p in state.player_party)
+    max_hp = sum(p.max_hp(data.species[p.species_id]) for p in state.player_party)
+    return state.outcome, turns, hp / max_hp
+
+
+def simulate_trainer(data, trainer, team, seeds):
+    opponent, player = parties(data, trainer, team)
+    wins = losses = total_turns = 0
+    hp_left = 0.0
+    for seed in seeds:
+        outcome, turns, hp = simulate_battle(data, opponent, player, seed)
+        wins += outcome == "PlayerWin"
+        losses += outcome == "PlayerLose"
+        total_turns += turns
+        hp_left += hp
+    n = len(seeds)
+    return {
+        "trainerId": trainer["id"], "battles": n,
+        "playerWinRate": round(wins / n, 4),
+        "playerLossRate": round(losses / n, 4),
+        "meanTurns": round(total_turns / n, 2),
+        "meanPlayerHpLeft": round(hp_left / n, 4),
+    }
+
+
+def _init_worker(data_dir):
+    global _data
+    _data = GameData.load_from_directory(data_dir)
+
+
+def _simulate_job(job):
+    trainer, team, seeds, key = job
+    result = simulate_trainer(_data, trainer, team, seeds)
+    result["key"] = key
+    return result
+
+
+def stale_trainers(data, trainers, cache, team=REFERENCE_TEAM, seeds=range(1, DEFAULT_SEEDS + 1)):
+    """[(trainer, key)] for the trainers whose current inputs have no cached result."""
+    keyed = [(t, trainer_key(data, t, team, seeds)) for t in trainers]
+    return [(t, key) for t, key in keyed if key not in cache]
+
+
+def run(data, trainers, cache=None, team=REFERENCE_TEAM, seeds=range(1, DEFAULT_SEEDS + 1),
+        data_dir=DATA_DIR, workers=None):
+    """Results for every trainer, in order, simulating only cache misses.
+
+    The key leaves the trainer id out, so trainers with the same inputs share
+    one simulation and one cache entry; the stored result has no id and each
+    trainer's copy gets its own. Returns (results, simulated trainer ids).
+    """
+    keys = [trainer_key(data, t, team, seeds) for t in trainers]
+    by_key, jobs, simulated = {}, {}, []
+    for trainer, key in zip(trainers, keys):
+        if key not in by_key and key not in jobs:
+            cached = cache.get(key) if cache else None
+            if cached is not None:
+                by_key[key] = cached
+            else:
+                jobs[key] = (trainer, team, seeds, key)
+        if key in jobs:
+            simulated.append(trainer["id"])
+
+    if jobs:
+        workers = max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+        with Pool(workers, initializer=_init_worker, initargs=(data_dir,)) as pool:
+            for result in pool.imap_unordered(_simulate_job, jobs.values()):
+                key = result.pop("key")
+                del result["trainerId"]
+                by_key[key] = result
+                if cache:
+                    cache.put(key, result)
+        if cache:
+            cache.evict()
+    # Entries cached before ids were left out still carry trainerId and key
+    results = [{"trainerId": t["id"], **{k: v for k, v in by_key[key].items() if k not in ("trainerId", "key")}}
+               for t, key in zip(trainers, keys)]
+    return results, simulated
+
+
+def shared_keys(data, trainers, team=REFERENCE_TEAM, seeds=range(1, DEFAULT_SEEDS + 1)):
+    """Groups of trainer ids whose parties give the same cache key."""
+    groups = {}
+    for trainer in trainers:
+        groups.setdefault(trainer_key(data, trainer, team, seeds), []).append(trainer["id"])
+    return [ids for ids in groups.values() if len(ids) > 1]
+
+
+def print_stale(stale, total):
+    if not stale:
+        print(f"All {total} trainers have cached balance results")
+        return
+    ids = sorted(t["id"] for t, _ in stale)
+    print(f"{len(stale)} of {total} trainers need re-simulation: {ids}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--trainer", type=int, action="append", help="trainer id (repeatable)")
+    parser.add_argument("--team", type=int, nargs="+", default=list(REFERENCE_TEAM),
+                        help="reference team species ids")
+    parser.add_argument("--seeds", type=int, default=DEFAULT_SEEDS, help="battles per trainer")
+    parser.add_argument("--first-seed", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    parser.add_argument("--cache-mb", type=int, default=DEFAULT_CACHE_MB, help="cache size limit")
+    parser.add_argument("--no-cache", action="store_true", help="simulate everything, cache nothing")
+    parser.add_argument("--stale", action="store_true", help="only list trainers without cached results")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    parser.add_argument("--check", action="store_true",
+                        help="run the trainers that share a cache key twice and check each keeps its own id")
+    args = parser.parse_args()
+
+    data = GameData.load_from_directory(args.data_dir)
+    trainers = list(data.trainers.values())
+    if args.trainer:
+        trainers = [t for t in trainers if t["id"] in args.trainer]
+    team = tuple(args.team)
+    seeds = range(args.first_seed, args.first_seed + args.seeds)
+    cache = None if args.no_cache else ResultCache(args.cache_dir, args.cache_mb << 20)
+
+    if args.stale:
+        print_stale(stale_trainers(data, trainers, cache or ResultCache(args.cache_dir), team, seeds),
+                    len(trainers))
+        return
+
+    if args.check:
+        groups = shared_keys(data, trainers, team, seeds)
+        ids = [i for group in groups for i in group]
+        shared = [t for t in trainers if t["id"] in ids]
+        wrong = []
+        # Once to fill the cache, once to read every result back from it
+        for _ in range(2 if cache else 1):
+            results, _ = run(data, shared, cache, team, seeds, args.data_dir, args.workers)
+            wrong += [(t["id"], r["trainerId"]) for t, r in zip(shared, results) if r["trainerId"] != t["id"]]
+        print(f"{len(groups)} groups of trainers share a cache key: {groups}")
+        if wrong:
+            raise SystemExit(f"results returned for the wrong trainer (expected, got): {wrong}")
+        print("every trainer got its own result")
+        return
+
+    results, simulated = run(data, trainers, cache, team, seeds, args.data_dir, args.workers)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'trainer':>7} {'win%':>6} {'loss%':>6} {'turns':>6} {'hp left':>7}")
+    for r in results:
+        print(f"{r['trainerId']:>7} {100 * r['playerWinRate']:>6.1f} {100 * r['playerLossRate']:>6.1f} "
+              f"{r['meanTurns']:>6.1f} {100 * r['meanPlayerHpLeft']:>6.1f}%")
+    print(f"{len(simulated)} trainers simulated, {len(results) - len(simulated)} from cache")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""Gen 1 stat, accuracy, critical hit and damage formulas.
+
+Ports of StatCalculator, AccuracyCalculator, CriticalHitCalculator and
+DamageCalculator. All arithmetic keeps the integer truncation of the C# code so
+results match the game exactly; the expected_* helpers average over the random
+rolls instead of sampling them.
+"""
+import math
+
+from gamedata import PHYSICAL_TYPES
+
+# Trainer Pokemon get random DVs (0-15) from PokemonInstance.Create and no stat
+# experience. Tools that need a single deterministic value use the midpoint.
+TRAINER_DV = 8
+TRAINER_STAT_EXP = 0
+
+# Random factor range used by DamageCalculator (inclusive)
+RANDOM_MIN, RANDOM_MAX = 217, 255
+
+# RollMultiHitCount: 2 and 3 hits 3/8 each, 4 and 5 hits 1/8 each
+MULTI_HIT_EXPECTED = (3 * 2 + 3 * 3 + 4 + 5) / 8
+
+STAT_NAMES = ("hp", "attack", "defense", "special", "speed")
+
+
+def hp_dv(attack_dv, defense_dv, speed_dv, special_dv):
+    return 8 * (attack_dv & 1) + 4 * (defense_dv & 1) + 2 * (speed_dv & 1) + (special_dv & 1)
+
+
+def stat_exp_bonus(stat_exp):
+    return int(math.ceil(math.sqrt(stat_exp)) / 4.0)
+
+
+def calculate_hp(base_stat, dv, stat_exp, level):
+    return ((base_stat + dv) * 2 + stat_exp_bonus(stat_exp)) * level // 100 + level + 10
+
+
+def calculate_stat(base_stat, dv, stat_exp, level):
+    return ((base_stat + dv) * 2 + stat_exp_bonus(stat_exp)) * level // 100 + 5
+
+
+def _div(a, b):
+    # C# integer division truncates toward zero
+    q = abs(a) // abs(b)
+    return q if (a >= 0) == (b >= 0) else -q
+
+
+def experience_for_level(rate, level):
+    n = level
+    if rate == "Fast":
+        return _div(4 * n * n * n, 5)
+    if rate == "MediumSlow":
+        return _div(6 * n * n * n, 5) - 15 * n * n + 100 * n - 140
+    if rate == "Slow":
+        return _div(5 * n * n * n, 4)
+    return n * n * n
+
+
+def battle_stats(species, level, dv=TRAINER_DV, stat_exp=TRAINER_STAT_EXP):
+    """Calculated stats for a species at a level with one DV for every stat."""
+    return {
+        "hp": calculate_hp(species["BaseHp"], hp_dv(dv, dv, dv, dv), stat_exp, level),
+        "attack": calculate_stat(species["BaseAttack"], dv, stat_exp, level),
+        "defense": calculate_stat(species["BaseDefense"], dv, stat_exp, level),
+        "special": calculate_stat(species["BaseSpecial"], dv, stat_exp, level),
+        "speed": calculate_stat(species["BaseSpeed"], dv, stat_exp, level),
+    }
+
+
+def accuracy_threshold(move_accuracy):
+    """Hit threshold out of 256 at neutral accuracy/evasion stages; 256 never misses."""
+    if move_accuracy == 0 or move_accuracy is None:
+        return 256
+    return max(1, min(255, move_accuracy * 255 // 100))
+
+
+def crit_threshold(base_speed, high_crit_rate):
+    threshold = min(base_speed * 8, 255) if high_crit_rate else base_speed // 2
+    return max(0, min(255, threshold))
+
+
+def damage_rolls(level, power, attack, defense, stab, eff1, eff2=None, critical=False,
+                 explosion=False):
+    """Damage for every random factor 217-255, following DamageCalculator.Calculate.
+
+    attack and defense are the already-chosen stats (physical or special).
+    """
+    if attack > 255 or defense > 255:
+        attack = max(1, attack // 4)
+        defense = max(1, defense // 4)
+    if explosion:
+        defense = max(1, defense // 2)
+    defense = max(1, defense)
+
+    damage = (2 * level * (2 if critical else 1)) // 5 + 2
+    damage = damage * power * attack // defense
+    damage = damage // 50 + 2
+    if stab:
+        damage = damage * 3 // 2
+
+    total = eff1 * (eff2 if eff2 is not None else 1.0)
+    damage = int(damage * eff1)
+    if eff2 is not None:
+        damage = int(damage * eff2)
+
+    if damage > 1:
+        rolls = [damage * r // 255 for r in range(RANDOM_MIN, RANDOM_MAX + 1)]
+    else:
+        rolls = [damage] * (RANDOM_MAX - RANDOM_MIN + 1)
+    if total == 0:
+        return [0] * len(rolls)
+    return [d if d > 0 else 1 for d in rolls]
+
+
+def expected_damage(data, attacker, defender, move):
+    """Expected damage of one use of a move, including accuracy and crit chance.
+
+    attacker and defender are dicts with "species", "level" and "stats"
+    (as returned by battle_stats). Multi-turn moves (Charge, Recharge) are
+    averaged over the turns they occupy, so the result is damage per turn.
+    """
+    a_species, d_species = attacker["species"], defender["species"]
+    d_type1, d_type2 = d_species["Type1"], d_species.get("Type2")
+    effect = move["effect"]
+    eff1 = data.effectiveness(move["type"], d_type1)
+    eff2 = data.effectiveness(move["type"], d_type2) if d_type2 else None
+    total_eff = eff1 * (eff2 if eff2 is not None else 1.0)
+    hit = 1.0 if effect == "Swift" else accuracy_threshold(move["accuracy"]) / 256.0
+
+    if effect == "FixedDamage20":
+        return 20 * hit
+    if effect == "FixedDamage40":
+        return 40 * hit
+    if effect == "LevelDamage":
+        return attacker["level"] * hit if total_eff else 0.0
+    if effect == "Psywave":
+        return (1 + int(attacker["level"] * 1.5)) / 2.0 * hit
+    if effect == "SuperFang":
+        return max(1, defender["stats"]["hp"] // 2) * hit
+    if effect == "OHKO":
+        if total_eff == 0 or attacker["stats"]["speed"] < defender["stats"]["speed"]:
+            return 0.0
+        return defender["stats"]["hp"] * hit
+    if move["power"] <= 0:
+        return 0.0
+
+    physical = move["type"] in PHYSICAL_TYPES
+    attack = attacker["stats"]["attack" if physical else "special"]
+    defense = defender["stats"]["defense" if physical else "special"]
+    stab = move["type"] in (a_species["Type1"], a_species.get("Type2"))
+    explosion = effect == "Explosion"
+
+    normal = damage_rolls(attacker["level"], move["power"], attack, defense, stab,
+                          eff1, eff2, False, explosion)
+    crit = damage_rolls(attacker["level"], move["power"], attack, defense, stab,
+                        eff1, eff2, True, explosion)
+    p_crit = crit_threshold(a_species["BaseSpeed"], move["highCritRate"]) / 256.0
+    per_hit = (1 - p_crit) * sum(normal) / len(normal) + p_crit * sum(crit) / len(crit)
+
+    if effect == "MultiHit":
+        per_hit *= MULTI_HIT_EXPECTED
+    elif effect == "DoubleHit":
+        per_hit *= 2
+    elif effect in ("Charge", "Recharge"):
+        per_hit /= 2
+    return per_hit * hit
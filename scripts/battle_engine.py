@@ -0,0 +1,957 @@
+"""Turn-by-turn port of BattleEngine for replaying and simulating battles.
+
+Mirrors BattleEngine, BattlePokemon, DamageCalculator, AccuracyCalculator and
+CriticalHitCalculator statement by statement, drawing random numbers in the
+same order from a DotNetRandom, so a battle replayed from the same seed and
+actions produces the same events as the game. Events are tuples shaped like
+BattleRecorder's records: (name, fields...), e.g.
+("DamageDealt", "Opponent", 12, False, 2.0).
+"""
+from battle_calc import calculate_hp, calculate_stat, hp_dv
+from dotnet_random import DotNetRandom
+from gamedata import PHYSICAL_TYPES
+
+PLAYER, OPPONENT = "Player", "Opponent"
+STRUGGLE_ID = 165
+
+# BattlePokemon.ApplyStage and AccuracyCalculator stage numerators for -6..+6
+STAGE_NUMERATORS = (25, 28, 33, 40, 50, 66, 100, 150, 200, 250, 300, 350, 400)
+ACCURACY_NUMERATORS = (33, 36, 43, 50, 60, 75, 100, 133, 166, 200, 250, 266, 300)
+
+STRUGGLE = {"id": STRUGGLE_ID, "name": "Struggle", "type": "Normal", "power": 50, "accuracy": 100,
+            "maxPP": 1, "effect": "RecoilThird", "effectChance": 0, "priority": 0,
+            "highCritRate": False, "target": "SingleOpponent"}
+
+CHARGE_TEXT = {
+    "Fly": "{} flew up high!",
+    "Dig": "{} dug a hole!",
+    "Solar Beam": "{} took in sunlight!",
+    "SolarBeam": "{} took in sunlight!",
+    "Skull Bash": "{} lowered its head!",
+    "Sky Attack": "{} is glowing!",
+    "Razor Wind": "{} made a whirlwind!",
+}
+
+SELF_STAT_EFFECTS = {
+    "AttackUp1": ("attack", 1), "AttackUp2": ("attack", 2),
+    "DefenseUp1": ("defense", 1), "DefenseUp2": ("defense", 2),
+    "SpecialUp1": ("special", 1), "SpecialUp2": ("special", 2),
+    "SpeedUp2": ("speed", 2), "EvasionUp1": ("evasion", 1),
+    "Growth": ("special", 1), "Minimize": ("evasion", 1),
+}
+
+FOE_STAT_EFFECTS = {
+    "AccuracyDown1": ("accuracy", -1), "AttackDown1": ("attack", -1),
+    "DefenseDown1": ("defense", -1), "DefenseDown2": ("defense", -2),
+    "SpeedDown1": ("speed", -1), "SpecialDown1": ("special", -1),
+}
+
+SECONDARY_STAT_EFFECTS = {
+    "AttackDown1": ("attack", -1), "DefenseDown1": ("defense", -1),
+    "SpeedDown1": ("speed", -1), "SpecialDown1": ("special", -1),
+}
+
+
+def _div(a, b):
+    # C# integer division truncates toward zero
+    q = abs(a) // abs(b)
+    return q if (a >= 0) == (b >= 0) else -q
+
+
+def _clamp(value, low, high):
+    return max(low, min(high, value))
+
+
+def other_side(side):
+    return OPPONENT if side == PLAYER else PLAYER
+
+
+class Pokemon:
+    """The parts of PokemonInstance a battle reads and changes."""
+
+    def __init__(self, species_id, level, dvs, moves, data, stat_exp=(0, 0, 0, 0, 0), nickname=None):
+        self.species_id = species_id
+        self.level = level
+        self.attack_dv, self.defense_dv, self.speed_dv, self.special_dv = dvs
+        self.stat_exp = stat_exp  # hp, attack, defense, speed, special
+        self.nickname = nickname
+        self.status = "None"
+        # [move id, current PP, max PP], like MoveInstance
+        self.moves = [[m, data.moves[m]["maxPP"], data.moves[m]["maxPP"]] for m in moves]
+        self.current_hp = self.max_hp(data.species[species_id])
+
+    @property
+    def is_fainted(self):
+        return self.current_hp <= 0
+
+    def max_hp(self, species):
+        dv = hp_dv(self.attack_dv, self.defense_dv, self.speed_dv, self.special_dv)
+        return calculate_hp(species["BaseHp"], dv, self.stat_exp[0], self.level)
+
+    def attack(self, species):
+        return calculate_stat(species["BaseAttack"], self.attack_dv, self.stat_exp[1], self.level)
+
+    def defense(self, species):
+        return calculate_stat(species["BaseDefense"], self.defense_dv, self.stat_exp[2], self.level)
+
+    def speed(self, species):
+        return calculate_stat(species["BaseSpeed"], self.speed_dv, self.stat_exp[3], self.level)
+
+    def special(self, species):
+        return calculate_stat(species["BaseSpecial"], self.special_dv, self.stat_exp[4], self.level)
+
+
+class BattlePokemon:
+    VOLATILE = dict(
+        attack_stage=0, defense_stage=0, special_stage=0, speed_stage=0,
+        accuracy_stage=0, evasion_stage=0,
+        is_confused=False, confusion_turns=0, is_flinched=False,
+        is_charging=False, charging_move_id=0, must_recharge=False,
+        has_substitute=False, substitute_hp=0, has_reflect=False, has_light_screen=False,
+        is_seeded=False, toxic_counter=0, disabled_move_id=0, disabled_turns=0,
+        is_trapped=False, trap_turns=0, last_move_used=0, is_raging=False,
+        is_biding=False, bide_turns=0, bide_damage=0, is_thrashing=False, thrash_turns=0,
+    )
+
+    def __init__(self, pokemon, species):
+        self.pokemon = pokemon
+        self.species = species
+        self.__dict__.update(self.VOLATILE)
+        self.sleep_turns = 0
+        self.thrash_move_id = 0
+        self.type1 = species["Type1"]
+        self.type2 = species.get("Type2")
+        if pokemon.status == "Sleep":
+            # BattlePokemon draws from an unseeded Random here; replays never reach it
+            raise ValueError("cannot replay a Pokemon sent out asleep")
+        if pokemon.status == "BadlyPoisoned":
+            self.toxic_counter = 1
+
+    @property
+    def level(self):
+        return self.pokemon.level
+
+    @property
+    def max_hp(self):
+        return self.pokemon.max_hp(self.species)
+
+    @property
+    def unmodified_attack(self):
+        stat = self.pokemon.attack(self.species)
+        if self.pokemon.status == "Burn":
+            stat //= 2
+        return max(1, stat)
+
+    @property
+    def unmodified_defense(self):
+        return max(1, self.pokemon.defense(self.species))
+
+    @property
+    def unmodified_special(self):
+        return max(1, self.pokemon.special(self.species))
+
+    @property
+    def unmodified_speed(self):
+        stat = self.pokemon.speed(self.species)
+        if self.pokemon.status == "Paralysis":
+            stat //= 4
+        return max(1, stat)
+
+    @staticmethod
+    def apply_stage(stat, stage):
+        return stat * STAGE_NUMERATORS[_clamp(stage + 6, 0, 12)] // 100
+
+    @property
+    def effective_attack(self):
+        return max(1, self.apply_stage(self.unmodified_attack, self.attack_stage))
+
+    @property
+    def effective_defense(self):
+        return max(1, self.apply_stage(self.unmodified_defense, self.defense_stage))
+
+    @property
+    def effective_special(self):
+        return max(1, self.apply_stage(self.unmodified_special, self.special_stage))
+
+    @property
+    def effective_speed(self):
+        return max(1, self.apply_stage(self.unmodified_speed, self.speed_stage))
+
+    def modify_stage(self, stat, stages):
+        attr = f"{stat.lower()}_stage"
+        old = getattr(self, attr, 0)
+        new = _clamp(old + stages, -6, 6)
+        if hasattr(self, attr):
+            setattr(self, attr, new)
+        return new - old
+
+    def reset_volatile(self):
+        # ResetVolatile leaves SleepTurns and ThrashMoveId alone
+        self.__dict__.update(self.VOLATILE)
+
+
+class BattleState:
+    def __init__(self, player_party, opponent_party, data, battle_type="Trainer"):
+        self.type = battle_type
+        self.player_party = player_party
+        self.opponent_party = opponent_party
+        self.player_active_index = 0
+        self.opponent_active_index = 0
+        self.player_active = BattlePokemon(player_party[0], data.species[player_party[0].species_id])
+        self.opponent_active = BattlePokemon(opponent_party[0], data.species[opponent_party[0].species_id])
+        self.turn_number = 0
+        self.is_over = False
+        self.outcome = None
+        self.escape_attempts = 0
+
+    def player_has_alive_pokemon(self):
+        return any(not p.is_fainted for p in self.player_party)
+
+    def opponent_has_alive_pokemon(self):
+        return any(not p.is_fainted for p in self.opponent_party)
+
+    def next_alive_opponent(self):
+        for i, p in enumerate(self.opponent_party):
+            if not p.is_fainted and i != self.opponent_active_index:
+                return i
+        return None
+
+
+class BattleEngine:
+    """Actions are ("fight", move_index), ("switch", party_index) or ("run",)."""
+
+    def __init__(self, state, data, rng=None):
+        self.state = state
+        self.data = data
+        self.rng = rng if rng is not None else DotNetRandom(0)
+        self.move_list = list(data.moves.values())
+
+    # ---- turn flow ----
+
+    def execute_turn(self, player_action, opponent_action):
+        events = []
+        state = self.state
+        state.turn_number += 1
+        state.player_active.is_flinched = False
+        state.opponent_active.is_flinched = False
+
+        first, first_action, second, second_action = self.determine_turn_order(player_action, opponent_action)
+        first_side = PLAYER if first is state.player_active else OPPONENT
+        second_side = other_side(first_side)
+
+        self.execute_action(first, first_action, first_side, second, events)
+        if self.check_battle_end(events):
+            return events
+        self.execute_action(second, second_action, second_side, first, events)
+        if self.check_battle_end(events):
+            return events
+        self.process_end_of_turn(events)
+        self.check_battle_end(events)
+        return events
+
+    def determine_turn_order(self, player_action, opponent_action):
+        state = self.state
+        player = (state.player_active, player_action, state.opponent_active, opponent_action)
+        opponent = (state.opponent_active, opponent_action, state.player_active, player_action)
+        p_kind, o_kind = player_action[0], opponent_action[0]
+
+        if p_kind == "switch" and o_kind != "switch":
+            return player
+        if o_kind == "switch" and p_kind != "switch":
+            return opponent
+        if p_kind == "item" and o_kind == "fight":
+            return player
+        if o_kind == "item" and p_kind == "fight":
+            return opponent
+        if p_kind == "run":
+            return player
+
+        p_priority = self.move_priority(state.player_active, player_action)
+        o_priority = self.move_priority(state.opponent_active, opponent_action)
+        if p_priority != o_priority:
+            return player if p_priority > o_priority else opponent
+
+        p_speed = state.player_active.effective_speed
+        o_speed = state.opponent_active.effective_speed
+        if p_speed == o_speed:
+            return player if self.rng.next(2) == 0 else opponent
+        return player if p_speed > o_speed else opponent
+
+    def move_priority(self, pokemon, action):
+        if action[0] == "fight" and 0 <= action[1] < len(pokemon.pokemon.moves):
+            return self.data.moves[pokemon.pokemon.moves[action[1]][0]]["priority"]
+        return 0
+
+    def execute_action(self, actor, action, side, target, events):
+        if actor.pokemon.is_fainted:
+            return
+        kind = action[0]
+        if kind == "run":
+            self.execute_run(actor, target, events)
+        elif kind == "switch":
+            self.execute_switch(side, action[1], events)
+        elif kind == "fight":
+            self.execute_fight(actor, target, side, action[1], events)
+        elif kind == "item":
+            events.append(("Text", "Item use not yet implemented in battle."))
+
+    def execute_run(self, actor, opponent, events):
+        state = self.state
+        if state.type == "Trainer":
+            events.append(("Text", "Can't run from a trainer battle!"))
+            return
+        state.escape_attempts += 1
+        actor_speed = actor.effective_speed
+        opp_speed = opponent.effective_speed
+        if actor_speed >= opp_speed or \
+                self.rng.next(256) < actor_speed * 128 // opp_speed + 30 * state.escape_attempts:
+            events.append(("Text", "Got away safely!"))
+            state.is_over = True
+            state.outcome = "PlayerFled"
+            events.append(("BattleEnded", "PlayerFled"))
+        else:
+            events.append(("Text", "Can't escape!"))
+
+    def execute_switch(self, side, party_index, events):
+        state = self.state
+        party = state.player_party if side == PLAYER else state.opponent_party
+        species = self.data.species[party[party_index].species_id]
+        if side == PLAYER:
+            state.player_active.reset_volatile()
+            state.player_active_index = party_index
+            state.player_active = BattlePokemon(party[party_index], species)
+        else:
+            state.opponent_active.reset_volatile()
+            state.opponent_active_index = party_index
+            state.opponent_active = BattlePokemon(party[party_index], species)
+        events.append(("Switch", side, species["Name"]))
+
+    def send_out(self, side, party_index):
+        """Replace a fainted active Pokemon outside a turn, as the battle screen does."""
+        state = self.state
+        party = state.player_party if side == PLAYER else state.opponent_party
+        active = BattlePokemon(party[party_index], self.data.species[party[party_index].species_id])
+        if side == PLAYER:
+            state.player_active_index, state.player_active = party_index, active
+        else:
+            state.opponent_active_index, state.opponent_active = party_index, active
+
+    def execute_fight(self, attacker, defender, side, move_index, events):
+        name = self.name(attacker, side)
+        if attacker.must_recharge:
+            attacker.must_recharge = False
+            events.append(("Recharge", side))
+            events.append(("Text", f"{name} must recharge!"))
+            return
+
+        if attacker.is_thrashing:
+            attacker.thrash_turns -= 1
+            self.execute_move(attacker, defender, side, self.data.moves[attacker.thrash_move_id], events)
+            if attacker.thrash_turns <= 0:
+                attacker.is_thrashing = False
+                attacker.is_confused = True
+                attacker.confusion_turns = self.rng.next(2, 6)
+                events.append(("Text", f"{name} became confused due to fatigue!"))
+            return
+
+        if not self.can_act(attacker, side, events):
+            return
+
+        if attacker.is_flinched:
+            events.append(("Text", f"{name} flinched!"))
+            return
+
+        if attacker.is_confused:
+            attacker.confusion_turns -= 1
+            if attacker.confusion_turns <= 0:
+                attacker.is_confused = False
+                events.append(("Text", f"{name} snapped out of confusion!"))
+            else:
+                events.append(("Text", f"{name} is confused!"))
+                if self.rng.next(2) == 0:
+                    damage = self.confusion_damage(attacker)
+                    old_hp = attacker.pokemon.current_hp
+                    attacker.pokemon.current_hp = max(0, old_hp - damage)
+                    events.append(("ConfusionHitSelf", side, damage))
+                    events.append(("HpChanged", side, old_hp, attacker.pokemon.current_hp, attacker.max_hp))
+                    if attacker.pokemon.is_fainted:
+                        events.append(("Fainted", side, name))
+                    return
+
+        moves = attacker.pokemon.moves
+        if move_index < 0 or move_index >= len(moves):
+            struggle = self.data.moves.get(STRUGGLE_ID, STRUGGLE)
+            self.execute_move(attacker, defender, side, struggle, events)
+            return
+
+        move_inst = moves[move_index]
+        if move_inst[0] == attacker.disabled_move_id and attacker.disabled_turns > 0:
+            events.append(("Text", f"{self.data.moves[move_inst[0]]['name']} is disabled!"))
+            return
+        if move_inst[1] <= 0:
+            events.append(("Text", "No PP left for this move!"))
+            return
+
+        move_inst[1] -= 1
+        move = self.data.moves[move_inst[0]]
+        attacker.last_move_used = move["id"]
+        self.execute_move(attacker, defender, side, move, events)
+
+    # ---- moves ----
+
+    def execute_move(self, attacker, defender, side, move, events):
+        state = self.state
+        foe_side = other_side(side)
+        name = self.name(attacker, side)
+        effect = move["effect"]
+        events.append(("MoveUsed", side, move["name"]))
+
+        if effect == "Splash":
+            events.append(("Text", "But nothing happened!"))
+            return
+        if effect == "Teleport":
+            if state.type == "Wild":
+                events.append(("Text", "Got away safely!"))
+                state.is_over = True
+                state.outcome = "PlayerFled"
+                events.append(("BattleEnded", "PlayerFled"))
+            else:
+                events.append(("Text", "But it failed!"))
+            return
+        if effect == "Haze":
+            attacker.reset_volatile()
+            defender.reset_volatile()
+            attacker.pokemon.status = "None"
+            defender.pokemon.status = "None"
+            events.append(("Text", "All stat changes were eliminated!"))
+            return
+        if effect == "Mist":
+            events.append(("Text", f"{name} is shrouded in MIST!"))
+            return
+
+        if effect == "Charge" and not attacker.is_charging:
+            attacker.is_charging = True
+            attacker.charging_move_id = move["id"]
+            events.append(("Charging", side, move["name"]))
+            events.append(("Text", CHARGE_TEXT.get(move["name"], "{} is charging up!").format(name)))
+            return
+        attacker.is_charging = False
+
+        if move["accuracy"] > 0 and effect != "Swift":
+            if not self.roll_accuracy(move["accuracy"], attacker.accuracy_stage, defender.evasion_stage):
+                events.append(("MoveMissed", side, move["name"]))
+                if move["id"] in (26, 136):  # Jump Kick, High Jump Kick
+                    old_hp = attacker.pokemon.current_hp
+                    attacker.pokemon.current_hp = max(0, old_hp - 1)
+                    events.append(("Text", f"{name} kept going and crashed!"))
+                    events.append(("HpChanged", side, old_hp, attacker.pokemon.current_hp, attacker.max_hp))
+                return
+
+        if effect == "FixedDamage20":
+            self.apply_damage(defender, foe_side, 20, False, 1.0, events)
+            return
+        if effect == "FixedDamage40":
+            self.apply_damage(defender, foe_side, 40, False, 1.0, events)
+            return
+        if effect == "LevelDamage":
+            if self.total_effectiveness(move["type"], defender) == 0:
+                events.append(("Text", f"It doesn't affect {self.name(defender, foe_side)}!"))
+                return
+            self.apply_damage(defender, foe_side, attacker.level, False, 1.0, events)
+            return
+        if effect == "Psywave":
+            damage = self.rng.next(1, int(attacker.level * 1.5) + 1)
+            self.apply_damage(defender, foe_side, damage, False, 1.0, events)
+            return
+        if effect == "SuperFang":
+            self.apply_damage(defender, foe_side, max(1, defender.pokemon.current_hp // 2), False, 1.0, events)
+            return
+        if effect == "OHKO":
+            if attacker.effective_speed < defender.effective_speed:
+                events.append(("MoveMissed", side, move["name"]))
+                return
+            if self.total_effectiveness(move["type"], defender) == 0:
+                events.append(("Text", f"It doesn't affect {self.name(defender, foe_side)}!"))
+                return
+            events.append(("Ohko", foe_side))
+            self.apply_damage(defender, foe_side, 65535, False, 1.0, events)
+            return
+        if effect == "Counter":
+            events.append(("Text", "Counter is complex - dealing base damage instead."))
+            return
+        if effect == "Bide":
+            if not attacker.is_biding:
+                attacker.is_biding = True
+                attacker.bide_turns = self.rng.next(2, 4)
+                attacker.bide_damage = 0
+                events.append(("Text", f"{name} is storing energy!"))
+            else:
+                attacker.bide_turns -= 1
+                if attacker.bide_turns <= 0:
+                    attacker.is_biding = False
+                    damage = attacker.bide_damage * 2
+                    events.append(("Text", f"{name} unleashed energy!"))
+                    if damage > 0:
+                        self.apply_damage(defender, foe_side, damage, False, 1.0, events)
+                else:
+                    events.append(("Text", f"{name} is storing energy!"))
+            return
+
+        if move["power"] == 0 and move["target"] == "Self":
+            self.execute_self_target_move(attacker, side, move, events)
+        elif move["power"] == 0:
+            self.execute_status_move(attacker, defender, side, foe_side, move, events)
+        else:
+            self.execute_damaging_move(attacker, defender, side, foe_side, move, events)
+
+    def execute_damaging_move(self, attacker, defender, side, foe_side, move, events):
+        effect = move["effect"]
+        if effect in ("MultiHit", "DoubleHit"):
+            hits = self.roll_multi_hit_count() if effect == "MultiHit" else 2
+            for _ in range(hits):
+                damage, critical, eff = self.calculate_damage(attacker, defender, move)
+                self.apply_damage(defender, foe_side, damage, critical, eff, events)
+                if defender.pokemon.is_fainted:
+                    break
+            events.append(("MultiHit", hits))
+            return
+
+        damage, critical, eff = self.calculate_damage(attacker, defender, move)
+        if eff == 0:
+            events.append(("Text", f"It doesn't affect {self.name(defender, foe_side)}!"))
+            return
+        self.apply_damage(defender, foe_side, damage, critical, eff, events)
+
+        name = self.name(attacker, side)
+        if effect == "RecoilThird":
+            recoil = max(1, damage // 4)
+            old_hp = attacker.pokemon.current_hp
+            attacker.pokemon.current_hp = max(0, old_hp - recoil)
+            events.append(("Recoil", side, recoil))
+            events.append(("HpChanged", side, old_hp, attacker.pokemon.current_hp, attacker.max_hp))
+            if attacker.pokemon.is_fainted:
+                events.append(("Fainted", side, name))
+
+        if effect in ("Drain", "DreamEater"):
+            drain = max(1, damage // 2)
+            old_hp = attacker.pokemon.current_hp
+            attacker.pokemon.current_hp = min(attacker.max_hp, old_hp + drain)
+            events.append(("Drain", side, attacker.pokemon.current_hp - old_hp))
+            events.append(("HpChanged", side, old_hp, attacker.pokemon.current_hp, attacker.max_hp))
+
+        if effect == "Explosion":
+            old_hp = attacker.pokemon.current_hp
+            attacker.pokemon.current_hp = 0
+            events.append(("HpChanged", side, old_hp, 0, attacker.max_hp))
+            events.append(("Fainted", side, name))
+
+        if effect == "Recharge" and not defender.pokemon.is_fainted:
+            attacker.must_recharge = True
+
+        if effect in ("Thrash", "PetalDance") and not attacker.is_thrashing:
+            attacker.is_thrashing = True
+            attacker.thrash_turns = self.rng.next(1, 3)
+            attacker.thrash_move_id = move["id"]
+
+        if move["effectChance"] > 0 and not defender.pokemon.is_fainted:
+            if self.rng.next(100) < move["effectChance"]:
+                self.apply_secondary_effect(attacker, defender, side, foe_side, move, events)
+        elif move["effectChance"] == 0 and move["power"] > 0:
+            if effect == "Trapping" and not defender.pokemon.is_fainted:
+                defender.is_trapped = True
+                defender.trap_turns = self.rng.next(2, 6)
+                events.append(("Text", f"{self.name(defender, foe_side)} was trapped!"))
+
+    def execute_self_target_move(self, attacker, side, move, events):
+        effect = move["effect"]
+        name = self.name(attacker, side)
+        pokemon = attacker.pokemon
+        if effect in SELF_STAT_EFFECTS:
+            self.apply_stat_change(attacker, side, *SELF_STAT_EFFECTS[effect], events)
+        elif effect == "Recover":
+            old_hp = pokemon.current_hp
+            if pokemon.current_hp >= attacker.max_hp:
+                events.append(("Text", "HP is already full!"))
+                return
+            pokemon.current_hp = min(attacker.max_hp, pokemon.current_hp + attacker.max_hp // 2)
+            events.append(("Text", f"{name} recovered health!"))
+            events.append(("HpChanged", side, old_hp, pokemon.current_hp, attacker.max_hp))
+        elif effect == "Rest":
+            if pokemon.current_hp >= attacker.max_hp:
+                events.append(("Text", "But it failed!"))
+                return
+            old_hp = pokemon.current_hp
+            pokemon.current_hp = attacker.max_hp
+            pokemon.status = "Sleep"
+            attacker.sleep_turns = 2
+            events.append(("Text", f"{name} went to sleep and became healthy!"))
+            events.append(("HpChanged", side, old_hp, pokemon.current_hp, attacker.max_hp))
+            events.append(("StatusApplied", side, "Sleep"))
+        elif effect == "Reflect":
+            if attacker.has_reflect:
+                events.append(("Text", "But it failed!"))
+                return
+            attacker.has_reflect = True
+            events.append(("Text", f"{name} gained armor!"))
+        elif effect == "LightScreen":
+            if attacker.has_light_screen:
+                events.append(("Text", "But it failed!"))
+                return
+            attacker.has_light_screen = True
+            events.append(("Text", f"{name}'s protected against special attacks!"))
+        elif effect == "FocusEnergy":
+            events.append(("Text", f"{name} is getting pumped!"))
+        elif effect == "Substitute":
+            cost = attacker.max_hp // 4
+            if pokemon.current_hp <= cost:
+                events.append(("Text", "Too weak to make a SUBSTITUTE!"))
+                return
+            if attacker.has_substitute:
+                events.append(("Text", "Already has a SUBSTITUTE!"))
+                return
+            old_hp = pokemon.current_hp
+            pokemon.current_hp -= cost
+            attacker.has_substitute = True
+            attacker.substitute_hp = cost
+            events.append(("SubstituteCreated", side))
+            events.append(("HpChanged", side, old_hp, pokemon.current_hp, attacker.max_hp))
+        elif effect == "Conversion":
+            events.append(("Text", f"{name} transformed its type!"))
+        elif effect == "Metronome":
+            candidates = [m for m in self.move_list if m["id"] not in (118, STRUGGLE_ID)]
+            move = candidates[self.rng.next(len(candidates))]
+            events.append(("Text", f"Metronome became {move['name']}!"))
+            defender = self.state.opponent_active if side == PLAYER else self.state.player_active
+            self.execute_move(attacker, defender, side, move, events)
+        else:
+            events.append(("Text", "But nothing happened!"))
+
+    def execute_status_move(self, attacker, defender, side, foe_side, move, events):
+        effect = move["effect"]
+        foe = self.name(defender, foe_side)
+        target = defender.pokemon
+        types = (defender.type1, defender.type2)
+        if effect == "Sleep":
+            if target.status != "None":
+                events.append(("Text", "But it failed!"))
+                return
+            target.status = "Sleep"
+            defender.sleep_turns = self.rng.next(1, 8)
+            events.append(("StatusApplied", foe_side, "Sleep"))
+            events.append(("Text", f"{foe} fell asleep!"))
+        elif effect == "Poison":
+            if target.status != "None":
+                events.append(("Text", "But it failed!"))
+                return
+            if "Poison" in types:
+                events.append(("Text", "It doesn't affect the foe..."))
+                return
+            toxic = move["id"] == 92
+            target.status = "BadlyPoisoned" if toxic else "Poison"
+            if toxic:
+                defender.toxic_counter = 1
+            events.append(("StatusApplied", foe_side, target.status))
+            events.append(("Text", f"{foe} was poisoned!"))
+        elif effect == "Paralysis":
+            if target.status != "None":
+                events.append(("Text", "But it failed!"))
+                return
+            if move["type"] == "Electric" and "Ground" in types:
+                events.append(("Text", "It doesn't affect the foe..."))
+                return
+            target.status = "Paralysis"
+            events.append(("StatusApplied", foe_side, "Paralysis"))
+            events.append(("Text", f"{foe} is paralyzed! It may be unable to move!"))
+        elif effect == "Confusion":
+            if defender.is_confused:
+                events.append(("Text", "It's already confused!"))
+                return
+            defender.is_confused = True
+            defender.confusion_turns = self.rng.next(2, 6)
+            events.append(("Text", f"{foe} became confused!"))
+        elif effect == "LeechSeed":
+            if "Grass" in types:
+                events.append(("Text", "It doesn't affect the foe..."))
+                return
+            if defender.is_seeded:
+                events.append(("Text", "But it failed!"))
+                return
+            defender.is_seeded = True
+            events.append(("Text", f"{foe} was seeded!"))
+        elif effect == "Disable":
+            if defender.disabled_turns > 0 or defender.last_move_used == 0:
+                events.append(("Text", "But it failed!"))
+                return
+            defender.disabled_move_id = defender.last_move_used
+            defender.disabled_turns = self.rng.next(1, 9)
+            events.append(("Text", f"{self.data.moves[defender.last_move_used]['name']} was disabled!"))
+        elif effect in FOE_STAT_EFFECTS:
+            self.apply_stat_change(defender, foe_side, *FOE_STAT_EFFECTS[effect], events)
+        elif effect == "Transform":
+            events.append(("Text", f"{self.name(attacker, side)} transformed into {foe}!"))
+        elif effect == "Mimic":
+            events.append(("Text", f"{self.name(attacker, side)} learned a move!"))
+        elif effect == "MirrorMove":
+            if defender.last_move_used > 0 and defender.last_move_used in self.data.moves:
+                mirrored = self.data.moves[defender.last_move_used]
+                events.append(("Text", f"Mirror Move became {mirrored['name']}!"))
+                self.execute_move(attacker, defender, side, mirrored, events)
+            else:
+                events.append(("Text", "But it failed!"))
+        else:
+            events.append(("Text", "But nothing happened!"))
+
+    def apply_secondary_effect(self, attacker, defender, side, foe_side, move, events):
+        effect = move["effect"]
+        foe = self.name(defender, foe_side)
+        target = defender.pokemon
+        types = (defender.type1, defender.type2)
+        if effect == "Burn":
+            if target.status == "None" and "Fire" not in types:
+                target.status = "Burn"
+                events.append(("StatusApplied", foe_side, "Burn"))
+                events.append(("Text", f"{foe} was burned!"))
+        elif effect == "Freeze":
+            if target.status == "None" and "Ice" not in types:
+                target.status = "Freeze"
+                events.append(("StatusApplied", foe_side, "Freeze"))
+                events.append(("Text", f"{foe} was frozen solid!"))
+        elif effect == "Paralysis":
+            if target.status == "None":
+                target.status = "Paralysis"
+                events.append(("StatusApplied", foe_side, "Paralysis"))
+                events.append(("Text", f"{foe} is paralyzed!"))
+        elif effect == "Poison":
+            if target.status == "None" and "Poison" not in types:
+                target.status = "Poison"
+                events.append(("StatusApplied", foe_side, "Poison"))
+                events.append(("Text", f"{foe} was poisoned!"))
+        elif effect == "Confusion":
+            if not defender.is_confused:
+                defender.is_confused = True
+                defender.confusion_turns = self.rng.next(2, 6)
+                events.append(("Text", f"{foe} became confused!"))
+        elif effect == "Flinch":
+            defender.is_flinched = True
+        elif effect in SECONDARY_STAT_EFFECTS:
+            self.apply_stat_change(defender, foe_side, *SECONDARY_STAT_EFFECTS[effect], events)
+
+    # ---- damage and stats ----
+
+    def effectiveness(self, attacking, defending):
+        return self.data.effectiveness(attacking, defending)
+
+    def total_effectiveness(self, move_type, defender):
+        return self.data.total_effectiveness(move_type, defender.type1, defender.type2)
+
+    def roll_accuracy(self, move_accuracy, accuracy_stage, evasion_stage):
+        if move_accuracy == 0:
+            return True
+        base = move_accuracy * 255 // 100
+        threshold = base * ACCURACY_NUMERATORS[_clamp(accuracy_stage + 6, 0, 12)] \
+            // ACCURACY_NUMERATORS[_clamp(evasion_stage + 6, 0, 12)]
+        return self.rng.next(256) < _clamp(threshold, 1, 255)
+
+    def roll_critical(self, base_speed, high_crit_rate):
+        threshold = min(base_speed * 8, 255) if high_crit_rate else base_speed // 2
+        return self.rng.next(256) < _clamp(threshold, 0, 255)
+
+    def calculate_damage(self, attacker, defender, move):
+        """DamageCalculator.Calculate: (damage, is_critical, effectiveness)."""
+        physical = move["type"] in PHYSICAL_TYPES
+        critical = self.roll_critical(attacker.species["BaseSpeed"], move["highCritRate"])
+        if critical:
+            attack = attacker.unmodified_attack if physical else attacker.unmodified_special
+            defense = defender.unmodified_defense if physical else defender.unmodified_special
+        else:
+            attack = attacker.effective_attack if physical else attacker.effective_special
+            defense = defender.effective_defense if physical else defender.effective_special
+
+        if attack > 255 or defense > 255:
+            attack = max(1, attack // 4)
+            defense = max(1, defense // 4)
+        if not critical:
+            if physical and defender.has_reflect:
+                defense *= 2
+            if not physical and defender.has_light_screen:
+                defense *= 2
+        if move["effect"] == "Explosion":
+            defense = max(1, defense // 2)
+        defense = max(1, defense)
+
+        damage = (2 * attacker.level * (2 if critical else 1)) // 5 + 2
+        damage = _div(damage * move["power"] * attack, defense)
+        damage = _div(damage, 50) + 2
+        if attacker.type1 == move["type"] or attacker.type2 == move["type"]:
+            damage = _div(damage * 3, 2)
+
+        eff1 = self.effectiveness(move["type"], defender.type1)
+        eff2 = self.effectiveness(move["type"], defender.type2) if defender.type2 else 1.0
+        total = eff1 * eff2
+        damage = int(damage * eff1)
+        if defender.type2:
+            damage = int(damage * eff2)
+
+        if damage > 1:
+            damage = damage * self.rng.next(217, 256) // 255
+        if total > 0 and damage == 0:
+            damage = 1
+        if total == 0:
+            damage = 0
+        return damage, critical, total
+
+    def apply_damage(self, target, side, damage, critical, effectiveness, events):
+        if target.has_substitute and damage > 0:
+            target.substitute_hp -= damage
+            if target.substitute_hp <= 0:
+                target.has_substitute = False
+                target.substitute_hp = 0
+                events.append(("SubstituteBroke", side))
+            events.append(("DamageDealt", side, damage, critical, effectiveness))
+            return
+
+        old_hp = target.pokemon.current_hp
+        target.pokemon.current_hp = max(0, old_hp - damage)
+        events.append(("DamageDealt", side, damage, critical, effectiveness))
+        events.append(("HpChanged", side, old_hp, target.pokemon.current_hp, target.max_hp))
+        if effectiveness > 1:
+            events.append(("Text", "It's super effective!"))
+        elif 0 < effectiveness < 1:
+            events.append(("Text", "It's not very effective..."))
+        if critical:
+            events.append(("Text", "A critical hit!"))
+        if target.pokemon.is_fainted:
+            events.append(("Fainted", side, self.name(target, side)))
+        if target.is_biding:
+            target.bide_damage += damage
+
+    def apply_stat_change(self, target, side, stat, stages, events):
+        actual = target.modify_stage(stat, stages)
+        name = self.name(target, side)
+        if actual == 0:
+            direction = "higher" if stages > 0 else "lower"
+            events.append(("Text", f"{name}'s {stat} won't go any {direction}!"))
+            return
+        change = {1: ("rose!", "fell!"), 2: ("rose sharply!", "fell harshly!")}.get(
+            abs(actual), ("rose drastically!", "fell severely!"))[0 if stages > 0 else 1]
+        events.append(("StatChanged", side, stat, actual))
+        events.append(("Text", f"{name}'s {stat} {change}"))
+
+    def can_act(self, pokemon, side, events):
+        status = pokemon.pokemon.status
+        name = self.name(pokemon, side)
+        if status == "Sleep":
+            pokemon.sleep_turns -= 1
+            if pokemon.sleep_turns <= 0:
+                pokemon.pokemon.status = "None"
+                events.append(("Text", f"{name} woke up!"))
+                return True
+            events.append(("StatusPreventedMove", side, "Sleep"))
+            events.append(("Text", f"{name} is fast asleep!"))
+            return False
+        if status == "Freeze":
+            events.append(("StatusPreventedMove", side, "Freeze"))
+            events.append(("Text", f"{name} is frozen solid!"))
+            return False
+        if status == "Paralysis" and self.rng.next(4) == 0:
+            events.append(("StatusPreventedMove", side, "Paralysis"))
+            events.append(("Text", f"{name} is fully paralyzed!"))
+            return False
+        return True
+
+    # ---- end of turn ----
+
+    def process_end_of_turn(self, events):
+        state = self.state
+        self.end_of_turn_for_side(state.player_active, PLAYER, state.opponent_active, events)
+        if not state.player_active.pokemon.is_fainted:
+            self.end_of_turn_for_side(state.opponent_active, OPPONENT, state.player_active, events)
+
+    def end_of_turn_for_side(self, pokemon, side, opponent, events):
+        if pokemon.pokemon.is_fainted:
+            return
+        name = self.name(pokemon, side)
+        status = pokemon.pokemon.status
+        if status in ("Burn", "Poison", "BadlyPoisoned"):
+            if status == "BadlyPoisoned":
+                damage = max(1, pokemon.max_hp * pokemon.toxic_counter // 16)
+                pokemon.toxic_counter += 1
+            else:
+                damage = max(1, pokemon.max_hp // 16)
+            old_hp = pokemon.pokemon.current_hp
+            pokemon.pokemon.current_hp = max(0, old_hp - damage)
+            events.append(("StatusDamage", side, status, damage))
+            events.append(("HpChanged", side, old_hp, pokemon.pokemon.current_hp, pokemon.max_hp))
+            if pokemon.pokemon.is_fainted:
+                events.append(("Fainted", side, name))
+                return
+
+        if pokemon.is_seeded and not opponent.pokemon.is_fainted:
+            damage = max(1, pokemon.max_hp // 16)
+            old_hp = pokemon.pokemon.current_hp
+            pokemon.pokemon.current_hp = max(0, old_hp - damage)
+            events.append(("Text", f"Leech Seed saps {name}!"))
+            events.append(("HpChanged", side, old_hp, pokemon.pokemon.current_hp, pokemon.max_hp))
+            opp_old = opponent.pokemon.current_hp
+            opponent.pokemon.current_hp = min(opponent.max_hp, opp_old + damage)
+            events.append(("HpChanged", other_side(side), opp_old, opponent.pokemon.current_hp, opponent.max_hp))
+            if pokemon.pokemon.is_fainted:
+                events.append(("Fainted", side, name))
+                return
+
+        if pokemon.is_trapped:
+            pokemon.trap_turns -= 1
+            if pokemon.trap_turns <= 0:
+                pokemon.is_trapped = False
+                events.append(("Text", f"{name} was freed!"))
+
+        if pokemon.disabled_turns > 0:
+            pokemon.disabled_turns -= 1
+            if pokemon.disabled_turns <= 0:
+                pokemon.disabled_move_id = 0
+                events.append(("Text", f"{name}'s move is no longer disabled!"))
+
+    def check_battle_end(self, events):
+        state = self.state
+        if state.is_over:
+            return True
+        if state.player_active.pokemon.is_fainted and not state.player_has_alive_pokemon():
+            state.is_over = True
+            state.outcome = "PlayerLose"
+            events.append(("Text", "You have no more Pokemon that can fight!"))
+            events.append(("BattleEnded", "PlayerLose"))
+            return True
+
+        if state.opponent_active.pokemon.is_fainted:
+            exp = self.exp_gain()
+            if exp > 0:
+                events.append(("ExperienceGained", self.name(state.player_active, PLAYER), exp))
+            if not state.opponent_has_alive_pokemon():
+                state.is_over = True
+                state.outcome = "PlayerWin"
+                events.append(("Text", "You won the battle!"))
+                events.append(("BattleEnded", "PlayerWin"))
+                return True
+            index = state.next_alive_opponent()
+            if index is not None:
+                self.send_out(OPPONENT, index)
+                events.append(("Switch", OPPONENT, state.opponent_active.species["Name"]))
+        return False
+
+    def exp_gain(self):
+        defeated = self.state.opponent_active
+        bonus = 1.5 if self.state.type == "Trainer" else 1.0
+        return int(defeated.species["BaseExpYield"] * defeated.level * bonus / 7)
+
+    def confusion_damage(self, pokemon):
+        damage = _div((2 * pokemon.level // 5 + 2) * 40 * pokemon.effective_attack, pokemon.effective_defense)
+        return max(1, damage // 50 + 2)
+
+    def roll_multi_hit_count(self):
+        roll = self.rng.next(8)
+        return 2 if roll <= 2 else 3 if roll <= 5 else 4 if roll == 6 else 5
+
+    @staticmethod
+    def name(pokemon, side):
+        name = pokemon.pokemon.nickname or pokemon.species["Name"]
+        return f"Enemy {name}" if side == OPPONENT else name
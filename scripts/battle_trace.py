@@ -0,0 +1,479 @@
+#!/usr/bin/env python3
+"""Columnar, append-only binary trace format for simulated battles.
+
+Events are stored one row each in typed columns modelled on the BattleEvent
+records, in blocks of about CHUNK_ROWS rows with every column compressed on its
+own:
+
+  battle  uint32  battle number within the run
+  turn    uint16  turn number (1-based)
+  code    uint8   index into EVENT_TYPES (BattleEvent.cs order)
+  side    uint8   0 Player, 1 Opponent, 255 when the event has none
+  move    uint16  move id (MoveUsed, MoveMissed, Charging)
+  amount  int32   damage for DamageDealt, StatusDamage, Recoil, ConfusionHitSelf;
+                  HP restored for Drain; stages for StatChanged; hits for
+                  MultiHit; experience; HP change for HpChanged; species id for
+                  Switch
+  crit    uint8   1 for critical hits
+  hp      uint16  new HP for HpChanged
+  detail  uint8   effectiveness * 4 for DamageDealt, StatusCondition for the
+                  status events, STAT_NAMES index for StatChanged, BattleOutcome
+                  for BattleEnded
+
+A second, much smaller table has one row per battle: battle, seed, trainer,
+outcome and turns. Text events carry nothing the columns can hold and are
+dropped unless the writer is told to keep their codes.
+
+File layout: an 8-byte magic, a uint32 length and a JSON header describing the
+columns and code tables, then blocks of "<4sII" (kind, rows, columns) followed
+by one uint32 compressed length per column and the compressed column bytes.
+Blocks are only ever appended, so a run can be resumed by reopening the file
+with append=True; a block cut short by a crash is ignored on read. Finished
+battles' rows are written ahead of every event block, so after a crash only
+the battle in progress is left with events but no row, and readers skip such
+events. The reader
+memory-maps the file, indexes the block headers and decompresses only the
+columns asked for, one block at a time, so aggregating over a trace never holds
+more than one block in memory.
+
+Usage:
+    python scripts/battle_trace.py convert tests/fixtures/battle_logs.jsonl run.trace
+    python scripts/battle_trace.py summary run.trace [--json]
+    python scripts/battle_trace.py check [tests/fixtures/battle_logs.jsonl]
+"""
+import argparse, json, mmap, os, struct, tempfile, zlib
+
+import numpy as np
+
+from gamedata import DATA_DIR, ROOT_DIR, GameData
+
+MAGIC = b"PKTRACE1"
+# Version 2 widened battles.trainer to uint32 (synth_world ids pass 65535)
+VERSION = 2
+CHUNK_ROWS = 1 << 16
+COMPRESS_LEVEL = 6
+NONE = 255
+NO_TRAINER = -1
+FIXTURE_LOGS = os.path.join(ROOT_DIR, "tests", "fixtures", "battle_logs.jsonl")
+
+EVENT_TYPES = (
+    "MoveUsed", "DamageDealt", "MoveFailed", "MoveMissed", "StatusApplied", "StatusDamage",
+    "StatChanged", "Fainted", "HpChanged", "Switch", "Text", "BattleEnded", "ExperienceGained",
+    "Recoil", "Drain", "Ohko", "MultiHit", "Charging", "Recharge", "ConfusionHitSelf",
+    "StatusPreventedMove", "SubstituteCreated", "SubstituteBroke",
+)
+EVENT_CODES = {name: i for i, name in enumerate(EVENT_TYPES)}
+SIDES = ("Player", "Opponent")
+STATUSES = ("None", "Burn", "Freeze", "Paralysis", "Poison", "BadlyPoisoned", "Sleep")
+STAT_NAMES = ("attack", "defense", "special", "speed", "accuracy", "evasion")
+OUTCOMES = ("PlayerWin", "PlayerLose", "PlayerFled")
+
+EVENT_COLUMNS = (
+    ("battle", "<u4"), ("turn", "<u2"), ("code", "u1"), ("side", "u1"), ("move", "<u2"),
+    ("amount", "<i4"), ("crit", "u1"), ("hp", "<u2"), ("detail", "u1"),
+)
+BATTLE_COLUMNS = (
+    ("battle", "<u4"), ("seed", "<i4"), ("trainer", "<u4"), ("outcome", "u1"), ("turns", "<u2"),
+)
+EVENT_FIELDS = tuple(name for name, _ in EVENT_COLUMNS)
+KINDS = {b"EVNT": EVENT_COLUMNS, b"BATL": BATTLE_COLUMNS}
+
+BLOCK_HEADER = struct.Struct("<4sII")
+LENGTH = struct.Struct("<I")
+
+
+class TraceFormatError(Exception):
+    pass
+
+
+def _header():
+    return json.dumps({
+        "version": VERSION,
+        "events": [list(c) for c in EVENT_COLUMNS],
+        "battles": [list(c) for c in BATTLE_COLUMNS],
+        "eventTypes": EVENT_TYPES, "sides": SIDES, "statuses": STATUSES,
+        "stats": STAT_NAMES, "outcomes": OUTCOMES,
+    }).encode()
+
+
+class TraceWriter:
+    """Streams battles into a trace file, flushing a block every CHUNK_ROWS events.
+
+        with TraceWriter("run.trace", data) as trace:
+            battle = trace.begin_battle(seed, trainer_id)
+            trace.add_turn(turn_number, engine.execute_turn(...))
+            trace.end_battle(state.outcome)
+    """
+
+    def __init__(self, path, data, append=False, keep_text=False, chunk_rows=CHUNK_ROWS):
+        self.move_ids = {m["name"]: m["id"] for m in data.moves.values()}
+        self.species_ids = {s["Name"]: s["DexNumber"] for s in data.species.values()}
+        self.keep_text = keep_text
+        self.chunk_rows = chunk_rows
+        self.next_battle = 0
+        if append and os.path.exists(path) and os.path.getsize(path) > 0:
+            reader = TraceReader(path)
+            # Events of a battle can reach the file before its battles row does
+            last = max((int(c["battle"].max()) for table in ("events", "battles")
+                        for c in reader.chunks(table, ("battle",)) if len(c["battle"])), default=-1)
+            self.next_battle = last + 1
+            valid_end = reader.end
+            reader.close()
+            self.file = open(path, "r+b")
+            self.file.truncate(valid_end)
+            self.file.seek(valid_end)
+        else:
+            self.file = open(path, "wb")
+            header = _header()
+            self.file.write(MAGIC + LENGTH.pack(len(header)) + header)
+        self.events = {name: [] for name, _ in EVENT_COLUMNS}
+        self.battles = {name: [] for name, _ in BATTLE_COLUMNS}
+        self._battle = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def begin_battle(self, seed, trainer_id):
+        if not 0 <= trainer_id <= 0xFFFFFFFF:
+            raise ValueError(f"trainer id {trainer_id} does not fit the uint32 trainer column")
+        self._battle = {"battle": self.next_battle, "seed": seed, "trainer": trainer_id, "turns": 0}
+        self.next_battle += 1
+        return self._battle["battle"]
+
+    def add_turn(self, turn, events):
+        battle = self._battle["battle"]
+        self._battle["turns"] = max(self._battle["turns"], turn)
+        for event in events:
+            row = self.encode(event)
+            if row is None:
+                continue
+            for name, value in zip(EVENT_FIELDS, (battle, turn) + row):
+                self.events[name].append(value)
+        if len(self.events["code"]) >= self.chunk_rows:
+            self.flush()
+
+    def end_battle(self, outcome):
+        battle = self._battle
+        battle["outcome"] = OUTCOMES.index(outcome) if outcome else NONE
+        for name, _ in BATTLE_COLUMNS:
+            self.battles[name].append(battle[name])
+        self._battle = None
+        if len(self.battles["battle"]) >= self.chunk_rows:
+            self._flush(b"BATL", self.battles, BATTLE_COLUMNS)
+
+    def encode(self, event):
+        """(code, side, move, amount, crit, hp, detail) for one engine event tuple."""
+        name, *fields = event
+        code = EVENT_CODES[name]
+        side, move, amount, crit, hp, detail = NONE, 0, 0, 0, 0, 0
+        if fields and fields[0] in SIDES:
+            side = SIDES.index(fields[0])
+        if name in ("MoveUsed", "MoveMissed", "Charging"):
+            move = self.move_ids.get(fields[1], 0)
+        elif name == "DamageDealt":
+            amount, crit, detail = fields[1], int(fields[2]), int(fields[3] * 4)
+        elif name in ("StatusApplied", "StatusPreventedMove"):
+            detail = STATUSES.index(fields[1])
+        elif name == "StatusDamage":
+            detail, amount = STATUSES.index(fields[1]), fields[2]
+        elif name == "StatChanged":
+            detail, amount = STAT_NAMES.index(fields[1]), fields[2]
+        elif name == "HpChanged":
+            amount, hp = fields[2] - fields[1], fields[2]
+        elif name == "Switch":
+            amount = self.species_ids.get(fields[1], 0)
+        elif name == "BattleEnded":
+            detail = OUTCOMES.index(fields[0])
+        elif name == "ExperienceGained":
+            side, amount = 0, fields[1]
+        elif name in ("Recoil", "Drain", "ConfusionHitSelf"):
+            amount = fields[1]
+        elif name == "MultiHit":
+            amount = fields[0]
+        elif name == "Text" and not self.keep_text:
+            return None
+        return code, side, move, amount, crit, hp, detail
+
+    def _flush(self, kind, buffers, columns):
+        rows = len(buffers[columns[0][0]])
+        if not rows:
+            return
+        blobs = [zlib.compress(np.asarray(buffers[name], dtype=dtype).tobytes(), COMPRESS_LEVEL)
+                 for name, dtype in columns]
+        self.file.write(BLOCK_HEADER.pack(kind, rows, len(columns)))
+        self.file.write(b"".join(LENGTH.pack(len(b)) for b in blobs))
+        for blob in blobs:
+            self.file.write(blob)
+        for values in buffers.values():
+            values.clear()
+
+    def flush(self):
+        # Rows first: every battle an event block completes is on disk before it
+        self._flush(b"BATL", self.battles, BATTLE_COLUMNS)
+        self._flush(b"EVNT", self.events, EVENT_COLUMNS)
+        self.file.flush()
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+
+class TraceReader:
+    """Memory-mapped reader; iterate blocks with chunks() and aggregate as you go."""
+
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.map[:len(MAGIC)] != MAGIC:
+            raise TraceFormatError(f"{path}: not a battle trace")
+        (length,) = LENGTH.unpack_from(self.map, len(MAGIC))
+        start = len(MAGIC) + LENGTH.size
+        self.header = json.loads(self.map[start:start + length])
+        if self.header.get("version") != VERSION:
+            self.close()
+            raise TraceFormatError(f"{path}: trace format version {self.header.get('version')}, "
+                                   f"expected {VERSION}; convert the logs again")
+        self.blocks = {kind: [] for kind in KINDS}
+        self.end = self._index(start + length)
+
+    def _index(self, pos):
+        """Record (rows, [(offset, length)]) for each complete block; returns the end offset."""
+        size = len(self.map)
+        while pos + BLOCK_HEADER.size <= size:
+            kind, rows, ncols = BLOCK_HEADER.unpack_from(self.map, pos)
+            if kind not in KINDS or ncols != len(KINDS[kind]):
+                raise TraceFormatError(f"bad block header at offset {pos}")
+            offset = pos + BLOCK_HEADER.size + ncols * LENGTH.size
+            if offset > size:
+                break
+            columns = []
+            for i in range(ncols):
+                (n,) = LENGTH.unpack_from(self.map, pos + BLOCK_HEADER.size + i * LENGTH.size)
+                columns.append((offset, n))
+                offset += n
+            if offset > size:
+                break
+            self.blocks[kind].append((rows, columns))
+            pos = offset
+        return pos
+
+    def close(self):
+        self.map.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def rows(self, table="events"):
+        return sum(rows for rows, _ in self.blocks[_kind(table)])
+
+    def chunks(self, table="events", columns=None):
+        """Yield {column: array} for each block, decompressing only the named columns."""
+        schema = KINDS[_kind(table)]
+        names = [name for name, _ in schema] if columns is None else list(columns)
+        index = {name: (i, dtype) for i, (name, dtype) in enumerate(schema)}
+        for rows, spans in self.blocks[_kind(table)]:
+            chunk = {}
+            for name in names:
+                i, dtype = index[name]
+                offset, length = spans[i]
+                chunk[name] = np.frombuffer(zlib.decompress(self.map[offset:offset + length]), dtype=dtype)
+            yield chunk
+
+    def column(self, table, name):
+        """One whole column; meant for the small battles table."""
+        parts = [c[name] for c in self.chunks(table, (name,))]
+        dtype = dict(KINDS[_kind(table)])[name]
+        return np.concatenate(parts) if parts else np.zeros(0, dtype=dtype)
+
+    def trainer_lookup(self):
+        """Array mapping battle id to trainer id, NO_TRAINER for ids without a battles row."""
+        battle_ids = self.column("battles", "battle")
+        lookup = np.full(int(battle_ids.max()) + 1 if len(battle_ids) else 0, NO_TRAINER, dtype=np.int64)
+        lookup[battle_ids] = self.column("battles", "trainer")
+        return lookup
+
+
+def _kind(table):
+    return b"EVNT" if table == "events" else b"BATL"
+
+
+def trainer_summary(reader):
+    """Per-trainer totals over a whole trace, streaming the events table."""
+    trainers = reader.column("battles", "trainer")
+    outcomes = reader.column("battles", "outcome")
+    turns = reader.column("battles", "turns")
+    trainer_of = reader.trainer_lookup()
+    size = int(trainers.max()) + 1 if len(trainers) else 0
+
+    def per_trainer(values, weights=None):
+        return np.bincount(values, weights=weights, minlength=size)
+
+    damage = np.zeros((2, size))   # damage taken by each side
+    hits = np.zeros((2, size))
+    crits = np.zeros((2, size))
+    misses = np.zeros((2, size))
+    damage_code, missed_code = EVENT_CODES["DamageDealt"], EVENT_CODES["MoveMissed"]
+    for chunk in reader.chunks("events", ("battle", "code", "side", "amount", "crit")):
+        # Events of a battle cut off by a crash have no battles row; skip them
+        battle = chunk["battle"].astype(np.int64)
+        trainer = np.full(len(battle), NO_TRAINER)
+        known = battle < len(trainer_of)
+        trainer[known] = trainer_of[battle[known]]
+        recorded = trainer != NO_TRAINER
+        for side in (0, 1):
+            dealt = recorded & (chunk["code"] == damage_code) & (chunk["side"] == side)
+            damage[side] += per_trainer(trainer[dealt], chunk["amount"][dealt])
+            hits[side] += per_trainer(trainer[dealt])
+            crits[side] += per_trainer(trainer[dealt], chunk["crit"][dealt])
+            missed = recorded & (chunk["code"] == missed_code) & (chunk["side"] == side)
+            misses[side] += per_trainer(trainer[missed])
+
+    battles = per_trainer(trainers)
+    wins = per_trainer(trainers, outcomes == OUTCOMES.index("PlayerWin"))
+    total_turns = per_trainer(trainers, turns)
+    summary = []
+    for t in np.nonzero(battles)[0]:
+        n = battles[t]
+        summary.append({
+            "trainerId": int(t), "battles": int(n),
+            "playerWinRate": round(wins[t] / n, 4),
+            "meanTurns": round(total_turns[t] / n, 2),
+            # side 1 is hit by the player, side 0 by the trainer
+            "playerDamagePerBattle": round(damage[1][t] / n, 2),
+            "trainerDamagePerBattle": round(damage[0][t] / n, 2),
+            "playerCritRate": round(crits[1][t] / hits[1][t], 4) if hits[1][t] else 0.0,
+            "trainerCritRate": round(crits[0][t] / hits[0][t], 4) if hits[0][t] else 0.0,
+            "playerMisses": int(misses[0][t]), "trainerMisses": int(misses[1][t]),
+        })
+    return summary
+
+
+def read_logs(logs_path):
+    with open(logs_path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def write_battle(trace, log):
+    trace.begin_battle(log["seed"], log["trainerId"])
+    for number, turn in enumerate(log["turns"], 1):
+        trace.add_turn(number, turn["events"])
+    trace.end_battle(log.get("outcome"))
+
+
+def convert_logs(logs_path, trace_path, data, keep_text=False):
+    """Write BattleRecorder JSONL logs (see parity_harness.py) as a trace."""
+    with TraceWriter(trace_path, data, keep_text=keep_text) as trace, open(logs_path) as f:
+        for line in f:
+            if line.strip():
+                write_battle(trace, json.loads(line))
+
+
+def self_check(logs, data, chunk_rows=64):
+    """Failure messages from round-tripping logs, including a writer killed mid-run and resumed."""
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp:
+        def summarize(path):
+            with TraceReader(path) as reader:
+                return reader.rows("battles"), trainer_summary(reader)
+
+        clean = os.path.join(tmp, "clean.trace")
+        with TraceWriter(clean, data, chunk_rows=chunk_rows) as trace:
+            for log in logs:
+                write_battle(trace, log)
+        battles, summary = summarize(clean)
+        if battles != len(logs):
+            failures.append(f"round trip: {battles} battles for {len(logs)} logs")
+        if sum(s["battles"] for s in summary) != len(logs):
+            failures.append("round trip: summary does not count every battle")
+
+        # Kill the writer halfway through a battle: its event blocks are on
+        # disk, unlike the battles row it would have written at the end
+        crash = len(logs) // 2
+        killed = os.path.join(tmp, "killed.trace")
+        trace = TraceWriter(killed, data, chunk_rows=chunk_rows)
+        for log in logs[:crash]:
+            write_battle(trace, log)
+        trace.begin_battle(logs[crash]["seed"], logs[crash]["trainerId"])
+        for number, turn in enumerate(logs[crash]["turns"], 1):
+            trace.add_turn(number, turn["events"])
+        trace.file.flush()
+        written = trace.file.tell()
+        trace.file.close()
+        with TraceReader(killed) as reader:
+            survived = reader.rows("battles")
+            on_disk = set(np.concatenate([c["battle"] for c in reader.chunks("events", ("battle",))]).tolist())
+            missing = on_disk - set(reader.column("battles", "battle").tolist()) - {crash}
+        if missing:
+            failures.append(f"killed writer: events of finished battles {sorted(missing)[:5]} have no battles row")
+        try:
+            summarize(killed)
+        except Exception as e:
+            failures.append(f"killed writer: summary failed: {e!r}")
+
+        with TraceWriter(killed, data, append=True, chunk_rows=chunk_rows) as trace:
+            for log in logs[crash + 1:]:
+                write_battle(trace, log)
+        expected_path = os.path.join(tmp, "expected.trace")
+        with TraceWriter(expected_path, data, chunk_rows=chunk_rows) as trace:
+            for log in logs[:survived] + logs[crash + 1:]:
+                write_battle(trace, log)
+        if summarize(killed) != summarize(expected_path):
+            failures.append(f"killed at byte {written} and resumed: summary differs from a clean run "
+                            f"of the {survived} recorded battles plus the resumed ones")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    commands = parser.add_subparsers(dest="command", required=True)
+    convert = commands.add_parser("convert", help="write JSONL battle logs as a trace")
+    convert.add_argument("logs")
+    convert.add_argument("trace")
+    convert.add_argument("--keep-text", action="store_true", help="keep a row for each Text event")
+    summary = commands.add_parser("summary", help="per-trainer statistics of a trace")
+    summary.add_argument("trace")
+    summary.add_argument("--json", action="store_true", help="print the summary as JSON")
+    check = commands.add_parser("check", help="round-trip logs, including a crash and resume")
+    check.add_argument("logs", nargs="?", default=FIXTURE_LOGS)
+    args = parser.parse_args()
+
+    if args.command == "check":
+        logs = read_logs(args.logs)
+        failures = self_check(logs, GameData.load_from_directory(args.data_dir))
+        for failure in failures:
+            print(f"FAIL {failure}")
+        print(f"{len(logs)} battles: {len(failures)} failures")
+        if failures:
+            raise SystemExit(1)
+        return
+
+    if args.command == "convert":
+        convert_logs(args.logs, args.trace, GameData.load_from_directory(args.data_dir), args.keep_text)
+        with TraceReader(args.trace) as reader:
+            print(f"{reader.rows('battles')} battles, {reader.rows()} events, "
+                  f"{os.path.getsize(args.trace)} bytes (logs: {os.path.getsize(args.logs)} bytes)")
+        return
+
+    with TraceReader(args.trace) as reader:
+        summary = trainer_summary(reader)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+    print(f"{'trainer':>7} {'battles':>7} {'win%':>6} {'turns':>6} {'dmg/b':>8} {'taken/b':>8} {'crit%':>6}")
+    for s in summary:
+        print(f"{s['trainerId']:>7} {s['battles']:>7} {100 * s['playerWinRate']:>6.1f} "
+              f"{s['meanTurns']:>6.1f} {s['playerDamagePerBattle']:>8.1f} "
+              f"{s['trainerDamagePerBattle']:>8.1f} {100 * s['playerCritRate']:>6.1f}")
+
+
+if __name__ == "__main__":
+    main()
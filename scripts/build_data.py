@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""Rebuild everything derived from data/ and the scripts, skipping up-to-date steps.
+
+Each step declares the script it runs, the files it reads and the files it
+writes. A step depends on every step that writes one of its inputs, and runs
+only when the content hash of its inputs (and its command) differs from the
+last successful run recorded in .cache/build/state.json, or when one of its
+outputs is missing or was changed by hand. Because inputs are hashed when a
+step is about to run, a step whose upstream rebuilt to identical bytes (say,
+trainers.json after a comment-only edit) is still skipped.
+
+Steps are separate processes; up to --jobs of them run at once as soon as their
+dependencies finish. The report at the end gives each step's time and the
+critical path, the chain of dependent steps that bounds the wall time.
+
+Steps:
+  trainers      generate_trainers.py -> data/world/trainers.json
+  validate      schema_check.py over every data file against the C# models
+  stat_tables   stat_tables.py -> data/tables/
+  move_tables   move_tables.py -> data/tables/move_value.*
+  columns       export_columns.py -> data/columns/ (per-table, only changed sources)
+  sight         trainer_sight.py -> data/tables/sight.json
+  alias         alias_tables.py -> data/tables/encounter_alias.json
+  parity        parity_harness.py over tests/fixtures/battle_logs.jsonl
+  balance       balance_sim.py -> .cache/build/balance.json (not built by default)
+
+Usage:
+    python scripts/build_data.py                 # default steps
+    python scripts/build_data.py balance --jobs 2
+    python scripts/build_data.py --force --dry-run
+"""
+import argparse, glob, hashlib, json, os, subprocess, sys, time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from gamedata import DATA_FILES, ROOT_DIR
+
+STATE_DIR = os.path.join(ROOT_DIR, ".cache", "build")
+STATE_PATH = os.path.join(STATE_DIR, "state.json")
+
+CS_SOURCES = "src/PokemonGen1.Core/**/*.cs"
+ENGINE = ("scripts/battle_engine.py", "scripts/dotnet_random.py", "scripts/battle_calc.py",
+          "scripts/gamedata.py")
+
+
+def data_file(name):
+    return "/".join(("data",) + DATA_FILES[name])
+
+
+class Step:
+    def __init__(self, name, command, inputs, outputs=(), stdout=None, default=True):
+        self.name = name
+        self.command = command          # script and arguments, run with this Python
+        self.inputs = inputs            # paths or globs relative to ROOT_DIR
+        self.outputs = outputs
+        self.stdout = stdout            # file the step's output is written to, if any
+        self.default = default
+
+
+STEPS = (
+    Step("trainers", ["scripts/generate_trainers.py"],
+         inputs=["scripts/generate_trainers.py", "scripts/schema_check.py", "scripts/dialog_table.py",
+                 "scripts/gamedata.py", CS_SOURCES, data_file("areas")],
+         outputs=[data_file("trainers")]),
+    Step("validate", ["scripts/schema_check.py"],
+         inputs=["scripts/schema_check.py", "scripts/gamedata.py", CS_SOURCES]
+         + [data_file(name) for name in DATA_FILES]),
+    Step("stat_tables", ["scripts/stat_tables.py"],
+         inputs=["scripts/stat_tables.py", "scripts/battle_calc.py", "scripts/gamedata.py",
+                 data_file("species")],
+         outputs=["data/tables/stats.u16", "data/tables/experience.i32", "data/tables/tables.json"]),
+    Step("move_tables", ["scripts/move_tables.py"],
+         inputs=["scripts/move_tables.py", "scripts/battle_calc.py", "scripts/gamedata.py",
+                 data_file("moves"), data_file("type_chart")],
+         outputs=["data/tables/move_value.f32", "data/tables/move_value.json"]),
+    Step("columns", ["scripts/export_columns.py"],
+         inputs=["scripts/export_columns.py", "scripts/gamedata.py"]
+         + [data_file(name) for name in ("species", "moves", "learnsets", "encounters", "trainers")],
+         outputs=["data/columns/manifest.json"]),
+    Step("sight", ["scripts/trainer_sight.py"],
+         inputs=["scripts/trainer_sight.py", "scripts/map_generator.py", "scripts/dotnet_random.py",
+                 "scripts/gamedata.py", "scripts/dialog_table.py", data_file("areas"), data_file("trainers")],
+         outputs=["data/tables/sight.json"]),
+    Step("alias", ["scripts/alias_tables.py"],
+         inputs=["scripts/alias_tables.py", "scripts/gamedata.py", data_file("encounters")],
+         outputs=["data/tables/encounter_alias.json"]),
+    Step("parity", ["scripts/parity_harness.py"],
+         inputs=[*ENGINE, "scripts/parity_harness.py", "scripts/generate_trainers.py",
+                 "tests/fixtures/battle_logs.jsonl"]
+         + [data_file(name) for name in ("species", "moves", "type_chart", "learnsets", "trainers")]),
+    Step("balance", ["scripts/balance_sim.py", "--json"],
+         inputs=[*ENGINE, "scripts/balance_sim.py"]
+         + [data_file(name) for name in ("species", "moves", "type_chart", "learnsets", "trainers")],
+         outputs=[".cache/build/balance.json"], stdout=".cache/build/balance.json", default=False),
+)
+
+
+def expand(patterns):
+    """Existing files matched by the patterns, sorted, relative to ROOT_DIR."""
+    found = set()
+    for pattern in patterns:
+        for path in glob.glob(os.path.join(ROOT_DIR, pattern), recursive=True):
+            rel = os.path.relpath(path, ROOT_DIR)
+            if os.path.isfile(path) and not {"bin", "obj"} & set(rel.split(os.sep)):
+                found.add(rel)
+    return sorted(found)
+
+
+def dependencies(steps):
+    """{step name: names of the steps writing one of its inputs}."""
+    writers = {out: s.name for s in steps for out in s.outputs}
+    return {s.name: sorted({writers[path] for path in writers if path in s.inputs} - {s.name})
+            for s in steps}
+
+
+def select(steps, targets):
+    """The named steps (default ones when none are named) and everything they depend on."""
+    by_name = {s.name: s for s in steps}
+    unknown = [t for t in targets if t not in by_name]
+    if unknown:
+        sys.exit(f"unknown steps: {', '.join(unknown)} (have {', '.join(by_name)})")
+    deps = dependencies(steps)
+    wanted, stack = set(), list(targets or [s.name for s in steps if s.default])
+    while stack:
+        name = stack.pop()
+        if name not in wanted:
+            wanted.add(name)
+            stack.extend(deps[name])
+    return [s for s in steps if s.name in wanted]
+
+
+class FileHashes:
+    """Content hashes, reused while a file's size and mtime are unchanged."""
+
+    def __init__(self, known):
+        self.known = known              # path -> [size, mtime_ns, sha256]
+
+    def __call__(self, rel):
+        st = os.stat(os.path.join(ROOT_DIR, rel))
+        entry = self.known.get(rel)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+        digest = hashlib.sha256()
+        with open(os.path.join(ROOT_DIR, rel), "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        self.known[rel] = [st.st_size, st.st_mtime_ns, digest.hexdigest()]
+        return digest.hexdigest()
+
+
+def input_hash(step, file_hash):
+    digest = hashlib.sha256(json.dumps(step.command).encode())
+    for rel in expand(step.inputs):
+        digest.update(f"{rel}\0{file_hash(rel)}\0".encode())
+    return digest.hexdigest()
+
+
+def output_hashes(step, file_hash):
+    return {rel: file_hash(rel) if os.path.exists(os.path.join(ROOT_DIR, rel)) else None
+            for rel in step.outputs}
+
+
+def is_current(step, record, inputs, file_hash):
+    return (record is not None and record["inputs"] == inputs
+            and all(h is not None and record["outputs"].get(rel) == h
+                    for rel, h in output_hashes(step, file_hash).items()))
+
+
+def run_step(step):
+    """Run one step in its own process; returns (returncode, seconds, captured output)."""
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable] + [os.path.join(ROOT_DIR, step.command[0])] + step.command[1:],
+                          cwd=ROOT_DIR, capture_output=True, text=True)
+    if step.stdout and proc.returncode == 0:
+        path = os.path.join(ROOT_DIR, step.stdout)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(proc.stdout)
+    output = proc.stderr if step.stdout else proc.stdout + proc.stderr
+    return proc.returncode, time.perf_counter() - start, output
+
+
+def load_state():
+    try:
+        with open(STATE_PATH) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"files": {}, "steps": {}}
+
+
+def save_state(state):
+    os.makedirs(STATE_DIR, exist_ok=True)
+    tmp = STATE_PATH + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(state, f, indent=1)
+    os.replace(tmp, STATE_PATH)
+
+
+def build(steps, jobs=None, force=False, dry_run=False, verbose=False):
+    """Run the steps in dependency order; returns {name: result dict}."""
+    state = load_state()
+    file_hash = FileHashes(state["files"])
+    deps = {name: [d for d in ds if d in {s.name for s in steps}]
+            for name, ds in dependencies(steps).items()}
+    pending = {s.name: s for s in steps}
+    results, running = {}, {}
+
+    def start_ready(pool):
+        for name, step in list(pending.items()):
+            if any(d not in results for d in deps[name]) or len(running) >= (jobs or os.cpu_count() or 1):
+                continue
+            del pending[name]
+            if any(results[d]["status"] in ("failed", "blocked") for d in deps[name]):
+                results[name] = {"status": "blocked", "seconds": 0.0}
+                continue
+            inputs = input_hash(step, file_hash)
+            if not force and is_current(step, state["steps"].get(name), inputs, file_hash):
+                results[name] = {"status": "up to date", "seconds": 0.0}
+                continue
+            if dry_run:
+                results[name] = {"status": "would run", "seconds": 0.0}
+                continue
+            running[pool.submit(run_step, step)] = (step, inputs)
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs or os.cpu_count() or 1)) as pool:
+        start_ready(pool)
+        while running or pending:
+            if not running:
+                start_ready(pool)
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                step, inputs = running.pop(future)
+                code, seconds, output = future.result()
+                results[step.name] = {"status": "built" if code == 0 else "failed",
+                                      "seconds": seconds}
+                if code == 0:
+                    state["steps"][step.name] = {"inputs": inputs,
+                                                 "outputs": output_hashes(step, file_hash)}
+                    if verbose and output.strip():
+                        print(output.rstrip())
+                else:
+                    state["steps"].pop(step.name, None)
+                    print(f"--- {step.name} failed (exit {code}) ---\n{output.rstrip()}")
+            start_ready(pool)
+    if not dry_run:
+        save_state(state)
+    return results
+
+
+def critical_path(steps, results):
+    """The chain of dependencies with the largest total step time."""
+    deps = dependencies(steps)
+    names = [s.name for s in steps if s.name in results]
+    best = {}
+    for name in names:      # STEPS is declared in dependency order
+        prev = max((best[d] for d in deps[name] if d in best), key=lambda p: p[0], default=(0.0, []))
+        best[name] = (prev[0] + results[name]["seconds"], prev[1] + [name])
+    return max(best.values(), key=lambda p: p[0], default=(0.0, []))
+
+
+def print_report(steps, results, wall):
+    print(f"{'step':<12} {'status':<11} {'seconds':>8}")
+    for step in steps:
+        r = results[step.name]
+        print(f"{step.name:<12} {r['status']:<11} {r['seconds']:>8.2f}")
+    total, path = critical_path(steps, results)
+    print(f"critical path: {' -> '.join(path) if total else 'nothing ran'} ({total:.2f} s); "
+          f"step time {sum(r['seconds'] for r in results.values()):.2f} s, wall {wall:.2f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("targets", nargs="*", help="steps to build (default: all default steps)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count())
+    parser.add_argument("--force", action="store_true", help="rebuild even if up to date")
+    parser.add_argument("--dry-run", action="store_true", help="only show what would run")
+    parser.add_argument("--verbose", "-v", action="store_true", help="print each step's output")
+    parser.add_argument("--list", action="store_true", help="list the steps and their dependencies")
+    args = parser.parse_args()
+
+    if args.list:
+        deps = dependencies(STEPS)
+        for step in STEPS:
+            after = f" (after {', '.join(deps[step.name])})" if deps[step.name] else ""
+            print(f"{step.name:<12} {len(expand(step.inputs)):>3} inputs{after}"
+                  f"{'' if step.default else ' [not default]'}")
+        return
+
+    steps = select(STEPS, args.targets)
+    began = time.perf_counter()
+    results = build(steps, args.jobs, args.force, args.dry_run, args.verbose)
+    print_report(steps, results, time.perf_counter() - began)
+    if any(r["status"] in ("failed", "blocked") for r in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""Search for the best counter team against each gym leader and Elite Four member.
+
+For every gate battle (trainer ids 1-13) the player pool is every species
+obtainable before that battle (see progression.py), all at the level cap, which
+defaults to the opponent's highest party level. The solver:
+
+  1. builds the damage table for the whole pool against the opponent's party
+     with NumPy, every pool member x opponent x move at once: expected damage
+     per turn of each side's best move, both ways (--verify checks it against
+     battle_calc.expected_damage);
+  2. turns it into a KO table (turns needed to knock out the other side) and a
+     matchup value: the HP fraction a pool member keeps after winning that 1v1,
+     or 0 when it loses;
+  3. drops pool members that at least TEAM_SIZE other members match or beat on
+     every opponent Pokemon (a team can always swap such a member for one of
+     them), which leaves at least TEAM_SIZE candidates whenever the pool has
+     that many members with a win;
+  4. runs a branch-and-bound search maximising, per opponent Pokemon, the team's
+     matchup values weighted by DEPTH_WEIGHTS from best to worst, so the best
+     answer counts fully and each backup half as much as the one before; this
+     is done for the full team of six and for the smallest team that has a
+     winning answer to every opponent Pokemon.
+
+Stages are solved in parallel, one per worker process.
+
+Usage:
+    python scripts/counter_team.py                     # all gate battles
+    python scripts/counter_team.py --trainer 6         # Sabrina only
+    python scripts/counter_team.py --level-cap 40 --json
+    python scripts/counter_team.py --verify            # check the batched tables
+"""
+import argparse, json, math, os
+from multiprocessing import Pool
+
+import numpy as np
+
+from battle_calc import (MULTI_HIT_EXPECTED, RANDOM_MAX, RANDOM_MIN, accuracy_threshold, battle_stats,
+                         crit_threshold, expected_damage)
+from gamedata import DATA_DIR, PHYSICAL_TYPES, TYPE_INDEX, GameData
+from move_tables import effectiveness_matrix
+from progression import battle_stages, obtainable_species
+
+TEAM_SIZE = 6
+# Weight of each opponent Pokemon's best, second-best, ... answer on the team
+DEPTH_WEIGHTS = tuple(0.5 ** k for k in range(TEAM_SIZE))
+MOVE_SLOTS = 4
+
+
+def combatant(data, species_id, level, moves=None):
+    species = data.species[species_id]
+    return {
+        "species": species,
+        "level": level,
+        "stats": battle_stats(species, level),
+        "moves": moves or data.default_moves(species_id, level),
+    }
+
+
+def opponent_party(data, trainer):
+    return [combatant(data, p["speciesId"], p["level"], p.get("moveOverrides"))
+            for p in trainer["party"]]
+
+
+def damage_table(data, attackers, defenders):
+    """Expected damage per turn, float [attacker, move slot, defender], as expected_damage.
+
+    Empty move slots are 0.
+    """
+    moves = [m for a in attackers for m in a["moves"]]
+    move_ids = np.full((len(attackers), MOVE_SLOTS), -1)
+    for i, a in enumerate(attackers):
+        move_ids[i, :len(a["moves"])] = a["moves"][:MOVE_SLOTS]
+    known = move_ids >= 0
+    records = {m: data.moves[m] for m in set(moves)}
+
+    def move_column(field, default=0):
+        table = {m: r[field] for m, r in records.items()}
+        return np.array([[table[m] if m >= 0 else default for m in row] for row in move_ids.tolist()])
+
+    effect = move_column("effect", "")
+    move_type = np.vectorize(lambda t: TYPE_INDEX.get(t, 0))(move_column("type", "Normal"))
+    power = np.maximum(move_column("power").astype(np.int64), 0)
+    physical = np.isin(move_column("type", "Normal"), list(PHYSICAL_TYPES))
+    hit = np.vectorize(lambda a: accuracy_threshold(a) / 256.0)(move_column("accuracy"))
+    hit = np.where(effect == "Swift", 1.0, hit)
+    high_crit = move_column("highCritRate", False).astype(bool)
+
+    def stat(side, name):
+        return np.array([c["stats"][name] for c in side], dtype=np.int64)
+
+    level = np.array([a["level"] for a in attackers], dtype=np.int64)[:, None, None]
+    base_speed = np.array([a["species"]["BaseSpeed"] for a in attackers])[:, None]
+    p_crit = (np.vectorize(crit_threshold)(base_speed, high_crit) / 256.0)[:, :, None]
+    a_types = [(a["species"]["Type1"], a["species"].get("Type2")) for a in attackers]
+    stab = np.array([[t in types for t in row] for types, row in
+                     zip(a_types, move_column("type", "").tolist())])[:, :, None]
+
+    d_type1 = np.array([TYPE_INDEX[d["species"]["Type1"]] for d in defenders])
+    d_type2 = np.array([TYPE_INDEX.get(d["species"].get("Type2") or "", -1) for d in defenders])
+    chart = effectiveness_matrix(data)
+    eff1 = chart[move_type[:, :, None], d_type1[None, None, :]]
+    eff2 = np.where(d_type2 >= 0, chart[move_type[:, :, None], np.maximum(d_type2, 0)[None, None, :]], 1.0)
+    total_eff = eff1 * eff2
+
+    attack = np.where(physical, stat(attackers, "attack")[:, None], stat(attackers, "special")[:, None])[:, :, None]
+    defense = np.where(physical[:, :, None], stat(defenders, "defense")[None, None, :],
+                       stat(defenders, "special")[None, None, :])
+    scaled = (attack > 255) | (defense > 255)
+    attack = np.where(scaled, np.maximum(1, attack // 4), attack)
+    defense = np.where(scaled, np.maximum(1, defense // 4), defense)
+    defense = np.where((effect == "Explosion")[:, :, None], np.maximum(1, defense // 2), defense)
+    defense = np.maximum(1, defense)
+
+    rolls = np.arange(RANDOM_MIN, RANDOM_MAX + 1)
+    per_hit = np.zeros(total_eff.shape)
+    for critical, weight in ((False, 1 - p_crit), (True, p_crit)):
+        damage = (2 * level * (2 if critical else 1)) // 5 + 2
+        damage = damage * power[:, :, None] * attack // defense // 50 + 2
+        damage = np.where(stab, damage * 3 // 2, damage)
+        # int(int(damage * eff1) * eff2) like the C# casts; everything is non-negative
+        damage = np.floor(np.floor(damage * eff1) * eff2).astype(np.int64)
+        rolled = np.where(damage[..., None] > 1, damage[..., None] * rolls // 255, damage[..., None])
+        mean = np.where(total_eff == 0, 0.0, np.maximum(rolled, 1).mean(axis=-1))
+        per_hit += weight * mean
+
+    per_hit *= np.select([effect == "MultiHit", effect == "DoubleHit", np.isin(effect, ("Charge", "Recharge"))],
+                         [MULTI_HIT_EXPECTED, 2.0, 0.5], 1.0)[:, :, None]
+    per_hit = np.where((power > 0)[:, :, None], per_hit, 0.0)
+
+    # Effects that ignore the damage formula
+    shape = per_hit.shape
+    level1 = level[:, :, 0]
+    fixed = [
+        (effect == "FixedDamage20", np.full(shape, 20.0)),
+        (effect == "FixedDamage40", np.full(shape, 40.0)),
+        (effect == "LevelDamage", np.where(total_eff != 0, level1[:, :, None] * 1.0, 0.0)),
+        (effect == "Psywave", np.broadcast_to(((1 + (level1 * 1.5).astype(np.int64)) / 2.0)[:, :, None], shape)),
+        (effect == "SuperFang", np.broadcast_to(np.maximum(1, stat(defenders, "hp") // 2)[None, None, :] * 1.0, shape)),
+        (effect == "OHKO", np.where((total_eff == 0)
+                                    | (stat(attackers, "speed")[:, None, None] < stat(defenders, "speed")[None, None, :]),
+                                    0.0, stat(defenders, "hp")[None, None, :] * 1.0)),
+    ]
+    for rows, amount in fixed:
+        per_hit = np.where(rows[:, :, None], amount, per_hit)
+    return np.where(known[:, :, None], per_hit * hit[:, :, None], 0.0)
+
+
+def best_damage(table):
+    """(best expected damage, its move slot or -1) over the move axis of damage_table."""
+    slot = np.argmax(table, axis=1)
+    best = np.take_along_axis(table, slot[:, None, :], axis=1)[:, 0, :]
+    return best, np.where(best > 0, slot, -1)
+
+
+def matchup_tables(data, pool, opponents):
+    """Damage, KO and matchup value arrays [pool member, opponent], built in one batch.
+
+    Returns dealt, taken, move id (or -1), my turns, their turns and value.
+    """
+    dealt, slot = best_damage(damage_table(data, pool, opponents))
+    taken = best_damage(damage_table(data, opponents, pool))[0].T
+    move_ids = np.array([(m["moves"] + [-1] * MOVE_SLOTS)[:MOVE_SLOTS] for m in pool])
+    move = np.where(slot >= 0, np.take_along_axis(move_ids, np.maximum(slot, 0), axis=1), -1)
+
+    my_hp = np.array([m["stats"]["hp"] for m in pool])[:, None]
+    their_hp = np.array([o["stats"]["hp"] for o in opponents])[None, :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        my_turns = np.where(dealt > 0, np.ceil(their_hp / dealt), np.inf)
+        their_turns = np.where(taken > 0, np.ceil(my_hp / taken), np.inf)
+    # Speed ties are coin flips; count them as moving second
+    first = np.array([m["stats"]["speed"] for m in pool])[:, None] > \
+        np.array([o["stats"]["speed"] for o in opponents])[None, :]
+    wins = np.isfinite(my_turns) & ((my_turns < their_turns) | ((my_turns == their_turns) & first))
+    hits_taken = np.where(first, my_turns - 1, my_turns)
+    with np.errstate(invalid="ignore"):
+        kept = np.where(wins, 1.0 - hits_taken * taken / my_hp, 0.0)
+    return dealt, taken, move, my_turns, their_turns, np.maximum(kept, 0.0)
+
+
+def verify(data, pool, opponents, tables):
+    """Cells of the batched tables that differ from the scalar expected_damage."""
+    dealt, taken = tables[0], tables[1]
+    mismatches = 0
+    for i, mine in enumerate(pool):
+        for c, theirs in enumerate(opponents):
+            for side, attacker, defender in ((dealt, mine, theirs), (taken, theirs, mine)):
+                expected = max([expected_damage(data, attacker, defender, data.moves[m])
+                                for m in attacker["moves"]] + [0.0])
+                if not math.isclose(side[i, c], expected, rel_tol=1e-9, abs_tol=1e-9):
+                    mismatches += 1
+    return mismatches
+
+
+def candidates(value, keep_per=TEAM_SIZE):
+    """Indexes of rows worth searching: rows with a win that fewer than keep_per other rows dominate.
+
+    Row j dominates row i when it is at least as good on every column (an
+    identical earlier row counts). A team holding a row with keep_per
+    dominators always has one of them free to swap in, so dropping the row
+    never loses the best team, yet at least keep_per rows with a win survive.
+    """
+    value = np.asarray(value)
+    n = len(value)
+    if not n:
+        return []
+    at_least = (value[:, None, :] >= value[None, :, :]).all(axis=-1)     # [j, i]: j >= i everywhere
+    identical = (value[:, None, :] == value[None, :, :]).all(axis=-1)
+    earlier = np.arange(n)[:, None] < np.arange(n)[None, :]
+    dominates = at_least & (~identical | earlier)
+    np.fill_diagonal(dominates, False)
+    keep = (dominates.sum(axis=0) < keep_per) & value.any(axis=1)
+    return np.flatnonzero(keep).tolist()
+
+
+def depth_score(columns):
+    """Weighted sum of each column's values, best first."""
+    return sum(w * v for column in columns for w, v in zip(DEPTH_WEIGHTS, sorted(column, reverse=True)))
+
+
+def branch_and_bound(value, size, require_cover=False):
+    """Best team of at most `size` rows maximising depth_score of its columns.
+
+    With require_cover, only teams with a non-zero value in every column count.
+    Returns (score, rows) or (None, []) when no such team exists.
+    """
+    n = len(value)
+    if n == 0:
+        return None, []
+    cols = len(value[0])
+    order = sorted(range(n), key=lambda i: -sum(value[i]))
+    rows = [[float(v) for v in value[i]] for i in order]
+    # suffix[i][c]: the `size` best values rows from i onwards reach in column c
+    suffix = [[[] for _ in range(cols)] for _ in range(n + 1)]
+    for i in range(n - 1, -1, -1):
+        suffix[i] = [sorted(s + [v], reverse=True)[:size] if v > 0 else s
+                     for s, v in zip(suffix[i + 1], rows[i])]
+
+    best = {"score": None, "team": []}
+
+    def search(start, team, columns):
+        score = depth_score(columns)
+        covered = all(any(v > 0 for v in c) for c in columns)
+        if (not require_cover or covered) and (best["score"] is None or score > best["score"]):
+            best["score"], best["team"] = score, list(team)
+        if len(team) == size or start == n:
+            return
+        # Each free slot adds at most the best value left in every column
+        free = size - len(team)
+        bound = depth_score([c + s[:free] for c, s in zip(columns, suffix[start])])
+        if best["score"] is not None and bound <= best["score"]:
+            return
+        if require_cover and any(not any(v > 0 for v in c) and not s for c, s in zip(columns, suffix[start])):
+            return
+        for i in range(start, n):
+            team.append(i)
+            search(i + 1, team, [c + [v] if v > 0 else c for c, v in zip(columns, rows[i])])
+            team.pop()
+
+    search(0, [], [[] for _ in range(cols)])
+    return best["score"], [order[i] for i in best["team"]]
+
+
+def minimum_viable(value, max_size=TEAM_SIZE):
+    for size in range(1, max_size + 1):
+        score, team = branch_and_bound(value, size, require_cover=True)
+        if score is not None and len(team) <= size:
+            return score, team
+    return None, []
+
+
+def solve_stage(args):
+    data_dir, stage, level_cap, verify_tables = args
+    data = GameData.load_from_directory(data_dir)
+    trainer = data.trainers[stage["trainerId"]]
+    cap = level_cap or stage["levelCap"]
+    available = obtainable_species(data, stage["areas"], stage["flags"], cap)
+    pool_ids = sorted(available)
+    pool = [combatant(data, sid, cap) for sid in pool_ids]
+    opponents = opponent_party(data, trainer)
+
+    tables = matchup_tables(data, pool, opponents)
+    dealt, taken, move, my_turns, their_turns, value = tables
+    keep = candidates(value)
+    reduced = value[keep].tolist()
+
+    def describe(rows):
+        members = []
+        for r in rows:
+            i = keep[r]
+            members.append({
+                "speciesId": pool_ids[i],
+                "name": data.species[pool_ids[i]]["Name"],
+                "level": cap,
+                "counters": [
+                    {"speciesId": o["species"]["DexNumber"], "value": round(float(value[i, c]), 3),
+                     "turnsToKo": int(my_turns[i, c]), "move": int(move[i, c])}
+                    for c, o in enumerate(opponents) if value[i, c] > 0
+                ],
+            })
+        return members
+
+    best_score, best_rows = branch_and_bound(reduced, TEAM_SIZE)
+    min_score, min_rows = minimum_viable(reduced)
+    mismatches = verify(data, pool, opponents, tables) if verify_tables else None
+    return {
+        "trainerId": trainer["id"],
+        "name": trainer["name"],
+        "levelCap": cap,
+        "poolSize": len(pool),
+        "candidates": len(keep),
+        "party": [{"speciesId": p["speciesId"], "level": p["level"]} for p in trainer["party"]],
+        "bestTeam": {"score": round(best_score or 0.0, 3), "members": describe(best_rows)},
+        "minimumViableTeam": None if min_score is None else {
+            "size": len(min_rows), "score": round(min_score, 3), "members": describe(min_rows)},
+        **({} if mismatches is None else {"mismatches": mismatches}),
+    }
+
+
+def print_report(result):
+    party = ", ".join(f"#{p['speciesId']} L{p['level']}" for p in result["party"])
+    print(f"{result['name']} (id {result['trainerId']}): {party}")
+    print(f"  level cap {result['levelCap']}, {result['poolSize']} species available, "
+          f"{result['candidates']} candidates")
+    best = result["bestTeam"]
+    print(f"  best team (score {best['score']}): "
+          + ", ".join(m["name"] for m in best["members"]))
+    viable = result["minimumViableTeam"]
+    if viable is None:
+        print("  no team counters every opponent Pokemon")
+    else:
+        print(f"  minimum viable team ({viable['size']}): "
+              + ", ".join(m["name"] for m in viable["members"]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--trainer", type=int, action="append",
+                        help="gate trainer id to solve (repeatable, default: all)")
+    parser.add_argument("--level-cap", type=int,
+                        help="player level cap (default: opponent's highest level)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    parser.add_argument("--verify", action="store_true",
+                        help="check the batched damage tables against battle_calc.expected_damage")
+    args = parser.parse_args()
+
+    data = GameData.load_from_directory(args.data_dir)
+    stages = battle_stages(data)
+    if args.trainer:
+        stages = [s for s in stages if s["trainerId"] in args.trainer]
+    jobs = [(args.data_dir, s, args.level_cap, args.verify) for s in stages]
+
+    with Pool(max(1, min(args.workers or 1, len(jobs) or 1))) as pool:
+        results = pool.map(solve_stage, jobs)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for result in results:
+            print_report(result)
+    if args.verify:
+        mismatches = sum(r["mismatches"] for r in results)
+        print(f"{mismatches} mismatches against battle_calc.expected_damage")
+        if mismatches:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
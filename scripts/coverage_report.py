@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Species and move coverage across trainers, encounters, learnsets and evolutions.
+
+Reports:
+  - species that never appear: in no trainer party, no encounter slot, not a
+    starter and not an evolution of any of those;
+  - species the player can meet but never fight, or fight but never catch;
+  - learnset moves no trainer Pokemon knows at the levels trainers use
+    (trainer Pokemon know the last 4 moves learned at their level);
+  - moves in moves.json that no learnset references.
+
+Every source is scanned once into an index keyed by species or move id, and
+the reports are set operations over those indexes, so the cost stays linear
+in the size of the data.
+
+Usage:
+    python scripts/coverage_report.py [--data-dir DIR] [--json]
+"""
+import argparse, json
+from collections import defaultdict
+
+from gamedata import DATA_DIR, GameData
+from progression import STARTER_SPECIES
+
+
+def build_indexes(data):
+    trainer_levels = defaultdict(set)      # species -> levels trainers use it at
+    trainer_overrides = defaultdict(set)   # species -> moves given through moveOverrides
+    for trainer in data.trainers.values():
+        for member in trainer["party"]:
+            if member.get("moveOverrides"):
+                trainer_overrides[member["speciesId"]].update(member["moveOverrides"])
+            else:
+                trainer_levels[member["speciesId"]].add(member["level"])
+
+    wild = defaultdict(set)                # species -> areas it is encountered in
+    for table in data.encounters.values():
+        for method in ("grass", "surf", "fishing"):
+            for slot in table.get(method) or []:
+                wild[slot["speciesId"]].add(table["areaId"])
+
+    evolves_to = defaultdict(set)
+    for evo in data.evolutions:
+        evolves_to[evo["fromSpeciesId"]].add(evo["toSpeciesId"])
+
+    learnset_moves = defaultdict(set)      # move -> species whose learnset has it
+    for species_id, entries in data.learnsets.items():
+        for entry in entries:
+            learnset_moves[entry["moveId"]].add(species_id)
+
+    return {
+        "trainer_levels": trainer_levels,
+        "trainer_overrides": trainer_overrides,
+        "wild": wild,
+        "evolves_to": evolves_to,
+        "learnset_moves": learnset_moves,
+    }
+
+
+def reachable_by_evolution(roots, evolves_to):
+    seen = set(roots)
+    stack = list(roots)
+    while stack:
+        for target in evolves_to.get(stack.pop(), ()):
+            if target not in seen:
+                seen.add(target)
+                stack.append(target)
+    return seen
+
+
+def coverage(data):
+    idx = build_indexes(data)
+    all_species = set(data.species)
+    in_trainers = set(idx["trainer_levels"]) | set(idx["trainer_overrides"])
+    in_wild = set(idx["wild"])
+    catchable = reachable_by_evolution(in_wild | set(STARTER_SPECIES), idx["evolves_to"])
+
+    # Moves trainer Pokemon actually know, one default-move lookup per (species, level)
+    known = defaultdict(set)
+    for species_id, levels in idx["trainer_levels"].items():
+        for level in levels:
+            known[species_id].update(data.default_moves(species_id, level))
+    for species_id, moves in idx["trainer_overrides"].items():
+        known[species_id].update(moves)
+
+    unreachable_moves = {}
+    for species_id, entries in sorted(data.learnsets.items()):
+        missing = sorted({e["moveId"] for e in entries} - known.get(species_id, set()))
+        if missing:
+            levels = idx["trainer_levels"].get(species_id)
+            unreachable_moves[species_id] = {
+                "name": data.species[species_id]["Name"] if species_id in data.species else None,
+                "trainerLevels": sorted(levels) if levels else [],
+                "moves": [{"moveId": m, "name": data.moves[m]["name"] if m in data.moves else None,
+                           "level": min(e["level"] for e in entries if e["moveId"] == m)}
+                          for m in missing],
+            }
+
+    return {
+        "speciesNeverAppearing": sorted(all_species - in_trainers - catchable),
+        "speciesNotInTrainerParties": sorted(all_species - in_trainers),
+        "speciesNotObtainable": sorted(all_species - catchable),
+        "speciesFoughtButNotObtainable": sorted(in_trainers - catchable),
+        "unreachableLearnsetMoves": unreachable_moves,
+        "speciesWithoutLearnset": sorted(all_species - set(data.learnsets)),
+        "movesNotInAnyLearnset": sorted(set(data.moves) - set(idx["learnset_moves"])),
+    }
+
+
+def print_report(data, report):
+    def names(ids):
+        return ", ".join(f"{data.species[i]['Name']} (#{i})" for i in ids) or "none"
+
+    print(f"Species never appearing anywhere: {len(report['speciesNeverAppearing'])}")
+    print(f"  {names(report['speciesNeverAppearing'])}")
+    print(f"Species no trainer uses: {len(report['speciesNotInTrainerParties'])}")
+    print(f"Species the player cannot obtain: {len(report['speciesNotObtainable'])}")
+    print(f"Species fought but never obtainable: {len(report['speciesFoughtButNotObtainable'])}")
+    print(f"  {names(report['speciesFoughtButNotObtainable'])}")
+    print(f"Species without a learnset: {len(report['speciesWithoutLearnset'])}")
+    print("Learnset moves no trainer Pokemon knows:")
+    for species_id, entry in report["unreachableLearnsetMoves"].items():
+        levels = entry["trainerLevels"]
+        used = f"trainer levels {levels[0]}-{levels[-1]}" if levels else "not used by trainers"
+        moves = ", ".join(f"{m['name']} (L{m['level']})" for m in entry["moves"])
+        print(f"  {entry['name']} (#{species_id}, {used}): {moves}")
+    unused = report["movesNotInAnyLearnset"]
+    print(f"Moves no learnset references: {len(unused)}")
+    print("  " + (", ".join(data.moves[m]["name"] for m in unused) or "none"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    data = GameData.load_from_directory(args.data_dir)
+    report = coverage(data)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(data, report)
+
+
+if __name__ == "__main__":
+    main()
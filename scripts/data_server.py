@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""Serve data/ to a running dev build over HTTP on localhost, with ETags and change pushes.
+
+Runs a watch_data.WatchSession, so edits to generate_trainers.py, data/ or the
+C# models regenerate and validate trainers.json as they happen, and serves the
+result:
+
+  GET /files              {name: {"path", "etag"}} for every GameData file
+  GET /files/<name>       the file as written, e.g. /files/trainers
+  GET /trainers           {"version", "trainers": {id: etag}}
+  GET /trainers/<id>      one TrainerData record, dialog resolved
+  GET /events             Server-Sent Events: one "change" event per rebuild
+                          with the changed file names and trainer ids
+
+Every response carries an ETag and a matching If-None-Match gets 304, so a
+client polling /trainers and fetching only the records whose tag changed moves
+a few hundred bytes per edit instead of the whole trainers.json. The server
+binds 127.0.0.1 only.
+
+Usage:
+    python scripts/data_server.py [--port 8765] [--poll] [--no-generate]
+"""
+import argparse, hashlib, json, os, queue, sys, threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from dialog_table import resolve
+from gamedata import DATA_DIR, DATA_FILES, data_path
+from schema_check import SRC_DIR
+from watch_data import InotifyWatcher, PollingWatcher, WatchSession
+
+HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+KEEPALIVE_SECONDS = 15
+
+
+def etag(body):
+    return '"' + hashlib.sha256(body).hexdigest()[:20] + '"'
+
+
+class DataStore:
+    """Current bytes and ETags of the data files and trainer records."""
+
+    def __init__(self, data_dir):
+        self.data_dir = data_dir
+        self.lock = threading.Lock()
+        self.version = 0
+        self.files = {}          # name -> (etag, bytes)
+        self.trainers = {}       # id -> (etag, bytes)
+        self.index = (None, b"")
+        self.listeners = []
+
+    def reload(self):
+        """Re-read every data file; returns the change, or None if nothing changed."""
+        files = {}
+        for name in DATA_FILES:
+            try:
+                with open(data_path(self.data_dir, name), "rb") as f:
+                    body = f.read()
+            except FileNotFoundError:
+                continue
+            files[name] = (etag(body), body)
+        changed_files = sorted(n for n in set(files) | set(self.files)
+                               if files.get(n, (None,))[0] != self.files.get(n, (None,))[0])
+        if not changed_files:
+            return None
+
+        trainers = self.trainers
+        if {"trainers", "dialog_strings"} & set(changed_files):
+            # A half-saved or unresolvable trainers.json keeps the last good records
+            trainers = self._trainer_records(files)
+            if trainers is None:
+                trainers = self.trainers
+        changed = sorted(i for i in trainers if trainers[i][0] != self.trainers.get(i, (None,))[0])
+        removed = sorted(set(self.trainers) - set(trainers))
+
+        with self.lock:
+            self.version += 1
+            self.files, self.trainers = files, trainers
+            body = json.dumps({"version": self.version,
+                               "trainers": {i: tag for i, (tag, _) in sorted(trainers.items())}}).encode()
+            self.index = (etag(body), body)
+            change = {"version": self.version, "files": changed_files,
+                      "trainers": {"changed": changed, "removed": removed}}
+            for listener in self.listeners:
+                listener.put(change)
+        return change
+
+    @staticmethod
+    def _trainer_records(files):
+        """{id: (etag, body)} from trainers.json, or None when it is missing or does not load."""
+        if "trainers" not in files:
+            print("ERROR: trainers.json missing; still serving the previous trainers")
+            return None
+        try:
+            records = json.loads(files["trainers"][1])
+            table = json.loads(files["dialog_strings"][1]) if "dialog_strings" in files else None
+            resolve(records, table)
+            bodies = {r["id"]: json.dumps(r, separators=(",", ":")).encode() for r in records}
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"ERROR: trainers.json not loaded ({e!r}); still serving the previous trainers")
+            return None
+        return {i: (etag(body), body) for i, body in bodies.items()}
+
+    def subscribe(self):
+        q = queue.Queue()
+        with self.lock:
+            self.listeners.append(q)
+        return q
+
+    def unsubscribe(self, q):
+        with self.lock:
+            self.listeners.remove(q)
+
+
+class Handler(BaseHTTPRequestHandler):
+    store = None
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        parts = [p for p in self.path.split("?")[0].split("/") if p]
+        if parts == ["events"]:
+            self.stream_events()
+            return
+        store = self.store
+        with store.lock:
+            if parts == ["files"]:
+                listing = {n: {"path": "/".join(DATA_FILES[n]), "etag": tag}
+                           for n, (tag, _) in store.files.items()}
+                body = json.dumps(listing).encode()
+                found = (etag(body), body)
+            elif len(parts) == 2 and parts[0] == "files":
+                found = store.files.get(parts[1])
+            elif parts == ["trainers"]:
+                found = store.index
+            elif len(parts) == 2 and parts[0] == "trainers" and parts[1].isdigit():
+                found = store.trainers.get(int(parts[1]))
+            else:
+                found = None
+        if found is None:
+            self.send_error(404)
+        else:
+            self.send_tagged(*found)
+
+    def send_tagged(self, tag, body):
+        match = self.headers.get("If-None-Match")
+        if match and (match.strip() == "*" or tag in [t.strip() for t in match.split(",")]):
+            self.send_response(304)
+            self.send_header("ETag", tag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", tag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def stream_events(self):
+        # Subscribed before the headers go out, so a client that fetches the
+        # index once it sees them cannot miss a change in between
+        q = self.store.subscribe()
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+            while True:
+                try:
+                    change = q.get(timeout=KEEPALIVE_SECONDS)
+                    message = f"id: {change['version']}\nevent: change\ndata: {json.dumps(change)}\n\n"
+                except queue.Empty:
+                    message = ": keepalive\n\n"
+                self.wfile.write(message.encode())
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            self.store.unsubscribe(q)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def watch(session, store, watcher):
+    while True:
+        changed = watcher.wait()
+        if session:
+            changed.discard(os.path.abspath(session.output_path))
+            session.refresh(changed)
+        change = store.reload()
+        if change:
+            t = change["trainers"]
+            print(f"v{change['version']}: {', '.join(change['files'])} changed; "
+                  f"{len(t['changed'])} trainer records changed, {len(t['removed'])} removed")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--src-dir", default=SRC_DIR)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--poll", action="store_true", help="poll instead of using inotify")
+    parser.add_argument("--interval", type=float, default=0.1, help="polling interval in seconds")
+    parser.add_argument("--no-generate", action="store_true",
+                        help="only serve data/, do not regenerate trainers.json")
+    args = parser.parse_args()
+
+    session = None
+    directories = sorted({os.path.dirname(data_path(args.data_dir, n)) for n in DATA_FILES})
+    if not args.no_generate:
+        session = WatchSession(args.data_dir, src_dir=args.src_dir)
+        session.refresh()
+        directories = session.directories()
+    store = DataStore(args.data_dir)
+    store.reload()
+
+    watcher = None
+    if not args.poll and sys.platform.startswith("linux"):
+        try:
+            watcher = InotifyWatcher(directories)
+        except OSError as e:
+            print(f"inotify unavailable ({e}), polling instead")
+    if watcher is None:
+        watcher = PollingWatcher(directories, args.interval)
+    threading.Thread(target=watch, args=(session, store, watcher), daemon=True).start()
+
+    Handler.store = store
+    server = ThreadingHTTPServer((HOST, args.port), Handler)
+    server.daemon_threads = True
+    print(f"Serving {args.data_dir} on http://{HOST}:{args.port}/ "
+          f"({len(store.files)} files, {len(store.trainers)} trainers), Ctrl+C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Deduplicated dialog string table for trainers.json.
+
+Trainer dialog is moved into data/world/dialog_strings.json, one entry per
+distinct line, and trainers reference lines through beforeBattleDialogIds and
+afterBattleDialogIds. GameData.LoadFromDirectory resolves the ids back into
+BeforeBattleDialog/AfterBattleDialog, sharing one string per distinct line.
+
+Lines are identified by a hash of their text. When a previous table exists,
+lines whose hash is already in it keep their id and new lines get ids after
+the highest existing one, so regenerating never renumbers existing dialog and
+a translated table keyed by the same ids stays valid.
+"""
+import hashlib, json
+
+DIALOG_FIELDS = (("beforeBattleDialog", "beforeBattleDialogIds"),
+                 ("afterBattleDialog", "afterBattleDialogIds"))
+
+
+def text_hash(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+
+
+def build_table(trainers, previous=None):
+    """Return (table, indexed trainers) for inline trainer records.
+
+    previous is an earlier dialog_strings.json table whose ids are kept.
+    """
+    ids = {}
+    texts = {}
+    next_id = 0
+    if previous:
+        for string_id, text in previous["strings"].items():
+            ids[text_hash(text)] = int(string_id)
+        next_id = max(ids.values(), default=-1) + 1
+
+    indexed = []
+    for trainer in trainers:
+        record = dict(trainer)
+        for inline, field in DIALOG_FIELDS:
+            refs = []
+            for text in record.pop(inline):
+                key = text_hash(text)
+                if texts.setdefault(key, text) != text:
+                    raise ValueError(f"dialog hash collision: {text!r} and {texts[key]!r}")
+                if key not in ids:
+                    ids[key] = next_id
+                    next_id += 1
+                refs.append(ids[key])
+            record[field] = refs
+        indexed.append(record)
+
+    strings = {str(ids[key]): text for key, text in sorted(texts.items(), key=lambda kv: ids[kv[0]])}
+    language = previous.get("language", "en") if previous else "en"
+    return {"language": language, "strings": strings}, indexed
+
+
+def resolve(trainers, table):
+    """Inline the dialog of indexed trainer records in place, as GameData does.
+
+    table may be empty or None. An id missing from it falls back to the
+    trainer's inline lines, and is a ValueError when there are none.
+    """
+    by_id = {int(k): text for k, text in (table or {}).get("strings", {}).items()}
+    for trainer in trainers:
+        for inline, field in DIALOG_FIELDS:
+            ids = trainer.pop(field, None)
+            if ids is None:
+                continue
+            missing = [i for i in ids if i not in by_id]
+            if not missing:
+                trainer[inline] = [by_id[i] for i in ids]
+            elif not trainer.get(inline):
+                raise ValueError(f"Trainer {trainer['id']} references dialog string {missing[0]}, which is not "
+                                 "in dialog_strings.json; regenerate it with scripts/generate_trainers.py "
+                                 "--string-table")
+    return trainers
+
+
+def compression_report(trainers, table, indexed):
+    """Sizes of the dialog inline vs. as a table, with indent=2 serialization."""
+    lines = sum(len(t[inline]) for t in trainers for inline, _ in DIALOG_FIELDS)
+    inline_bytes = len(json.dumps(trainers, indent=2).encode("utf-8"))
+    indexed_bytes = len(json.dumps(indexed, indent=2).encode("utf-8"))
+    table_bytes = len(json.dumps(table, indent=2).encode("utf-8"))
+    return {
+        "dialogLines": lines,
+        "uniqueLines": len(table["strings"]),
+        "inlineBytes": inline_bytes,
+        "indexedBytes": indexed_bytes,
+        "tableBytes": table_bytes,
+        "ratio": round((indexed_bytes + table_bytes) / inline_bytes, 3),
+    }
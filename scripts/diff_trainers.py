@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Semantic diff between two versions of trainers.json.
+
+Instead of a line diff of the indented JSON, reports per trainer id what a
+balance patch actually changed: trainers added or removed, party members added
+or removed, level deltas, reward and flag changes, moved areas and any other
+field edits. Output is JSON Lines, one change record per trainer followed by a
+summary record, so CI can gate on it:
+
+    python scripts/diff_trainers.py old/trainers.json data/world/trainers.json
+    git show HEAD~1:data/world/trainers.json > /tmp/old.json &&
+        python scripts/diff_trainers.py /tmp/old.json data/world/trainers.json --exit-code
+
+Both files are streamed record by record and hash-partitioned by id into
+temporary bucket files, and only one bucket pair is held in memory at a time,
+so memory stays bounded for multi-hundred-MB randomized datasets.
+"""
+import argparse, json, os, sys, tempfile
+from collections import Counter
+
+from gamedata import iter_json_array
+
+DEFAULT_BUCKETS = 64
+FLAG_FIELDS = ("requiredFlag", "setsFlag")
+# Fields given their own section of the change record
+HANDLED_FIELDS = {"id", "party", "areaId", "rewardMoney"} | set(FLAG_FIELDS)
+
+
+def partition(path, directory, prefix, buckets):
+    files = [open(os.path.join(directory, f"{prefix}{i}.jsonl"), "w") for i in range(buckets)]
+    try:
+        for record in iter_json_array(path):
+            files[record["id"] % buckets].write(json.dumps(record) + "\n")
+    finally:
+        for f in files:
+            f.close()
+
+
+def read_bucket(directory, prefix, index):
+    records = {}
+    with open(os.path.join(directory, f"{prefix}{index}.jsonl")) as f:
+        for line in f:
+            record = json.loads(line)
+            records[record["id"]] = record
+    return records
+
+
+def diff_party(old, new):
+    """Match members by species in party order; unmatched ones were added or removed."""
+    unmatched = list(enumerate(new))
+    level_deltas, removed = [], []
+    for slot, member in enumerate(old):
+        match = next((k for k, (_, m) in enumerate(unmatched)
+                      if m["speciesId"] == member["speciesId"]), None)
+        if match is None:
+            removed.append({"slot": slot, **member})
+            continue
+        new_slot, other = unmatched.pop(match)
+        if other["level"] != member["level"]:
+            level_deltas.append({"speciesId": member["speciesId"], "slot": new_slot,
+                                 "old": member["level"], "new": other["level"],
+                                 "delta": other["level"] - member["level"]})
+    added = [{"slot": slot, **member} for slot, member in unmatched]
+    changes = {}
+    if added:
+        changes["added"] = added
+    if removed:
+        changes["removed"] = removed
+    if level_deltas:
+        changes["levelDeltas"] = level_deltas
+    if not changes and [m["speciesId"] for m in old] != [m["speciesId"] for m in new]:
+        changes["reordered"] = [m["speciesId"] for m in new]
+    return changes
+
+
+def diff_trainer(old, new):
+    change = {}
+    if old.get("areaId") != new.get("areaId"):
+        change["area"] = {"old": old.get("areaId"), "new": new.get("areaId")}
+    if old.get("rewardMoney") != new.get("rewardMoney"):
+        change["reward"] = {"old": old.get("rewardMoney"), "new": new.get("rewardMoney"),
+                            "delta": (new.get("rewardMoney") or 0) - (old.get("rewardMoney") or 0)}
+    flags = {f: {"old": old.get(f), "new": new.get(f)}
+             for f in FLAG_FIELDS if old.get(f) != new.get(f)}
+    if flags:
+        change["flags"] = flags
+    party = diff_party(old.get("party", []), new.get("party", []))
+    if party:
+        change["party"] = party
+    fields = {k: {"old": old.get(k), "new": new.get(k)}
+              for k in sorted((set(old) | set(new)) - HANDLED_FIELDS) if old.get(k) != new.get(k)}
+    if fields:
+        change["fields"] = fields
+    return change
+
+
+def diff_files(old_path, new_path, buckets=DEFAULT_BUCKETS):
+    """Yield change records in ascending trainer id order within each bucket."""
+    with tempfile.TemporaryDirectory(prefix="trainer_diff_") as tmp:
+        partition(old_path, tmp, "old", buckets)
+        partition(new_path, tmp, "new", buckets)
+        for index in range(buckets):
+            old = read_bucket(tmp, "old", index)
+            new = read_bucket(tmp, "new", index)
+            for trainer_id in sorted(set(old) | set(new)):
+                if trainer_id not in new:
+                    yield {"id": trainer_id, "change": "removed", "name": old[trainer_id].get("name"),
+                           "areaId": old[trainer_id].get("areaId")}
+                elif trainer_id not in old:
+                    yield {"id": trainer_id, "change": "added", "name": new[trainer_id].get("name"),
+                           "areaId": new[trainer_id].get("areaId")}
+                else:
+                    change = diff_trainer(old[trainer_id], new[trainer_id])
+                    if change:
+                        yield {"id": trainer_id, "change": "modified", **change}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("old", help="previous trainers.json")
+    parser.add_argument("new", help="updated trainers.json")
+    parser.add_argument("--buckets", type=int, default=DEFAULT_BUCKETS,
+                        help="number of id partitions; raise for very large files")
+    parser.add_argument("--exit-code", action="store_true",
+                        help="exit with status 1 when there are differences")
+    args = parser.parse_args()
+
+    summary = Counter()
+    for record in diff_files(args.old, args.new, args.buckets):
+        summary[record["change"]] += 1
+        for section in ("area", "reward", "flags", "party", "fields"):
+            if section in record:
+                summary[section] += 1
+        sys.stdout.write(json.dumps(record) + "\n")
+    sys.stdout.write(json.dumps({"summary": dict(summary)}) + "\n")
+
+    if args.exit_code and summary:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""Bit-exact port of System.Random as constructed with a seed.
+
+`new Random(seed)` in .NET Core and .NET 5+ still uses the legacy Knuth
+subtractive generator (Net5CompatSeedImpl) for compatibility, so replaying a
+seeded battle, placement or encounter in Python needs the same generator and
+the same double-to-int conversions as Next(), Next(max) and Next(min, max).
+
+DotNetRandomArray runs many seeded generators side by side with NumPy, one
+row of state per stream, for baking or simulating thousands of seeds at
+batch speed; stream i gives exactly what DotNetRandom(seeds[i]) would.
+"""
+import numpy as np
+
+INT_MAX = 2147483647
+INT_MIN = -2147483648
+MSEED = 161803398
+
+
+def _int32(value):
+    # C# int arithmetic wraps; it matters for seeds near int.MaxValue (ints or int64 arrays)
+    return (value + 2 ** 31) % 2 ** 32 - 2 ** 31
+
+
+class DotNetRandom:
+    def __init__(self, seed):
+        seed_array = [0] * 56
+        subtraction = INT_MAX if seed == INT_MIN else abs(seed)
+        mj = MSEED - subtraction
+        seed_array[55] = mj
+        mk = 1
+        ii = 0
+        for _ in range(1, 55):
+            ii += 21
+            if ii >= 55:
+                ii -= 55
+            seed_array[ii] = mk
+            mk = _int32(mj - mk)
+            if mk < 0:
+                mk += INT_MAX
+            mj = seed_array[ii]
+        for _ in range(1, 5):
+            for i in range(1, 56):
+                n = i + 30
+                if n >= 55:
+                    n -= 55
+                seed_array[i] = _int32(seed_array[i] - seed_array[1 + n])
+                if seed_array[i] < 0:
+                    seed_array[i] += INT_MAX
+        self._seed_array = seed_array
+        self._inext = 0
+        self._inextp = 21
+
+    def internal_sample(self):
+        inext = self._inext + 1
+        if inext >= 56:
+            inext = 1
+        inextp = self._inextp + 1
+        if inextp >= 56:
+            inextp = 1
+        seed_array = self._seed_array
+        value = seed_array[inext] - seed_array[inextp]
+        if value == INT_MAX:
+            value -= 1
+        if value < 0:
+            value += INT_MAX
+        seed_array[inext] = value
+        self._inext = inext
+        self._inextp = inextp
+        return value
+
+    def sample(self):
+        return self.internal_sample() * (1.0 / INT_MAX)
+
+    def _large_range_sample(self):
+        result = self.internal_sample()
+        if self.internal_sample() % 2 == 0:
+            result = -result
+        return (result + (INT_MAX - 1.0)) / (2.0 * INT_MAX - 1.0)
+
+    def next(self, min_value=None, max_value=None):
+        """Next(), Next(maxValue) or Next(minValue, maxValue)."""
+        if min_value is None:
+            return self.internal_sample()
+        if max_value is None:
+            if min_value < 0:
+                raise ValueError("maxValue must be non-negative")
+            return int(self.sample() * min_value)
+        if min_value > max_value:
+            raise ValueError("minValue must not exceed maxValue")
+        span = max_value - min_value
+        if span <= INT_MAX:
+            return int(self.sample() * span) + min_value
+        return int(self._large_range_sample() * span) + min_value
+
+    def next_double(self):
+        return self.sample()
+
+    def next_single(self):
+        """NextSingle(): the double sample rounded to float32, as a Python float."""
+        return float(np.float32(self.sample()))
+
+
+class DotNetRandomArray:
+    """One seeded System.Random per seed, all advanced with array operations.
+
+    Every draw method takes an optional boolean `where` mask; only the streams
+    it selects consume a draw (the rest read 0), so streams can drift apart
+    the way separate battles or maps do. Bounds may be scalars or per-stream
+    arrays.
+    """
+
+    def __init__(self, seeds):
+        seeds = np.asarray(seeds, dtype=np.int64).ravel()
+        count = len(seeds)
+        seed_array = np.zeros((count, 56), dtype=np.int64)
+        subtraction = np.where(seeds == INT_MIN, INT_MAX, np.abs(seeds))
+        mj = MSEED - subtraction
+        seed_array[:, 55] = mj
+        mk = np.ones(count, dtype=np.int64)
+        ii = 0
+        for _ in range(1, 55):
+            ii += 21
+            if ii >= 55:
+                ii -= 55
+            seed_array[:, ii] = mk
+            mk = _int32(mj - mk)
+            mk[mk < 0] += INT_MAX
+            mj = seed_array[:, ii].copy()
+        for _ in range(1, 5):
+            for i in range(1, 56):
+                n = i + 30
+                if n >= 55:
+                    n -= 55
+                column = _int32(seed_array[:, i] - seed_array[:, 1 + n])
+                column[column < 0] += INT_MAX
+                seed_array[:, i] = column
+        self._seed_array = seed_array
+        self._inext = np.zeros(count, dtype=np.int64)
+        self._inextp = np.full(count, 21, dtype=np.int64)
+        # While no draw has been masked every stream sits at the same index
+        self._lockstep = True
+
+    def __len__(self):
+        return len(self._inext)
+
+    def internal_sample(self, where=None):
+        if where is None and self._lockstep:
+            return self._lockstep_sample()
+        if where is not None:
+            self._lockstep = False
+        rows = np.arange(len(self)) if where is None else np.flatnonzero(where)
+        inext = self._inext[rows] + 1
+        inext[inext >= 56] = 1
+        inextp = self._inextp[rows] + 1
+        inextp[inextp >= 56] = 1
+        value = self._seed_array[rows, inext] - self._seed_array[rows, inextp]
+        value[value == INT_MAX] -= 1
+        value[value < 0] += INT_MAX
+        self._seed_array[rows, inext] = value
+        self._inext[rows] = inext
+        self._inextp[rows] = inextp
+        if where is None:
+            return value
+        result = np.zeros(len(self), dtype=np.int64)
+        result[rows] = value
+        return result
+
+    def _lockstep_sample(self):
+        inext = int(self._inext[0]) + 1 if len(self) else 1
+        if inext >= 56:
+            inext = 1
+        inextp = int(self._inextp[0]) + 1 if len(self) else 22
+        if inextp >= 56:
+            inextp = 1
+        value = self._seed_array[:, inext] - self._seed_array[:, inextp]
+        value[value == INT_MAX] -= 1
+        value[value < 0] += INT_MAX
+        self._seed_array[:, inext] = value
+        self._inext[:] = inext
+        self._inextp[:] = inextp
+        return value
+
+    def sample(self, where=None):
+        return self.internal_sample(where) * (1.0 / INT_MAX)
+
+    def next(self, min_value=None, max_value=None, where=None):
+        """Next(), Next(maxValue) or Next(minValue, maxValue) for every selected stream."""
+        if min_value is None:
+            return self.internal_sample(where)
+        if max_value is None:
+            max_value = np.asarray(min_value, dtype=np.int64)
+            if np.any(max_value < 0):
+                raise ValueError("maxValue must be non-negative")
+            return (self.sample(where) * max_value).astype(np.int64)
+        min_value = np.asarray(min_value, dtype=np.int64)
+        span = np.asarray(max_value, dtype=np.int64) - min_value
+        if np.any(span < 0):
+            raise ValueError("minValue must not exceed maxValue")
+        first = self.internal_sample(where)
+        result = first * (1.0 / INT_MAX)
+        large = np.broadcast_to(span > INT_MAX, first.shape)
+        if where is not None:
+            large = large & where
+        if large.any():
+            # GetSampleForLargeRange: a second draw picks the sign
+            negate = self.internal_sample(large) % 2 == 0
+            signed = np.where(negate, -first, first)
+            result = np.where(large, (signed + (INT_MAX - 1.0)) / (2.0 * INT_MAX - 1.0), result)
+        values = (result * span).astype(np.int64) + min_value
+        return values if where is None else np.where(where, values, 0)
+
+    def next_double(self, where=None):
+        return self.sample(where)
+
+    def next_single(self, where=None):
+        return self.sample(where).astype(np.float32)
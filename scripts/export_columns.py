@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""Export the game data as typed, memory-mappable column arrays for notebooks.
+
+Each table is a directory of .npy files, one per column, under data/columns/:
+
+  species          one row per species (species.json)
+  moves            one row per move (moves.json)
+  learnsets        one row per learnset entry: speciesId, order, level, moveId
+  encounter_areas  one row per encounter table: areaId, encounterRate
+  encounter_slots  one row per slot: areaId, method, slot, speciesId,
+                   minLevel, maxLevel, weight
+  trainers         one row per trainer, scalar fields only (trainers.json)
+  trainer_party    one row per party Pokemon: trainerId, slot, speciesId,
+                   level, move1-move4 (moveOverrides, -1 when not overridden)
+
+Column types are inferred from the values: bools stay bool, integers get the
+smallest signed dtype that fits (with -1 for null when a column has nulls, or
+the dtype's minimum if -1 is a real value), floats are float64 with NaN for
+null, and strings are dictionary-encoded as integer codes (-1 for null) plus a
+sorted <column>.dict.npy of the distinct values. Lists and objects other than
+the flattened ones above are left out. manifest.json records every table's
+columns, dtypes, null sentinels and the hash of its sources; a table is only
+rewritten when its source files or this script change.
+
+    from export_columns import load_columns, to_dataframe
+    party = load_columns("trainer_party")        # {column: np.memmap}
+    df = to_dataframe("encounter_slots")         # needs pandas
+
+Usage:
+    python scripts/export_columns.py [--data-dir DIR] [--out-dir DIR] [--force]
+"""
+import argparse, hashlib, json, os, shutil
+
+import numpy as np
+
+from gamedata import DATA_DIR, DATA_FILES, data_path, iter_json_array, load_json
+
+COLUMNS_DIR = os.path.join(DATA_DIR, "columns")
+MANIFEST = "manifest.json"
+MOVE_SLOTS = 4
+
+
+def species_rows(data_dir):
+    yield from load_json(data_dir, "species")
+
+
+def move_rows(data_dir):
+    yield from load_json(data_dir, "moves")
+
+
+def learnset_rows(data_dir):
+    for species_id, entries in sorted(load_json(data_dir, "learnsets", {}).items(), key=lambda i: int(i[0])):
+        for order, entry in enumerate(entries):
+            yield {"speciesId": int(species_id), "order": order, "level": entry["level"],
+                   "moveId": entry["moveId"]}
+
+
+def encounter_area_rows(data_dir):
+    for table in load_json(data_dir, "encounters", []):
+        yield {"areaId": table["areaId"], "encounterRate": table.get("encounterRate")}
+
+
+def encounter_slot_rows(data_dir):
+    for table in load_json(data_dir, "encounters", []):
+        for method in ("grass", "surf", "fishing"):
+            for slot, entry in enumerate(table.get(method) or []):
+                yield {"areaId": table["areaId"], "method": method, "slot": slot, **entry}
+
+
+def trainer_rows(data_dir):
+    path = data_path(data_dir, "trainers")
+    if os.path.exists(path):
+        yield from iter_json_array(path)
+
+
+def party_rows(data_dir):
+    for trainer in trainer_rows(data_dir):
+        for slot, member in enumerate(trainer.get("party", [])):
+            moves = list(member.get("moveOverrides") or [])[:MOVE_SLOTS]
+            row = {"trainerId": trainer["id"], "slot": slot,
+                   "speciesId": member["speciesId"], "level": member["level"]}
+            for i in range(MOVE_SLOTS):
+                row[f"move{i + 1}"] = moves[i] if i < len(moves) else None
+            yield row
+
+
+# name -> (data files it reads, row generator)
+TABLES = {
+    "species": (("species",), species_rows),
+    "moves": (("moves",), move_rows),
+    "learnsets": (("learnsets",), learnset_rows),
+    "encounter_areas": (("encounters",), encounter_area_rows),
+    "encounter_slots": (("encounters",), encounter_slot_rows),
+    "trainers": (("trainers",), trainer_rows),
+    "trainer_party": (("trainers",), party_rows),
+}
+
+
+def source_hash(data_dir, sources):
+    digest = hashlib.sha256()
+    with open(os.path.abspath(__file__), "rb") as f:
+        digest.update(f.read())
+    for name in sources:
+        path = data_path(data_dir, name)
+        digest.update(name.encode() + b"\0")
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(block)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def int_dtype(low, high):
+    for dtype in (np.int8, np.int16, np.int32, np.int64):
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return dtype
+    raise ValueError(f"integers out of range: {low}..{high}")
+
+
+def encode_column(values):
+    """(array, dictionary or None, null sentinel or None, kind) for one column's values."""
+    present = [v for v in values if v is not None]
+    has_null = len(present) < len(values)
+    if present and all(isinstance(v, bool) for v in present):
+        if not has_null:
+            return np.array(values, dtype=np.bool_), None, None, "bool"
+        return np.array([-1 if v is None else int(v) for v in values], dtype=np.int8), None, -1, "bool"
+    if all(isinstance(v, int) and not isinstance(v, bool) for v in present):
+        low, high = (min(present), max(present)) if present else (0, 0)
+        null = None
+        if has_null:
+            null = -1 if low > -1 else None
+            if null is None:
+                null = int(np.iinfo(int_dtype(low - 1, high)).min)
+            low = min(low, null)
+        dtype = int_dtype(low, high)
+        return np.array([null if v is None else v for v in values], dtype=dtype), None, null, "int"
+    if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in present):
+        return (np.array([np.nan if v is None else v for v in values], dtype=np.float64),
+                None, "NaN", "float")
+    if all(isinstance(v, str) for v in present):
+        dictionary = sorted(set(present))
+        index = {s: i for i, s in enumerate(dictionary)}
+        dtype = int_dtype(-1, max(len(dictionary) - 1, 0))
+        codes = np.array([-1 if v is None else index[v] for v in values], dtype=dtype)
+        return codes, np.array(dictionary, dtype=str), -1, "string"
+    return None, None, None, None
+
+
+def export_table(name, rows, out_dir):
+    """Write one table's columns to out_dir/name; returns its manifest entry."""
+    rows = list(rows)
+    columns = {}
+    for row in rows:
+        for key in row:
+            columns.setdefault(key, None)
+    tmp = os.path.join(out_dir, name + ".tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    entry = {"rows": len(rows), "columns": {}, "skipped": []}
+    for column in columns:
+        array, dictionary, null, kind = encode_column([row.get(column) for row in rows])
+        if array is None:
+            entry["skipped"].append(column)
+            continue
+        np.save(os.path.join(tmp, column + ".npy"), array)
+        info = {"dtype": array.dtype.str, "kind": kind}
+        if null is not None:
+            info["null"] = null
+        if dictionary is not None:
+            np.save(os.path.join(tmp, column + ".dict.npy"), dictionary)
+            info["dictionary"] = column + ".dict.npy"
+        entry["columns"][column] = info
+    final = os.path.join(out_dir, name)
+    shutil.rmtree(final, ignore_errors=True)
+    os.replace(tmp, final)
+    return entry
+
+
+def load_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST)) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"tables": {}}
+
+
+def is_current(out_dir, name, entry, digest):
+    if entry is None or entry.get("sourceHash") != digest:
+        return False
+    return all(os.path.exists(os.path.join(out_dir, name, column + ".npy")) for column in entry["columns"])
+
+
+def export(data_dir=DATA_DIR, out_dir=COLUMNS_DIR, tables=None, force=False):
+    """Export the tables whose sources changed; returns {name: "written" or "up to date"}."""
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = load_manifest(out_dir)
+    status = {}
+    for name in tables or TABLES:
+        sources, rows = TABLES[name]
+        digest = source_hash(data_dir, sources)
+        if not force and is_current(out_dir, name, manifest["tables"].get(name), digest):
+            status[name] = "up to date"
+            continue
+        entry = export_table(name, rows(data_dir), out_dir)
+        entry["sources"] = ["/".join(DATA_FILES[s]) for s in sources]
+        entry["sourceHash"] = digest
+        manifest["tables"][name] = entry
+        status[name] = "written"
+    with open(os.path.join(out_dir, MANIFEST), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return status
+
+
+def load_columns(table, out_dir=COLUMNS_DIR, decode=False):
+    """{column: array} for one exported table, memory-mapped.
+
+    String columns are integer codes unless decode is set, in which case they
+    come back as object arrays of str (None for null).
+    """
+    entry = load_manifest(out_dir)["tables"][table]
+    columns = {}
+    for column, info in entry["columns"].items():
+        array = np.load(os.path.join(out_dir, table, column + ".npy"), mmap_mode="r")
+        if decode and "dictionary" in info:
+            dictionary = np.load(os.path.join(out_dir, table, info["dictionary"]))
+            values = np.empty(len(array), dtype=object)
+            values[array >= 0] = dictionary[array[array >= 0]]
+            array = values
+        columns[column] = array
+    return columns
+
+
+def to_dataframe(table, out_dir=COLUMNS_DIR):
+    """The table as a pandas DataFrame, strings as categoricals."""
+    import pandas as pd
+
+    entry = load_manifest(out_dir)["tables"][table]
+    frame = {}
+    for column, array in load_columns(table, out_dir).items():
+        info = entry["columns"][column]
+        if "dictionary" in info:
+            dictionary = np.load(os.path.join(out_dir, table, info["dictionary"]))
+            frame[column] = pd.Categorical.from_codes(np.asarray(array), categories=dictionary)
+        else:
+            frame[column] = np.asarray(array)
+    return pd.DataFrame(frame)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("tables", nargs="*", help=f"tables to export (default: all of {', '.join(TABLES)})")
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--out-dir", default=COLUMNS_DIR)
+    parser.add_argument("--force", action="store_true", help="rewrite tables even if up to date")
+    args = parser.parse_args()
+    unknown = [t for t in args.tables if t not in TABLES]
+    if unknown:
+        parser.error(f"unknown tables: {', '.join(unknown)}")
+
+    status = export(args.data_dir, args.out_dir, args.tables or None, args.force)
+    manifest = load_manifest(args.out_dir)
+    for name, state in status.items():
+        entry = manifest["tables"][name]
+        skipped = f", skipped {', '.join(entry['skipped'])}" if entry["skipped"] else ""
+        print(f"{name:<16} {state:<10} {entry['rows']:>6} rows, {len(entry['columns'])} columns{skipped}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Shared loader for the JSON files under data/.
+
+Mirrors GameData.LoadFromDirectory so the Python tooling indexes the data the
+same way the game does: species, moves and trainers by numeric id, areas and
+encounter tables by area id.
+"""
+import json, os
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(ROOT_DIR, "data")
+
+# PokemonType enum order
+TYPES = ["Normal", "Fire", "Water", "Electric", "Grass", "Ice", "Fighting", "Poison",
+         "Ground", "Flying", "Psychic", "Bug", "Rock", "Ghost", "Dragon"]
+TYPE_INDEX = {name: i for i, name in enumerate(TYPES)}
+
+# TypeCategory: in Gen 1 the move's type decides physical vs special
+PHYSICAL_TYPES = {"Normal", "Fighting", "Flying", "Ground", "Rock", "Bug", "Ghost", "Poison"}
+
+# GrowthRate enum order
+GROWTH_RATES = ["Fast", "MediumFast", "MediumSlow", "Slow"]
+
+# Tackle, given by the game to Pokemon whose learnset yields no moves
+FALLBACK_MOVE_ID = 33
+
+# Relative paths of every file GameData.LoadFromDirectory reads
+DATA_FILES = {
+    "species": ("pokemon", "species.json"),
+    "moves": ("moves", "moves.json"),
+    "type_chart": ("types", "type_chart.json"),
+    "evolutions": ("pokemon", "evolution.json"),
+    "items": ("items", "items.json"),
+    "learnsets": ("pokemon", "learnsets.json"),
+    "areas": ("world", "areas.json"),
+    "encounters": ("world", "encounters.json"),
+    "trainers": ("world", "trainers.json"),
+    "shops": ("world", "shops.json"),
+    "progression": ("world", "progression.json"),
+    "dialog_strings": ("world", "dialog_strings.json"),
+}
+
+
+def data_path(data_dir, name):
+    return os.path.join(data_dir, *DATA_FILES[name])
+
+
+def load_json(data_dir, name, default=None):
+    path = data_path(data_dir, name)
+    if default is not None and not os.path.exists(path):
+        return default
+    with open(path) as f:
+        return json.load(f)
+
+
+def iter_json_array(path, chunk_size=1 << 16):
+    """Yield the elements of a top-level JSON array without loading the whole file."""
+    decoder = json.JSONDecoder()
+    with open(path) as f:
+        buf = f.read(chunk_size).lstrip()
+        if not buf.startswith("["):
+            raise ValueError(f"{path}: expected a JSON array")
+        pos, eof = 1, False
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n,":
+                pos += 1
+            if pos < len(buf) and buf[pos] == "]":
+                return
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+                # A number at the end of the buffer may continue in the next chunk
+                complete = end < len(buf) or eof
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                complete = False
+            if not complete:
+                more = f.read(chunk_size)
+                eof = not more
+                buf = buf[pos:] + more
+                pos = 0
+                continue
+            yield value
+            pos = end
+
+
+class GameData:
+    def __init__(self):
+        self.species = {}
+        self.moves = {}
+        self.type_chart = {}
+        self.evolutions = []
+        self.items = {}
+        self.learnsets = {}
+        self.areas = {}
+        self.encounters = {}
+        self.trainers = {}
+        self.shops = {}
+        self.progression = {}
+
+    @classmethod
+    def load_from_directory(cls, data_dir=DATA_DIR):
+        data = cls()
+        data.species = {s["DexNumber"]: s for s in load_json(data_dir, "species")}
+        data.moves = {m["id"]: m for m in load_json(data_dir, "moves")}
+        data.type_chart = {(e["attacking"], e["defending"]): e["multiplier"]
+                           for e in load_json(data_dir, "type_chart")["entries"]}
+        data.evolutions = load_json(data_dir, "evolutions")
+        data.items = {i["id"]: i for i in load_json(data_dir, "items", [])}
+        data.learnsets = {int(k): v for k, v in load_json(data_dir, "learnsets", {}).items()}
+        data.areas = {a["id"]: a for a in load_json(data_dir, "areas", [])}
+        data.encounters = {e["areaId"]: e for e in load_json(data_dir, "encounters", [])}
+        trainers = load_json(data_dir, "trainers", [])
+        from dialog_table import resolve
+        resolve(trainers, load_json(data_dir, "dialog_strings", {}))
+        data.trainers = {t["id"]: t for t in trainers}
+        data.shops = {s["id"]: s for s in load_json(data_dir, "shops", [])}
+        data.progression = load_json(data_dir, "progression", {})
+        return data
+
+    def effectiveness(self, attacking, defending):
+        return self.type_chart.get((attacking, defending), 1.0)
+
+    def total_effectiveness(self, attacking, defending1, defending2=None):
+        eff = self.effectiveness(attacking, defending1)
+        if defending2:
+            eff *= self.effectiveness(attacking, defending2)
+        return eff
+
+    def evolutions_from(self, species_id):
+        return [e for e in self.evolutions if e["fromSpeciesId"] == species_id]
+
+    def default_moves(self, species_id, level):
+        """Move ids a Pokemon knows at a level: the last 4 learned, as GetDefaultMoves.
+
+        Falls back to Tackle like the trainer and wild encounter builders do.
+        """
+        learned = [e for e in self.learnsets.get(species_id, []) if e["level"] <= level]
+        # OrderByDescending is a stable sort
+        learned.sort(key=lambda e: e["level"], reverse=True)
+        moves = [e["moveId"] for e in learned[:4]]
+        return moves or [FALLBACK_MOVE_ID]
@@ -0,0 +1,323 @@
+"""Port of MapGenerator: the procedural area layouts, trainer and item placement.
+
+Reproduces MapGenerator.Generate for a MapGenerator built without an rng (as
+OverworldScreen does), where every random choice is seeded from
+MapGenerator.StableHash of the area id. Layers are flat lists indexed
+y * width + x like MapData's; events are dicts with the EventTrigger fields
+that matter for placement (x, y, type, trainerId, itemId, facing).
+"""
+from dotnet_random import DotNetRandom, _int32
+
+# TileType values
+VOID, GRASS, TALL_GRASS, PATH, TREE, WATER, ROCK_WALL, BUILDING_WALL, DOOR = range(9)
+SIGN, FLOOR_TILE, CARPET = 11, 14, 15
+
+UP, DOWN, LEFT, RIGHT = "Up", "Down", "Left", "Right"
+STEP = {UP: (0, -1), DOWN: (0, 1), LEFT: (-1, 0), RIGHT: (1, 0)}
+
+
+def stable_hash(value):
+    """MapGenerator.StableHash: FNV-1a over UTF-16 code units, as a C# int."""
+    h = 2166136261
+    data = value.encode("utf-16-le")
+    for i in range(0, len(data), 2):
+        h ^= data[i] | data[i + 1] << 8
+        h = h * 16777619 & 0xFFFFFFFF
+    return _int32(h)
+
+
+class MapData:
+    def __init__(self, area_id, width, height):
+        self.id = area_id
+        self.width = width
+        self.height = height
+        size = width * height
+        self.ground = [0] * size
+        self.objects = [0] * size
+        self.collision = [False] * size
+        self.encounter = [False] * size
+        self.events = []
+        self.connections = []
+        self.warps = []
+
+    def trainer_events(self):
+        return [e for e in self.events if e.get("trainerId") is not None]
+
+
+def generate(area, data):
+    area_type = area.get("type")
+    if area_type in ("Town", "City"):
+        return _town(area, data)
+    if area_type == "Route":
+        return _route(area, data)
+    if area_type in ("Cave", "DungeonFloor"):
+        return _cave(area, data)
+    if area_type == "Building":
+        return _gym(area, data) if "gym" in area["id"] else _building(area, data)
+    return _generic(area, data)
+
+
+def _town(area, data):
+    w, h = 20, 15
+    m = MapData(area["id"], w, h)
+    _fill(m.ground, w, 0, 0, w, h, GRASS)
+    _border(m, TREE)
+    path_x = w // 2
+    _fill(m.ground, w, path_x - 1, 1, 3, h - 2, PATH)
+    _fill(m.ground, w, 1, h // 2, w - 2, 1, PATH)
+    if area.get("hasPokemonCenter"):
+        _building_block(m, 3, 2, 5, 4, BUILDING_WALL, DOOR)
+        _set(m.objects, w, 2, 6, SIGN)
+        m.collision[6 * w + 2] = True
+        m.events.append({"x": 2, "y": 6, "type": "sign"})
+        m.events.append({"x": 5, "y": 6, "type": "npc", "facing": DOWN})
+    if area.get("hasPokeMart"):
+        _building_block(m, 12, 2, 5, 4, BUILDING_WALL, DOOR)
+        _set(m.objects, w, 17, 6, SIGN)
+        m.collision[6 * w + 17] = True
+        m.events.append({"x": 17, "y": 6, "type": "sign"})
+        m.events.append({"x": 14, "y": 6, "type": "npc", "facing": DOWN})
+    _edge_exits(m, area)
+    _trainers(m, area, data)
+    _items(m, area)
+    m.events.append({"x": path_x, "y": h - 2, "type": "sign"})
+    return m
+
+
+def _route(area, data):
+    vertical = any("north" in c["direction"].lower() or "south" in c["direction"].lower()
+                   for c in area.get("connections", []))
+    w, h = (15, 25) if vertical else (25, 15)
+    m = MapData(area["id"], w, h)
+    _fill(m.ground, w, 0, 0, w, h, GRASS)
+    _border(m, TREE)
+    if vertical:
+        _fill(m.ground, w, w // 2 - 1, 0, 3, h, PATH)
+        if area.get("hasWildEncounters"):
+            _tall_grass(m, 2, 3, 4, 5)
+            _tall_grass(m, 2, 14, 4, 5)
+            _tall_grass(m, w - 6, 6, 4, 5)
+            _tall_grass(m, w - 6, 17, 4, 5)
+    else:
+        _fill(m.ground, w, 0, h // 2 - 1, w, 3, PATH)
+        if area.get("hasWildEncounters"):
+            _tall_grass(m, 3, 2, 5, 4)
+            _tall_grass(m, 14, 2, 5, 4)
+            _tall_grass(m, 7, h - 6, 5, 4)
+            _tall_grass(m, 17, h - 6, 5, 4)
+    _edge_exits(m, area)
+    _trainers(m, area, data)
+    _items(m, area)
+    return m
+
+
+def _cave(area, data):
+    w, h = 18, 15
+    m = MapData(area["id"], w, h)
+    _fill(m.ground, w, 0, 0, w, h, VOID)
+    _border(m, ROCK_WALL)
+    _fill(m.ground, w, 2, 2, w - 4, h - 4, PATH)
+    rng = DotNetRandom(stable_hash(area["id"]))
+    for _ in range(6):
+        rx = rng.next(3, w - 3)
+        ry = rng.next(3, h - 3)
+        _set(m.objects, w, rx, ry, ROCK_WALL)
+        m.collision[ry * w + rx] = True
+    if area.get("hasWildEncounters"):
+        for y in range(2, h - 2):
+            for x in range(2, w - 2):
+                if not m.collision[y * w + x]:
+                    m.encounter[y * w + x] = True
+    _edge_exits(m, area)
+    _trainers(m, area, data)
+    _items(m, area)
+    return m
+
+
+def _gym(area, data):
+    w, h = 10, 14
+    m = MapData(area["id"], w, h)
+    _fill(m.ground, w, 0, 0, w, h, CARPET)
+    _border(m, BUILDING_WALL)
+    _fill(m.ground, w, 4, 1, 2, h - 2, PATH)
+    _set(m.ground, w, 4, h - 1, DOOR)
+    _set(m.ground, w, 5, h - 1, DOOR)
+    m.collision[(h - 1) * w + 4] = False
+    m.collision[(h - 1) * w + 5] = False
+
+    leader, regular = -1, []
+    for trainer_id in area.get("trainers", []):
+        trainer = data.trainers.get(trainer_id)
+        if trainer is not None and trainer.get("isGymLeader"):
+            leader = trainer_id
+        else:
+            regular.append(trainer_id)
+    if leader >= 0:
+        m.events.append({"x": 5, "y": 2, "type": "npc", "trainerId": leader, "facing": DOWN})
+        m.collision[2 * w + 5] = True
+    for i, trainer_id in enumerate(regular):
+        if trainer_id not in data.trainers:
+            continue
+        ty = 4 + i * 3
+        if ty >= h - 2:
+            ty = h - 3
+        tx = 3 if i % 2 == 0 else 6
+        m.events.append({"x": tx, "y": ty, "type": "npc", "trainerId": trainer_id, "facing": DOWN})
+        m.collision[ty * w + tx] = True
+    _door_exit(m, area)
+    return m
+
+
+def _building(area, data):
+    w, h = 10, 10
+    m = MapData(area["id"], w, h)
+    _fill(m.ground, w, 0, 0, w, h, FLOOR_TILE)
+    _border(m, BUILDING_WALL)
+    _set(m.ground, w, w // 2, h - 1, DOOR)
+    m.collision[(h - 1) * w + w // 2] = False
+    _trainers(m, area, data)
+    _items(m, area)
+    _door_exit(m, area)
+    return m
+
+
+def _generic(area, data):
+    w, h = 15, 15
+    m = MapData(area["id"], w, h)
+    _fill(m.ground, w, 0, 0, w, h, GRASS)
+    _border(m, TREE)
+    _fill(m.ground, w, w // 2 - 1, 0, 3, h, PATH)
+    _fill(m.ground, w, 0, h // 2, w, 1, PATH)
+    if area.get("hasWildEncounters"):
+        _tall_grass(m, 2, 2, 4, 4)
+        _tall_grass(m, w - 6, h - 6, 4, 4)
+    _edge_exits(m, area)
+    _trainers(m, area, data)
+    _items(m, area)
+    return m
+
+
+def _fill(layer, map_width, x, y, w, h, tile):
+    for dy in range(h):
+        for dx in range(w):
+            idx = (y + dy) * map_width + (x + dx)
+            if 0 <= idx < len(layer):
+                layer[idx] = tile
+
+
+def _set(layer, map_width, x, y, tile):
+    idx = y * map_width + x
+    if 0 <= idx < len(layer):
+        layer[idx] = tile
+
+
+def _border(m, tile):
+    w, h = m.width, m.height
+    for x in range(w):
+        _set(m.objects, w, x, 0, tile)
+        _set(m.objects, w, x, h - 1, tile)
+        m.collision[x] = True
+        m.collision[(h - 1) * w + x] = True
+    for y in range(h):
+        _set(m.objects, w, 0, y, tile)
+        _set(m.objects, w, w - 1, y, tile)
+        m.collision[y * w] = True
+        m.collision[y * w + w - 1] = True
+
+
+def _tall_grass(m, x, y, w, h):
+    for dy in range(h):
+        for dx in range(w):
+            px, py = x + dx, y + dy
+            if px <= 0 or px >= m.width - 1 or py <= 0 or py >= m.height - 1:
+                continue
+            idx = py * m.width + px
+            if m.collision[idx]:
+                continue
+            m.objects[idx] = TALL_GRASS
+            m.encounter[idx] = True
+
+
+def _building_block(m, x, y, bw, bh, wall, door):
+    w = m.width
+    for dy in range(bh):
+        for dx in range(bw):
+            _set(m.objects, w, x + dx, y + dy, wall)
+            m.collision[(y + dy) * w + x + dx] = True
+    door_x, door_y = x + bw // 2, y + bh
+    _set(m.objects, w, door_x, door_y, door)
+    m.collision[door_y * w + door_x] = False
+
+
+def parse_direction(direction):
+    lower = direction.lower()
+    if "north" in lower or lower == "up":
+        return UP
+    if "south" in lower or lower == "down":
+        return DOWN
+    if "west" in lower or lower == "left":
+        return LEFT
+    if "east" in lower or lower == "right":
+        return RIGHT
+    return None
+
+
+def _edge_exits(m, area):
+    w, h = m.width, m.height
+    for conn in area.get("connections", []):
+        direction = parse_direction(conn["direction"])
+        if direction is None:
+            continue
+        m.connections.append((direction, conn["areaId"]))
+        if direction in (UP, DOWN):
+            row = 0 if direction == UP else h - 1
+            tiles = [row * w + x for x in range(w // 2 - 1, w // 2 + 2) if 0 <= x < w]
+        else:
+            column = 0 if direction == LEFT else w - 1
+            tiles = [y * w + column for y in range(h // 2 - 1, h // 2 + 2) if 0 <= y < h]
+        for idx in tiles:
+            m.objects[idx] = PATH
+            m.collision[idx] = False
+            m.ground[idx] = PATH
+
+
+def _door_exit(m, area):
+    connections = area.get("connections", [])
+    if connections:
+        m.warps.append({"x": m.width // 2, "y": m.height - 1, "targetMapId": connections[0]["areaId"]})
+
+
+def _trainers(m, area, data):
+    placed = 0
+    for trainer_id in area.get("trainers", []):
+        trainer = data.trainers.get(trainer_id)
+        if trainer is None or trainer.get("isGymLeader"):
+            continue
+        x, y = find_open_position(m, placed)
+        m.events.append({"x": x, "y": y, "type": "npc", "trainerId": trainer_id, "facing": DOWN})
+        m.collision[y * m.width + x] = True
+        placed += 1
+
+
+def _items(m, area):
+    for placed, item in enumerate(area.get("items", [])):
+        x, y = find_open_position(m, placed + 100)
+        m.events.append({"x": x, "y": y, "type": "item", "itemId": item["itemId"]})
+
+
+def find_open_position(m, seed):
+    w, h = m.width, m.height
+    rng = DotNetRandom(_int32(stable_hash(m.id) + seed))
+    occupied = {(e["x"], e["y"]) for e in m.events}
+    for _ in range(100):
+        x = rng.next(2, w - 2)
+        y = rng.next(2, h - 2)
+        idx = y * w + x
+        if not m.collision[idx] and m.ground[idx] == PATH and (x, y) not in occupied:
+            return x, y
+    for _ in range(100):
+        x = rng.next(2, w - 2)
+        y = rng.next(2, h - 2)
+        if not m.collision[y * w + x] and (x, y) not in occupied:
+            return x, y
+    return w // 2, h // 2
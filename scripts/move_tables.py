@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""Precompute expected damage of every move against every defending type pair.
+
+battle_calc.expected_damage for a reference matchup, evaluated with NumPy for
+all moves, both STAB cases and all 15 x 15 defender type pairs at once. The
+reference attacker and defender are level 50 with base-80 stats under the
+trainer DV policy and base speed 80 (the crit rate for HighCrit moves is
+255/256, for the rest 40/256). Accuracy, crit chance, the 217-255 random roll,
+multi-hit, charge/recharge turns and the fixed-damage effects are all folded
+in, keeping the C# integer truncation. Output goes to data/tables/:
+
+  move_value.f32  float32 little-endian, shape (3, max move id + 1, 2, 15, 15):
+                  [measure, moveId, stab, defender type1, defender type2]
+                  measures: perUse (one use, i.e. one PP), perTurn (perUse
+                  spread over the turns a Charge/Recharge move takes) and
+                  perMaxPp (perUse * maxPP)
+  move_value.json manifest in the tables.json format, with the reference
+                  matchup (stat_tables.load_table(out_dir, "moveValue",
+                  "move_value.json") memory-maps the table)
+
+A mono-typed defender is the pair (t, t). Types are in PokemonType order
+(gamedata.TYPES); status moves are 0. Values scale roughly linearly with
+attack / defense, so they rank moves for any matchup; absolute damage for a
+real matchup still needs battle_calc.
+
+Usage:
+    python scripts/move_tables.py [--data-dir DIR] [--out-dir DIR] [--verify]
+    python scripts/move_tables.py --top 10 --against Water Ground
+"""
+import argparse, json, os
+
+import numpy as np
+
+from battle_calc import (MULTI_HIT_EXPECTED, RANDOM_MAX, RANDOM_MIN, TRAINER_DV, TRAINER_STAT_EXP,
+                         accuracy_threshold, calculate_hp, calculate_stat, crit_threshold,
+                         expected_damage, hp_dv)
+from gamedata import DATA_DIR, TYPE_INDEX, TYPES, GameData
+
+REFERENCE_LEVEL = 50
+REFERENCE_BASE_STAT = 80
+MEASURES = ("perUse", "perTurn", "perMaxPp")
+TWO_TURN_EFFECTS = ("Charge", "Recharge")
+
+
+def reference_stats(level=REFERENCE_LEVEL, base=REFERENCE_BASE_STAT):
+    stat = calculate_stat(base, TRAINER_DV, TRAINER_STAT_EXP, level)
+    dv = hp_dv(TRAINER_DV, TRAINER_DV, TRAINER_DV, TRAINER_DV)
+    return {"hp": calculate_hp(base, dv, TRAINER_STAT_EXP, level),
+            "attack": stat, "defense": stat, "special": stat, "speed": stat}
+
+
+def effectiveness_matrix(data):
+    """float [attacking type, defending type] from the type chart."""
+    eff = np.ones((len(TYPES), len(TYPES)))
+    for (attacking, defending), multiplier in data.type_chart.items():
+        if attacking in TYPE_INDEX and defending in TYPE_INDEX:
+            eff[TYPE_INDEX[attacking], TYPE_INDEX[defending]] = multiplier
+    return eff
+
+
+def rolled_mean(damage, total_eff):
+    """Mean over the 217-255 rolls of integer damage, as damage_rolls does."""
+    rolls = np.arange(RANDOM_MIN, RANDOM_MAX + 1)
+    spread = damage[..., None] * rolls // 255
+    rolled = np.where(damage[..., None] > 1, spread, damage[..., None])
+    rolled = np.maximum(rolled, 1)
+    return np.where(total_eff == 0, 0.0, rolled.mean(axis=-1))
+
+
+def move_value_table(data, level=REFERENCE_LEVEL, base=REFERENCE_BASE_STAT):
+    """float32 array [measure, moveId, stab, type1, type2]; see the module docstring."""
+    stats = reference_stats(level, base)
+    moves = sorted(data.moves.values(), key=lambda m: m["id"])
+    n = max(m["id"] for m in moves) + 1
+    ids = np.array([m["id"] for m in moves])
+    power = np.array([max(m["power"], 0) for m in moves], dtype=np.int64)
+    effects = np.array([m["effect"] for m in moves])
+    move_type = np.array([TYPE_INDEX[m["type"]] for m in moves])
+    hit = np.array([1.0 if m["effect"] == "Swift" else accuracy_threshold(m["accuracy"]) / 256.0
+                    for m in moves])
+    p_crit = np.array([crit_threshold(base, m["highCritRate"]) / 256.0 for m in moves])
+    max_pp = np.array([m["maxPP"] for m in moves])
+
+    # Defender axis pair: eff1 for type1, eff2 for type2 unless mono-typed
+    chart = effectiveness_matrix(data)[move_type]                      # [move, type]
+    eff1 = np.broadcast_to(chart[:, :, None], (len(moves), len(TYPES), len(TYPES)))
+    eff2 = np.broadcast_to(chart[:, None, :], eff1.shape).copy()
+    mono = np.eye(len(TYPES), dtype=bool)
+    eff2[:, mono] = 1.0
+    total_eff = eff1 * eff2
+
+    # Attack equals defense, so the stat ratio is 1; Explosion halves defense
+    attack = stats["attack"]
+    defense = np.where(effects == "Explosion", max(1, stats["defense"] // 2), stats["defense"])
+    per_hit = np.zeros((len(moves), 2, len(TYPES), len(TYPES)))
+    for critical in (False, True):
+        damage = (2 * level * (2 if critical else 1)) // 5 + 2
+        damage = damage * power * attack // defense // 50 + 2            # [move]
+        for stab in (0, 1):
+            d = damage * 3 // 2 if stab else damage
+            # int(int(d * eff1) * eff2) like the C# casts
+            d = np.floor(np.floor(d[:, None, None] * eff1) * eff2).astype(np.int64)
+            weight = p_crit if critical else 1 - p_crit
+            per_hit[:, stab] += weight[:, None, None] * rolled_mean(d, total_eff)
+
+    hits = np.select([effects == "MultiHit", effects == "DoubleHit"], [MULTI_HIT_EXPECTED, 2.0], 1.0)
+    per_use = per_hit * (hits * hit)[:, None, None, None]
+    per_use[power <= 0] = 0.0
+
+    # Effects that ignore the damage formula
+    fixed = {"FixedDamage20": 20.0, "FixedDamage40": 40.0,
+             "Psywave": (1 + int(level * 1.5)) / 2.0, "SuperFang": float(max(1, stats["hp"] // 2)),
+             "LevelDamage": float(level), "OHKO": float(stats["hp"])}
+    for effect, amount in fixed.items():
+        rows = effects == effect
+        value = amount * hit[rows][:, None, None, None]
+        if effect in ("LevelDamage", "OHKO"):
+            # Immune defenders take nothing; the equal-speed reference lets OHKO land
+            value = value * (total_eff[rows] != 0)[:, None]
+        per_use[rows] = np.broadcast_to(value, per_use[rows].shape)
+
+    turns = np.where(np.isin(effects, TWO_TURN_EFFECTS), 2.0, 1.0)
+    table = np.zeros((len(MEASURES), n, 2, len(TYPES), len(TYPES)), dtype=np.float32)
+    table[0, ids] = per_use
+    table[1, ids] = per_use / turns[:, None, None, None]
+    table[2, ids] = per_use * max_pp[:, None, None, None]
+    return table
+
+
+def write_table(out_dir, table, level=REFERENCE_LEVEL, base=REFERENCE_BASE_STAT):
+    os.makedirs(out_dir, exist_ok=True)
+    table.astype("<f4").tofile(os.path.join(out_dir, "move_value.f32"))
+    manifest = {"moveValue": {
+        "file": "move_value.f32", "dtype": "<f4", "shape": list(table.shape),
+        "axes": ["measure", "moveId", "stab", "defenderType1", "defenderType2"],
+        "measures": list(MEASURES), "types": TYPES,
+        "reference": {"level": level, "baseStat": base, "baseSpeed": base, "dv": TRAINER_DV,
+                      "stats": reference_stats(level, base)},
+    }}
+    with open(os.path.join(out_dir, "move_value.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+
+
+def verify(data, table, level=REFERENCE_LEVEL, base=REFERENCE_BASE_STAT):
+    """Compare the perTurn measure with battle_calc.expected_damage for every cell."""
+    stats = reference_stats(level, base)
+    defender_species = {}
+    for t1 in TYPES:
+        for t2 in TYPES:
+            defender_species[t1, t2] = {"Type1": t1, "Type2": None if t1 == t2 else t2, "BaseSpeed": base}
+    mismatches = 0
+    for move in data.moves.values():
+        other = next(t for t in TYPES if t != move["type"])
+        for stab in (0, 1):
+            attacker = {"species": {"Type1": move["type"] if stab else other, "Type2": None, "BaseSpeed": base},
+                        "level": level, "stats": stats}
+            for (t1, t2), species in defender_species.items():
+                defender = {"species": species, "level": level, "stats": stats}
+                expected = expected_damage(data, attacker, defender, move)
+                got = table[1, move["id"], stab, TYPE_INDEX[t1], TYPE_INDEX[t2]]
+                if not np.isclose(got, expected, rtol=1e-6, atol=1e-4):
+                    mismatches += 1
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--out-dir", default=os.path.join(DATA_DIR, "tables"))
+    parser.add_argument("--verify", action="store_true",
+                        help="check every entry against battle_calc.expected_damage")
+    parser.add_argument("--top", type=int, help="print the best moves instead of writing the table")
+    parser.add_argument("--against", nargs="+", metavar="TYPE", default=["Normal"],
+                        help="defender type(s) for --top")
+    parser.add_argument("--measure", choices=MEASURES, default="perTurn")
+    args = parser.parse_args()
+
+    data = GameData.load_from_directory(args.data_dir)
+    table = move_value_table(data)
+    if args.top:
+        t1 = TYPE_INDEX[args.against[0]]
+        t2 = TYPE_INDEX[args.against[-1]]
+        values = table[MEASURES.index(args.measure), :, :, t1, t2]
+        order = np.argsort(-values[:, 1], kind="stable")[:args.top]
+        print(f"{'move':<14} {'type':<9} {'no STAB':>8} {'STAB':>8}  ({args.measure} vs "
+              f"{'/'.join(dict.fromkeys(args.against))})")
+        for move_id in order:
+            move = data.moves.get(int(move_id))
+            if move:
+                print(f"{move['name']:<14} {move['type']:<9} {values[move_id, 0]:>8.1f} {values[move_id, 1]:>8.1f}")
+        return
+
+    write_table(args.out_dir, table)
+    print(f"move_value {table.shape} ({table.nbytes} bytes) written to {args.out_dir}")
+    if args.verify:
+        mismatches = verify(data, table)
+        print(f"{mismatches} mismatches against battle_calc.expected_damage")
+        if mismatches:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Check battle_engine.py against battles recorded from the C# BattleEngine.
+
+Each line of the fixture file is a BattleLog written by BattleRecorder: the
+seed, the trainer id, both parties (species, level, DVs, moves) and for every
+turn the move indices both sides picked, the party index the player sent out
+after a faint, and the events the engine produced. Every battle is replayed in
+the Python engine with a DotNetRandom seeded the same way and the two event
+streams are compared turn by turn. The opponent party is also checked against
+the trainer generate_trainers.py builds for that id, so a log recorded from
+stale trainer data is reported instead of silently replayed.
+
+By default only the events that carry the battle's outcome are compared
+(COMPARED_EVENTS); --all-events compares everything, including Text.
+
+Battles are replayed in parallel, one chunk per worker process; the first
+diverging event of each failing battle is reported.
+
+Usage:
+    python scripts/parity_harness.py                             # tests/fixtures/battle_logs.jsonl
+    python scripts/parity_harness.py /tmp/battles.jsonl --workers 8
+    python scripts/parity_harness.py --all-events --json
+
+Record more battles by running the Fixtures_MatchEngine test with
+RECORD_BATTLE_FIXTURES=1, or call BattleRecorder.Record for any seed range.
+"""
+import argparse, json, os
+from multiprocessing import Pool
+
+from battle_engine import PLAYER, BattleEngine, BattleState, Pokemon
+from dotnet_random import DotNetRandom
+from gamedata import DATA_DIR, ROOT_DIR, GameData
+from generate_trainers import get_trainer
+
+FIXTURE_PATH = os.path.join(ROOT_DIR, "tests", "fixtures", "battle_logs.jsonl")
+
+COMPARED_EVENTS = ("MoveUsed", "DamageDealt", "MoveMissed", "StatusApplied", "Fainted", "HpChanged")
+
+_data = None
+
+
+def _init_worker(data_dir):
+    global _data
+    _data = GameData.load_from_directory(data_dir)
+
+
+def load_logs(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def party_mismatch(log):
+    """Description of how the log's opponent party differs from generate_trainers, or None."""
+    try:
+        trainer = get_trainer(log["trainerId"])
+    except KeyError:
+        return f"trainer {log['trainerId']} is not generated by generate_trainers.py"
+    expected = [(p["speciesId"], p["level"]) for p in trainer["party"]]
+    recorded = [(p["speciesId"], p["level"]) for p in log["opponent"]]
+    if expected != recorded:
+        return f"opponent party {recorded} does not match trainer {log['trainerId']} {expected}"
+    return None
+
+
+def build_state(data, log):
+    def party(specs):
+        return [Pokemon(p["speciesId"], p["level"], p["dvs"], p["moves"], data) for p in specs]
+    return BattleState(party(log["player"]), party(log["opponent"]), data)
+
+
+def _normalize(event):
+    # JSON floats such as 1.0 come back as ints; compare numbers by value
+    return [float(v) if isinstance(v, (int, float)) and not isinstance(v, bool) else v for v in event]
+
+
+def replay(data, log, event_names=COMPARED_EVENTS):
+    """Replay one log; returns a result dict with the first divergence, if any."""
+    result = {"seed": log["seed"], "trainerId": log["trainerId"], "turns": len(log["turns"]),
+              "divergence": None}
+    problem = party_mismatch(log)
+    if problem:
+        result["divergence"] = {"turn": 0, "index": 0, "expected": None, "actual": None, "reason": problem}
+        return result
+
+    def keep(event):
+        return event_names is None or event[0] in event_names
+
+    state = build_state(data, log)
+    engine = BattleEngine(state, data, DotNetRandom(log["seed"]))
+    for turn_number, turn in enumerate(log["turns"], 1):
+        actual = [list(e) for e in engine.execute_turn(("fight", turn["playerMove"]),
+                                                       ("fight", turn["opponentMove"])) if keep(e)]
+        expected = [e for e in turn["events"] if keep(e)]
+        for index in range(max(len(actual), len(expected))):
+            exp = expected[index] if index < len(expected) else None
+            act = actual[index] if index < len(actual) else None
+            if exp is None or act is None or _normalize(exp) != _normalize(act):
+                result["divergence"] = {"turn": turn_number, "index": index,
+                                        "expected": exp, "actual": act}
+                return result
+        if turn.get("playerSwitch") is not None:
+            engine.send_out(PLAYER, turn["playerSwitch"])
+
+    if state.outcome != log.get("outcome"):
+        result["divergence"] = {"turn": len(log["turns"]), "index": None,
+                                "expected": log.get("outcome"), "actual": state.outcome,
+                                "reason": "battle outcome differs"}
+    return result
+
+
+def _replay_chunk(job):
+    logs, event_names = job
+    return [replay(_data, log, event_names) for log in logs]
+
+
+def run(logs, data_dir=DATA_DIR, event_names=COMPARED_EVENTS, workers=None):
+    workers = max(1, min(workers or os.cpu_count() or 1, len(logs) or 1))
+    size = -(-len(logs) // (workers * 4)) if logs else 1
+    jobs = [(logs[i:i + size], event_names) for i in range(0, len(logs), size)]
+    with Pool(workers, initializer=_init_worker, initargs=(data_dir,)) as pool:
+        return [r for chunk in pool.map(_replay_chunk, jobs) for r in chunk]
+
+
+def print_report(results, limit):
+    failures = [r for r in results if r["divergence"]]
+    for r in failures[:limit]:
+        d = r["divergence"]
+        where = f"turn {d['turn']}" + (f", event {d['index']}" if d["index"] is not None else "")
+        print(f"seed {r['seed']} trainer {r['trainerId']}: diverges at {where}")
+        if d.get("reason"):
+            print(f"    {d['reason']}")
+        else:
+            print(f"    expected {json.dumps(d['expected'])}")
+            print(f"    actual   {json.dumps(d['actual'])}")
+    if len(failures) > limit:
+        print(f"... and {len(failures) - limit} more")
+    turns = sum(r["turns"] for r in results)
+    print(f"{len(results) - len(failures)}/{len(results)} battles match ({turns} turns)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("fixtures", nargs="?", default=FIXTURE_PATH, help="JSONL battle logs")
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--events", help="comma-separated event names to compare")
+    parser.add_argument("--all-events", action="store_true", help="compare every event, including Text")
+    parser.add_argument("--limit", type=int, default=20, help="divergences to print")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+
+    event_names = None if args.all_events else \
+        tuple(args.events.split(",")) if args.events else COMPARED_EVENTS
+    results = run(load_logs(args.fixtures), args.data_dir, event_names, args.workers)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_report(results, args.limit)
+    if any(r["divergence"] for r in results):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
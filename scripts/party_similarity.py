@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""Find trainers whose parties are near-duplicates of each other.
+
+Every party is embedded as a fixed-length float32 vector, in blocks:
+
+  species   share of the party per species (species ids beyond
+            MAX_SPECIES_DIMS are folded onto id % MAX_SPECIES_DIMS)
+  types     share of members per type, a dual-typed member counting for both
+  levels    mean, min and max level / LEVEL_SCALE
+  size      party size / SIZE_SCALE
+  stats     mean calculated stat per stat (trainer DV policy) / STAT_SCALE
+
+and two parties are near-duplicates when the Euclidean distance between their
+vectors is at most --radius. Swapping one of two species moves a party about
+0.7, a level shift of 4 across the party about 0.35, so the default radius
+catches parties with the same species a couple of levels apart. Parties
+within the radius of each other are chained into clusters; a cluster is
+"within" when all its trainers share an area and "across" otherwise.
+
+The search is blocked matrix algebra: identical vectors are collapsed first,
+rows are sorted by their projection on the top principal component (a lower
+bound on the distance), and each batch of rows is compared with only the
+rows whose projection is within the radius, in tiles of matrix products.
+Each tile's pairs are merged into the cluster labels straight away with
+vectorized label propagation, so memory stays at the vectors plus one tile
+however many pairs there are.
+
+Parties come from data/world/trainers.json, from any trainers.json-format
+file (--trainers, e.g. a randomized league or a synth_world.py directory's
+trainers) or straight from generate_trainers.py (--generated).
+
+Usage:
+    python scripts/party_similarity.py [--data-dir DIR] [--radius 0.3] [--limit 20]
+    python scripts/party_similarity.py --trainers /tmp/league/trainers.json --json
+    python scripts/party_similarity.py --near 320 --k 5
+"""
+import argparse, json, os
+
+import numpy as np
+
+from gamedata import DATA_DIR, TYPE_INDEX, TYPES, data_path, iter_json_array, load_json
+from stat_tables import BASE_FIELDS, base_stat_array, calculated_stats
+
+MAX_SPECIES_DIMS = 256
+TYPE_WEIGHT = 0.5
+LEVEL_SCALE = 20.0
+SIZE_SCALE = 8.0
+STAT_SCALE = 400.0
+DEFAULT_RADIUS = 0.3
+DEFAULT_BATCH = 2048
+DEFAULT_TILE = 16384
+CHUNK = 1 << 16
+
+
+class FeatureSpace:
+    """Layout of the party vectors for one species list."""
+
+    def __init__(self, species):
+        self.base = base_stat_array(species)
+        self.species_dims = min(len(self.base), MAX_SPECIES_DIMS)
+        self.type1 = np.full(len(self.base), -1, dtype=np.int64)
+        self.type2 = np.full(len(self.base), -1, dtype=np.int64)
+        for s in species:
+            self.type1[s["DexNumber"]] = TYPE_INDEX.get(s["Type1"], -1)
+            if s.get("Type2") and s["Type2"] != s["Type1"]:
+                self.type2[s["DexNumber"]] = TYPE_INDEX.get(s["Type2"], -1)
+        self.type_offset = self.species_dims
+        self.level_offset = self.type_offset + len(TYPES)
+        self.size_offset = self.level_offset + 3
+        self.stat_offset = self.size_offset + 1
+        self.dims = self.stat_offset + len(BASE_FIELDS)
+
+    def embed(self, species_ids, levels, sizes):
+        """float32 [party, dims] for parties given as flat member arrays; sizes must be > 0."""
+        n = len(sizes)
+        row = np.repeat(np.arange(n), sizes)
+        starts = np.cumsum(sizes) - sizes
+        known = (species_ids >= 0) & (species_ids < len(self.base))
+        dex = np.where(known, species_ids, 0)
+        share = 1.0 / sizes
+
+        features = np.zeros((n, self.dims), dtype=np.float32)
+        counts = np.bincount(row * self.species_dims + species_ids % self.species_dims,
+                             minlength=n * self.species_dims)
+        features[:, :self.species_dims] = counts.reshape(n, -1) * share[:, None]
+
+        types = np.zeros(n * len(TYPES))
+        for column in (self.type1[dex], self.type2[dex]):
+            typed = column >= 0
+            types += np.bincount(row[typed] * len(TYPES) + column[typed], minlength=n * len(TYPES))
+        features[:, self.type_offset:self.level_offset] = \
+            types.reshape(n, -1) * (share * TYPE_WEIGHT)[:, None]
+
+        features[:, self.level_offset] = np.add.reduceat(levels, starts) * share / LEVEL_SCALE
+        features[:, self.level_offset + 1] = np.minimum.reduceat(levels, starts) / LEVEL_SCALE
+        features[:, self.level_offset + 2] = np.maximum.reduceat(levels, starts) / LEVEL_SCALE
+        features[:, self.size_offset] = sizes / SIZE_SCALE
+
+        stats = calculated_stats(self.base[dex], levels)
+        features[:, self.stat_offset:] = np.add.reduceat(stats, starts, axis=0) * share[:, None] / STAT_SCALE
+        return features
+
+
+class PartyIndex:
+    """Party vectors plus enough of each trainer to report on it."""
+
+    def __init__(self, space):
+        self.space = space
+        self.features = np.zeros((0, space.dims), dtype=np.float32)
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.area_codes = np.zeros(0, dtype=np.int32)
+        self.areas = []
+        self.names = []
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.member_species = np.zeros(0, dtype=np.int32)
+        self.member_levels = np.zeros(0, dtype=np.int16)
+        self.skipped = 0
+
+    @classmethod
+    def build(cls, trainers, species, chunk=CHUNK):
+        index = cls(FeatureSpace(species))
+        area_index = {}
+        parts = {"features": [], "ids": [], "area_codes": [], "sizes": [], "species": [], "levels": []}
+        batch = []
+
+        def flush():
+            sizes = np.array([len(t["party"]) for t in batch], dtype=np.int64)
+            ids = np.fromiter((m["speciesId"] for t in batch for m in t["party"]), dtype=np.int64)
+            levels = np.fromiter((m["level"] for t in batch for m in t["party"]), dtype=np.int64)
+            parts["features"].append(index.space.embed(ids, levels, sizes))
+            parts["ids"].append(np.array([t["id"] for t in batch], dtype=np.int64))
+            parts["area_codes"].append(np.array(
+                [area_index.setdefault(t.get("areaId"), len(area_index)) for t in batch], dtype=np.int32))
+            parts["sizes"].append(sizes)
+            parts["species"].append(ids.astype(np.int32))
+            parts["levels"].append(levels.astype(np.int16))
+            index.names.extend(f"{t.get('class', '')} {t.get('name', '')}".strip() for t in batch)
+            batch.clear()
+
+        for trainer in trainers:
+            if not trainer.get("party"):
+                index.skipped += 1
+                continue
+            batch.append(trainer)
+            if len(batch) >= chunk:
+                flush()
+        if batch:
+            flush()
+        if parts["features"]:
+            index.features = np.concatenate(parts["features"])
+            index.ids = np.concatenate(parts["ids"])
+            index.area_codes = np.concatenate(parts["area_codes"])
+            index.offsets = np.concatenate([[0], np.cumsum(np.concatenate(parts["sizes"]))])
+            index.member_species = np.concatenate(parts["species"])
+            index.member_levels = np.concatenate(parts["levels"])
+        index.areas = list(area_index)
+        return index
+
+    def __len__(self):
+        return len(self.features)
+
+    def area(self, row):
+        return self.areas[self.area_codes[row]]
+
+    def party(self, row):
+        """[(speciesId, level)] of one indexed trainer."""
+        start, end = self.offsets[row], self.offsets[row + 1]
+        return list(zip(self.member_species[start:end].tolist(), self.member_levels[start:end].tolist()))
+
+    def near_pairs(self, vectors, radius, batch=DEFAULT_BATCH, tile=DEFAULT_TILE):
+        """Yield (i, j) arrays, i < j, of rows of vectors within radius of each other, a tile at a time."""
+        key = vectors @ spread_direction(vectors)
+        order = np.argsort(key, kind="stable")
+        sorted_vectors = vectors[order]
+        sorted_key = key[order]
+        norms = np.einsum("ij,ij->i", sorted_vectors, sorted_vectors)
+        limit = radius * radius + 1e-6
+        for start in range(0, len(order), batch):
+            end = min(start + batch, len(order))
+            stop = int(np.searchsorted(sorted_key, sorted_key[end - 1] + radius + 1e-5, side="right"))
+            block = sorted_vectors[start:end]
+            for column in range(start, stop, tile):
+                last = min(column + tile, stop)
+                distance = norms[start:end, None] + norms[None, column:last] \
+                    - 2 * (block @ sorted_vectors[column:last].T)
+                if column < end:
+                    # Only pairs to later rows, so every pair is found once
+                    distance[np.tril_indices(end - start, k=start - column, m=last - column)] = np.inf
+                i, j = np.nonzero(distance <= limit)
+                if len(i):
+                    yield order[i + start], order[j + column]
+
+    def clusters(self, radius=DEFAULT_RADIUS, batch=DEFAULT_BATCH):
+        """Arrays of rows, two or more trainers each, largest cluster first."""
+        if not len(self):
+            return []
+        # Randomized leagues repeat parties verbatim; search each distinct vector once
+        rows = np.ascontiguousarray(self.features).view(np.dtype((np.void, self.features.itemsize * self.space.dims)))
+        _, first, unique_of = np.unique(rows.ravel(), return_index=True, return_inverse=True)
+        labels = np.arange(len(first))
+        for i, j in self.near_pairs(self.features[first], radius, batch):
+            labels = merge(labels, i, j)
+        labels = labels[unique_of.ravel()]
+
+        order = np.argsort(labels, kind="stable")
+        bounds = np.flatnonzero(np.diff(labels[order])) + 1
+        groups = [g for g in np.split(order, bounds) if len(g) > 1]
+        groups.sort(key=lambda g: (-len(g), int(g[0])))
+        return groups
+
+    def nearest(self, row, k=5):
+        """[(row, distance)] of the k parties closest to row, excluding itself."""
+        diff = self.features - self.features[row]
+        distance = np.sqrt(np.einsum("ij,ij->i", diff, diff))
+        distance[row] = np.inf
+        closest = np.argpartition(distance, min(k, len(distance) - 1))[:k]
+        closest = closest[np.argsort(distance[closest], kind="stable")]
+        return [(int(r), float(distance[r])) for r in closest if np.isfinite(distance[r])]
+
+
+def components(n, i, j):
+    """Component label (its smallest member) for each of n nodes joined by edges i-j."""
+    labels = np.arange(n)
+    while True:
+        low = np.minimum(labels[i], labels[j])
+        hooked = labels.copy()
+        np.minimum.at(hooked, labels[i], low)
+        np.minimum.at(hooked, labels[j], low)
+        while True:
+            jumped = hooked[hooked]
+            if np.array_equal(jumped, hooked):
+                break
+            hooked = jumped
+        if np.array_equal(hooked, labels):
+            return labels
+        labels = hooked
+
+
+def spread_direction(vectors, sample=100_000):
+    """Unit vector along which the rows spread most (top principal component).
+
+    Projections onto any unit vector differ by no more than the distance, so
+    sorting by this one bounds the search; the widest spread prunes the most.
+    """
+    if len(vectors) > sample:
+        vectors = vectors[np.random.default_rng(0).choice(len(vectors), sample, replace=False)]
+    centred = vectors - vectors.mean(axis=0)
+    _, eigenvectors = np.linalg.eigh(centred.T.astype(np.float64) @ centred)
+    return eigenvectors[:, -1].astype(np.float32)
+
+
+def merge(labels, i, j):
+    """labels (each node's component root) after also joining the edges i-j."""
+    a, b = labels[i], labels[j]
+    joined = a != b
+    if not joined.any():
+        return labels
+    roots, inverse = np.unique(np.concatenate([a[joined], b[joined]]), return_inverse=True)
+    half = int(joined.sum())
+    labels[roots] = roots[components(len(roots), inverse[:half], inverse[half:])]
+    # Old roots now point at new roots, which point at themselves
+    return labels[labels]
+
+
+def load_trainers(args):
+    if args.generated:
+        from generate_trainers import all_trainers
+        return all_trainers()
+    path = args.trainers or data_path(args.data_dir, "trainers")
+    if not os.path.exists(path):
+        raise SystemExit(f"{path} not found")
+    return iter_json_array(path)
+
+
+def cluster_record(index, rows, species_names):
+    rows = sorted(rows.tolist(), key=lambda r: int(index.ids[r]))
+    areas = sorted({index.area(r) for r in rows})
+    return {
+        "size": len(rows),
+        "scope": "within" if len(areas) == 1 else "across",
+        "areas": areas,
+        "trainers": [{"id": int(index.ids[r]), "name": index.names[r], "areaId": index.area(r),
+                      "party": [f"{species_names.get(s, s)} {level}" for s, level in index.party(r)]}
+                     for r in rows],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--trainers", help="trainers.json-format file to index instead of the data dir's")
+    source.add_argument("--generated", action="store_true",
+                        help="index generate_trainers.py's records without reading trainers.json")
+    parser.add_argument("--radius", type=float, default=DEFAULT_RADIUS, help="near-duplicate distance")
+    parser.add_argument("--batch", type=int, default=DEFAULT_BATCH, help="rows per matrix product")
+    parser.add_argument("--scope", choices=("all", "within", "across"), default="all")
+    parser.add_argument("--limit", type=int, default=20, help="clusters to print (0 for all)")
+    parser.add_argument("--json", action="store_true", help="JSON Lines: one record per cluster, then a summary")
+    parser.add_argument("--near", type=int, metavar="ID", help="print the parties closest to this trainer instead")
+    parser.add_argument("--k", type=int, default=5, help="neighbours for --near")
+    args = parser.parse_args()
+
+    species = load_json(args.data_dir, "species")
+    species_names = {s["DexNumber"]: s["Name"] for s in species}
+    index = PartyIndex.build(load_trainers(args), species)
+
+    if args.near is not None:
+        matches = np.flatnonzero(index.ids == args.near)
+        if not len(matches):
+            raise SystemExit(f"trainer {args.near} not found or has no party")
+        row = int(matches[0])
+        for r, distance in [(row, 0.0)] + index.nearest(row, args.k):
+            party = ", ".join(f"{species_names.get(s, s)} {level}" for s, level in index.party(r))
+            print(f"{distance:6.3f}  {index.ids[r]:>6} {index.names[r]:<24} {index.area(r):<20} {party}")
+        return
+
+    groups = index.clusters(args.radius, args.batch)
+    records = [cluster_record(index, g, species_names) for g in groups]
+    if args.scope != "all":
+        records = [r for r in records if r["scope"] == args.scope]
+    summary = {"summary": True, "parties": len(index), "skipped": index.skipped, "radius": args.radius,
+               "clusters": len(records), "trainersInClusters": sum(r["size"] for r in records),
+               "within": sum(r["scope"] == "within" for r in records),
+               "across": sum(r["scope"] == "across" for r in records)}
+    shown = records[:args.limit] if args.limit else records
+    if args.json:
+        for record in shown:
+            print(json.dumps(record))
+        print(json.dumps(summary))
+        return
+    for number, record in enumerate(shown, 1):
+        print(f"cluster {number}: {record['size']} trainers, {record['scope']} ({', '.join(record['areas'])})")
+        for t in record["trainers"]:
+            print(f"  {t['id']:>6} {t['name']:<24} {t['areaId']:<20} {', '.join(t['party'])}")
+    print(f"{summary['parties']} parties ({summary['skipped']} empty skipped), radius {args.radius}: "
+          f"{summary['clusters']} clusters with {summary['trainersInClusters']} trainers, "
+          f"{summary['within']} within an area, {summary['across']} across areas")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Story progression model built from areas.json, progression.json and trainers.
+
+A stage is the moment right before one of the gate battles: the eight gym
+leaders in badge order, then the Elite Four and the Champion. For each stage
+the player holds the flags set by every earlier gate, plus whatever story
+events and flag-setting trainers those flags make reachable.
+"""
+from collections import deque
+
+START_AREA = "pallet_town"
+STARTER_SPECIES = (1, 4, 7)
+STARTER_LEVEL = 5
+SURF_FLAG = "has_surf"
+
+
+def reachable_areas(data, flags, start=START_AREA):
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        area = data.areas.get(queue.popleft())
+        if area is None:
+            continue
+        for conn in area.get("connections", []):
+            req = conn.get("requiredFlag")
+            if conn["areaId"] not in seen and (req is None or req in flags):
+                seen.add(conn["areaId"])
+                queue.append(conn["areaId"])
+    return seen
+
+
+def expand_flags(data, flags, gate_ids=()):
+    """Grow a flag set to its fixed point; returns (flags, reachable areas).
+
+    Story events fire once their area is reachable and their required flags are
+    held. Trainers that set a flag (the S.S. Anne captain, the Rocket bosses...)
+    count as beaten once reachable. Gate battles and the story events standing
+    for them (become_champion) only count when passed in through flags.
+    """
+    flags = set(flags)
+    gate_ids = set(gate_ids)
+    gate_flags = {data.trainers[i].get("setsFlag") for i in gate_ids if i in data.trainers}
+    while True:
+        areas = reachable_areas(data, flags)
+        new = set()
+        for event in data.progression.get("storyEvents", []):
+            if gate_flags.intersection(event.get("setsFlags", [])):
+                continue
+            if event["areaId"] in areas and set(event.get("requiredFlags", [])) <= flags:
+                new.update(event.get("setsFlags", []))
+        for trainer in data.trainers.values():
+            if (trainer.get("setsFlag") and trainer["id"] not in gate_ids
+                    and trainer.get("areaId") in areas
+                    and (trainer.get("requiredFlag") is None or trainer["requiredFlag"] in flags)):
+                new.add(trainer["setsFlag"])
+        if new <= flags:
+            return flags, areas
+        flags |= new
+
+
+def gate_trainer_ids(data):
+    badges = sorted(data.progression.get("badges", []), key=lambda b: b["index"])
+    ids = [b["gymLeaderTrainerId"] for b in badges]
+    league = sorted(t["id"] for t in data.trainers.values()
+                    if t["class"] in ("EliteFour", "Champion"))
+    return ids + [i for i in league if i not in ids]
+
+
+def battle_stages(data):
+    """One entry per gate battle, in the order the game expects them."""
+    gates = gate_trainer_ids(data)
+    stages = []
+    held = set()
+    for index, trainer_id in enumerate(gates):
+        trainer = data.trainers[trainer_id]
+        flags, areas = expand_flags(data, held, gates)
+        stages.append({
+            "index": index,
+            "trainerId": trainer_id,
+            "name": trainer["name"],
+            "areaId": trainer.get("areaId"),
+            "flags": frozenset(flags),
+            "areas": frozenset(areas),
+            "levelCap": max(p["level"] for p in trainer["party"]),
+        })
+        if trainer.get("setsFlag"):
+            held.add(trainer["setsFlag"])
+        held |= flags
+    return stages
+
+
+def wild_slots(data, areas, flags):
+    """Encounter slots the player can use in the given areas with the given flags.
+
+    Surf slots need has_surf; there are no rod flags, so fishing is always open.
+    """
+    for area_id in sorted(areas):
+        table = data.encounters.get(area_id)
+        if table is None:
+            continue
+        for method in ("grass", "surf", "fishing"):
+            if method == "surf" and SURF_FLAG not in flags:
+                continue
+            for slot in table.get(method) or []:
+                yield area_id, method, slot
+
+
+def obtainable_levels(data, areas, flags, level_cap):
+    """Species id -> (lowest, highest) level it can be obtained at, capped at level_cap.
+
+    Covers the starters, wild slots whose minimum level is within the cap and
+    the level-up evolutions of those within the cap. The highest level is the
+    top of the wild ranges (or the starter level), without training; an
+    evolution can be had from its threshold up to its base form's highest
+    level. Stone and trade evolutions are left out since items and trading are
+    not modelled.
+    """
+    found = {}
+
+    def add(species_id, low, high):
+        if low > level_cap:
+            return False
+        high = min(high, level_cap)
+        old = found.get(species_id)
+        if old is None or low < old[0] or high > old[1]:
+            found[species_id] = (low, high) if old is None else (min(low, old[0]), max(high, old[1]))
+            return True
+        return False
+
+    for species_id in STARTER_SPECIES:
+        add(species_id, STARTER_LEVEL, STARTER_LEVEL)
+    for _, _, slot in wild_slots(data, areas, flags):
+        add(slot["speciesId"], slot["minLevel"], slot["maxLevel"])
+
+    pending = list(found)
+    while pending:
+        species_id = pending.pop()
+        low, high = found[species_id]
+        for evo in data.evolutions_from(species_id):
+            if evo["method"] == "LevelUp" and evo.get("level") is not None:
+                if add(evo["toSpeciesId"], max(evo["level"], low), max(evo["level"], high)):
+                    pending.append(evo["toSpeciesId"])
+    return found
+
+
+def obtainable_species(data, areas, flags, level_cap):
+    """Species id -> lowest level it can be obtained at, capped at level_cap."""
+    return {s: low for s, (low, _) in obtainable_levels(data, areas, flags, level_cap).items()}
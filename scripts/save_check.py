@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""Check a directory of save files against the current data, and migrate them.
+
+A save (SaveData, as written by SaveManager) refers to the data by id:
+DefeatedTrainerIds, StoryFlags, CurrentMapId and the species and moves of the
+party and PC boxes. When generate_trainers.py renumbers or drops trainers, or
+an area or flag is renamed, old saves keep loading but silently lose progress
+or open on a map that no longer exists. This walks every save under a
+directory, checks those references against indexes built once per worker from
+data/, and reports the saves that break:
+
+  trainers   defeated trainer ids that no longer exist, or (with
+             --old-trainers) that now belong to a different trainer
+  flags      story flags nothing in the data or the game code sets or reads
+  map        a CurrentMapId that is not an area
+  species    party or box Pokemon of an unknown species
+  moves      party or box moves that are not in moves.json
+
+With --migrate, saves are rewritten: renumbered trainer ids are remapped by
+matching (class, name, area) between --old-trainers and the new trainers,
+flags are renamed with --rename-flag, and unknown trainer ids and flags are
+dropped. A save on an unknown map is moved to Pallet Town, where the game
+picks a spawn point. Species and moves are never changed; saves with those
+problems are reported as needing a manual fix.
+
+Usage:
+    python scripts/save_check.py SAVE_DIR [--json] [--workers 8]
+    python scripts/save_check.py SAVE_DIR --old-trainers /tmp/old.json --migrate
+    python scripts/save_check.py SAVE_DIR --rename-flag got_ticket=has_ss_ticket \\
+        --migrate --out-dir migrated/
+"""
+import argparse, fnmatch, glob, json, os, re, sys, tempfile
+from collections import Counter
+from multiprocessing import Pool
+
+from gamedata import DATA_DIR, ROOT_DIR, GameData, iter_json_array
+from progression import START_AREA
+
+GAME_SRC_DIR = os.path.join(ROOT_DIR, "src")
+FLAG_LITERAL = re.compile(r'StoryFlags\.(?:Add|Contains|Remove)\("([^"]+)"\)')
+PROBLEMS = ("trainers", "flags", "map", "species", "moves")
+# Problems --migrate can fix without guessing
+MIGRATABLE = {"trainers", "flags", "map"}
+
+_index = None
+
+
+def code_flags(src_dir=GAME_SRC_DIR):
+    """Flags the game sets or tests by name in C#, such as has_starter."""
+    flags = set()
+    for path in glob.glob(os.path.join(src_dir, "**", "*.cs"), recursive=True):
+        if {"bin", "obj"} & set(os.path.relpath(path, src_dir).split(os.sep)):
+            continue
+        with open(path, encoding="utf-8") as f:
+            flags.update(FLAG_LITERAL.findall(f.read()))
+    return flags
+
+
+def data_flags(data):
+    """Every flag the data sets or requires."""
+    flags = set()
+    for trainer in data.trainers.values():
+        flags.update(f for f in (trainer.get("setsFlag"), trainer.get("requiredFlag")) if f)
+    for area in data.areas.values():
+        flags.update(area.get("flags") or [])
+        flags.update(c["requiredFlag"] for c in area.get("connections", []) if c.get("requiredFlag"))
+    progression = data.progression
+    for event in progression.get("storyEvents", []):
+        flags.update(event.get("setsFlags", []))
+        flags.update(event.get("requiredFlags", []))
+    flags.update(b["flag"] for b in progression.get("badges", []) if b.get("flag"))
+    flags.update(h["id"] for h in progression.get("hmAbilities", []))
+    return flags
+
+
+def trainer_identity(trainer):
+    return trainer.get("class"), trainer.get("name"), trainer.get("areaId")
+
+
+def trainer_renumbering(old_trainers, new_trainers):
+    """{old id: new id or None} for every old id that no longer names the same trainer.
+
+    Trainers are matched on (class, name, area); an old trainer with no unique
+    match in the new data maps to None.
+    """
+    by_identity = {}
+    for trainer in new_trainers.values():
+        by_identity.setdefault(trainer_identity(trainer), []).append(trainer["id"])
+    mapping = {}
+    for old_id, trainer in old_trainers.items():
+        new = new_trainers.get(old_id)
+        if new is not None and trainer_identity(new) == trainer_identity(trainer):
+            continue
+        matches = by_identity.get(trainer_identity(trainer), [])
+        mapping[old_id] = matches[0] if len(matches) == 1 else None
+    return mapping
+
+
+class SaveIndex:
+    """What a save may refer to in the current data, and how to migrate what it may not."""
+
+    def __init__(self, data, flags, renumbered=None, renamed_flags=None):
+        self.trainer_ids = set(data.trainers)
+        self.area_ids = set(data.areas)
+        self.species_ids = set(data.species)
+        self.move_ids = set(data.moves)
+        self.flags = flags
+        self.renumbered = renumbered or {}
+        self.renamed_flags = renamed_flags or {}
+
+    def check(self, save):
+        """{problem: [offending values]} for one parsed save; empty when it is fine."""
+        problems = {}
+        trainers = [i for i in save.get("DefeatedTrainerIds") or []
+                    if i in self.renumbered or i not in self.trainer_ids]
+        if trainers:
+            problems["trainers"] = trainers
+        flags = [f for f in save.get("StoryFlags") or [] if f not in self.flags]
+        if flags:
+            problems["flags"] = flags
+        if save.get("CurrentMapId") not in self.area_ids:
+            problems["map"] = [save.get("CurrentMapId")]
+        pokemon = list(save.get("Party") or []) + list(save.get("PcBoxes") or [])
+        species = sorted({p.get("SpeciesId") for p in pokemon} - self.species_ids)
+        if species:
+            problems["species"] = species
+        moves = sorted({m.get("MoveId") for p in pokemon for m in p.get("Moves") or []} - self.move_ids)
+        if moves:
+            problems["moves"] = moves
+        return problems
+
+    def migrate(self, save):
+        """Rewrite the trainer ids, flags and map of a save in place."""
+        defeated = []
+        for trainer_id in save.get("DefeatedTrainerIds") or []:
+            trainer_id = self.renumbered.get(trainer_id, trainer_id)
+            if trainer_id in self.trainer_ids and trainer_id not in defeated:
+                defeated.append(trainer_id)
+        save["DefeatedTrainerIds"] = defeated
+        flags = []
+        for flag in save.get("StoryFlags") or []:
+            flag = self.renamed_flags.get(flag, flag)
+            if flag in self.flags and flag not in flags:
+                flags.append(flag)
+        save["StoryFlags"] = flags
+        if save.get("CurrentMapId") not in self.area_ids:
+            save["CurrentMapId"] = START_AREA
+            # Off-map coordinates make OverworldScreen.LoadMap pick a spawn point
+            save["PlayerX"] = save["PlayerY"] = -1
+
+
+def find_saves(directory, pattern):
+    """Paths of the save files under a directory, streamed in directory order."""
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            if fnmatch.fnmatch(name, pattern):
+                yield os.path.join(root, name)
+
+
+def write_save(path, save):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        # Matches SaveManager's WriteIndented output closely enough to diff
+        json.dump(save, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def _init_worker(data_dir, src_dir, old_trainers_path, renamed_flags, migrate, root, out_dir):
+    global _index
+    data = GameData.load_from_directory(data_dir)
+    renumbered = None
+    if old_trainers_path:
+        old = {t["id"]: t for t in iter_json_array(old_trainers_path)}
+        renumbered = trainer_renumbering(old, data.trainers)
+    flags = data_flags(data) | code_flags(src_dir)
+    _index = (SaveIndex(data, flags, renumbered, renamed_flags), migrate, root, out_dir)
+
+
+def _check_job(path):
+    index, migrate, root, out_dir = _index
+    try:
+        with open(path, encoding="utf-8-sig") as f:
+            save = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        return {"path": path, "error": str(e)}
+    problems = index.check(save)
+    result = {"path": path, "problems": problems}
+    if migrate and problems:
+        if MIGRATABLE.issuperset(problems):
+            index.migrate(save)
+            target = os.path.join(out_dir, os.path.relpath(path, root)) if out_dir else path
+            write_save(target, save)
+            result["migrated"] = target
+        else:
+            result["manual"] = sorted(set(problems) - MIGRATABLE)
+    return result
+
+
+def check_saves(directory, data_dir=DATA_DIR, src_dir=GAME_SRC_DIR, pattern="*.json",
+                old_trainers=None, renamed_flags=None, migrate=False, out_dir=None, workers=None):
+    """Yield one result per save file, in completion order."""
+    initargs = (data_dir, src_dir, old_trainers, renamed_flags or {}, migrate, directory, out_dir)
+    with Pool(max(1, workers or os.cpu_count() or 1), initializer=_init_worker,
+              initargs=initargs) as pool:
+        yield from pool.imap_unordered(_check_job, find_saves(directory, pattern), chunksize=32)
+
+
+def parse_renames(pairs):
+    renames = {}
+    for pair in pairs or []:
+        old, sep, new = pair.partition("=")
+        if not sep or not old or not new:
+            sys.exit(f"--rename-flag expects OLD=NEW, got {pair!r}")
+        renames[old] = new
+    return renames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("saves", help="directory searched recursively for save files")
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--src-dir", default=GAME_SRC_DIR, help="C# sources scanned for flag names")
+    parser.add_argument("--pattern", default="*.json", help="file name pattern of saves")
+    parser.add_argument("--old-trainers", help="trainers.json the saves were made with")
+    parser.add_argument("--rename-flag", action="append", metavar="OLD=NEW",
+                        help="story flag renamed since the saves were made (repeatable)")
+    parser.add_argument("--migrate", action="store_true", help="rewrite saves that can be fixed")
+    parser.add_argument("--out-dir", help="write migrated saves here instead of in place")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--json", action="store_true",
+                        help="print one JSON line per broken save and a summary line")
+    args = parser.parse_args()
+    if args.out_dir and not args.migrate:
+        parser.error("--out-dir needs --migrate")
+
+    counts = Counter()
+    results = check_saves(args.saves, args.data_dir, args.src_dir, args.pattern, args.old_trainers,
+                          parse_renames(args.rename_flag), args.migrate, args.out_dir, args.workers)
+    for result in results:
+        counts["saves"] += 1
+        if "error" in result:
+            counts["unreadable"] += 1
+        elif not result["problems"]:
+            continue
+        else:
+            counts["broken"] += 1
+            counts.update(f"problem:{p}" for p in result["problems"])
+            counts["migrated" if "migrated" in result else "manual" if "manual" in result else "unfixed"] += 1
+        if args.json:
+            print(json.dumps(result))
+        elif "error" in result:
+            print(f"{result['path']}: unreadable: {result['error']}")
+        else:
+            detail = "; ".join(f"{p} {result['problems'][p]}" for p in PROBLEMS if p in result["problems"])
+            action = (" -> migrated" if "migrated" in result
+                      else f" -> needs a manual fix ({', '.join(result['manual'])})" if "manual" in result
+                      else "")
+            print(f"{result['path']}: {detail}{action}")
+
+    summary = {"saves": counts["saves"], "broken": counts["broken"], "unreadable": counts["unreadable"],
+               "problems": {p: counts[f"problem:{p}"] for p in PROBLEMS if counts[f"problem:{p}"]}}
+    if args.migrate:
+        summary.update(migrated=counts["migrated"], manual=counts["manual"])
+    if args.json:
+        print(json.dumps({"summary": summary}))
+    else:
+        print(f"{summary['saves']} saves checked: {summary['broken']} broken, "
+              f"{summary['unreadable']} unreadable"
+              + (f", {summary['migrated']} migrated, {summary['manual']} need a manual fix"
+                 if args.migrate else ""))
+    if counts["broken"] - counts["migrated"] or counts["unreadable"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
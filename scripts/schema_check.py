@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""Validate data/ JSON against the C# models the game deserializes it into.
+
+The enums and the settable properties of every class under
+src/PokemonGen1.Core are extracted from the C# sources and compiled into one
+Python validator function per class, so checks run at generation speed and
+stay in sync with the models without a hand-written schema. Records follow
+System.Text.Json's rules as configured in GameData: property names (or their
+[JsonPropertyName]) match case-insensitively, enums are read from their names (JsonStringEnumConverter),
+null is rejected for non-nullable value types, and keys used by ToDictionary
+must be unique.
+
+Problems are reported as errors (the game would crash or drop data at load)
+or warnings (JSON properties no C# property picks up, which the serializer
+silently ignores).
+
+Usage:
+    python scripts/schema_check.py                 # all files under data/
+    python scripts/schema_check.py --strict        # warnings fail too
+    python scripts/schema_check.py --emit          # print the generated validators
+"""
+import argparse, os, re, sys
+
+from gamedata import DATA_DIR, ROOT_DIR, data_path, iter_json_array, load_json
+
+SRC_DIR = os.path.join(ROOT_DIR, "src", "PokemonGen1.Core")
+
+# Type each file is deserialized into by GameData.LoadFromDirectory
+FILE_ROOTS = {
+    "species": "List<PokemonSpecies>",
+    "moves": "List<MoveData>",
+    "evolutions": "List<EvolutionEntry>",
+    "items": "List<ItemData>",
+    "learnsets": "Dictionary<int, List<LearnsetEntry>>",
+    "areas": "List<AreaData>",
+    "encounters": "List<WildEncounterTable>",
+    "trainers": "List<TrainerData>",
+    "shops": "List<ShopData>",
+}
+
+# Property each list is keyed by in ToDictionary
+FILE_KEYS = {
+    "species": "DexNumber",
+    "moves": "Id",
+    "items": "Id",
+    "areas": "Id",
+    "encounters": "AreaId",
+    "trainers": "Id",
+    "shops": "Id",
+}
+
+INT_TYPES = {"int", "long", "short", "byte", "uint", "ushort"}
+FLOAT_TYPES = {"float", "double", "decimal"}
+COLLECTIONS = ("List", "HashSet", "IEnumerable", "IReadOnlyList")
+
+_COMMENT = re.compile(r"//[^\n]*|/\*.*?\*/", re.S)
+_ENUM = re.compile(r"\benum\s+(\w+)\s*\{([^}]*)\}")
+_CLASS = re.compile(r"\bclass\s+(\w+)[^{;]*\{")
+_PROPERTY = re.compile(
+    r"(?:\[JsonPropertyName\(\"([^\"]+)\"\)\]\s*)?"
+    r"public\s+([\w<>\[\]?,.\s]+?)\s+(\w+)\s*\{\s*get;\s*(set|init);\s*\}")
+
+
+def parse_sources(src_dir=SRC_DIR):
+    """Return (enums, classes) found in the C# sources.
+
+    enums maps name -> member names; classes maps name -> [(type, JSON property name)].
+    """
+    enums, classes = {}, {}
+    for dirpath, dirnames, filenames in os.walk(src_dir):
+        dirnames[:] = [d for d in dirnames if d not in ("bin", "obj")]
+        for filename in sorted(filenames):
+            if not filename.endswith(".cs"):
+                continue
+            with open(os.path.join(dirpath, filename)) as f:
+                source = _COMMENT.sub("", f.read())
+            for name, body in _ENUM.findall(source):
+                members = [m.split("=")[0].strip() for m in body.split(",")]
+                enums[name] = [m for m in members if m]
+            for match in _CLASS.finditer(source):
+                depth, i = 1, match.end()
+                while depth and i < len(source):
+                    depth += {"{": 1, "}": -1}.get(source[i], 0)
+                    i += 1
+                body = source[match.end():i - 1]
+                classes[match.group(1)] = [(re.sub(r"\s+", "", t), json_name or p)
+                                           for json_name, t, p, _ in _PROPERTY.findall(body)]
+    return enums, classes
+
+
+def split_generic(type_name):
+    """'Dictionary<int,List<X>>' -> ('Dictionary', ['int', 'List<X>'])."""
+    outer, inner = type_name.split("<", 1)
+    args, depth, start = [], 0, 0
+    inner = inner[:-1]
+    for i, ch in enumerate(inner):
+        if ch == "<":
+            depth += 1
+        elif ch == ">":
+            depth -= 1
+        elif ch == "," and depth == 0:
+            args.append(inner[start:i])
+            start = i + 1
+    args.append(inner[start:])
+    return outer, args
+
+
+class _Compiler:
+    """Generates Python source for one validator function per C# class."""
+
+    def __init__(self, enums, classes):
+        self.enums = enums
+        self.classes = classes
+        self.constants = {}
+        self.counter = 0
+
+    def temp(self):
+        self.counter += 1
+        return f"v{self.counter}"
+
+    def const(self, value):
+        name = f"C{len(self.constants)}"
+        self.constants[name] = value
+        return name
+
+    def check(self, type_name, var, path, indent):
+        """Source lines validating `var` (located at `path`) as C# type_name."""
+        pad = " " * indent
+        nullable = type_name.endswith("?")
+        base = type_name.rstrip("?").split(".")[-1] if "<" not in type_name else type_name.rstrip("?")
+        value_type = base in INT_TYPES | FLOAT_TYPES | {"bool"} or base in self.enums
+        lines = [f"{pad}if {var} is None:"]
+        if nullable or not value_type:
+            lines.append(f"{pad}    pass")
+        else:
+            lines.append(f"{pad}    err({path}, 'null for non-nullable {base}')")
+
+        if base in INT_TYPES:
+            lines += [f"{pad}elif type({var}) is not int:",
+                      f"{pad}    err({path}, 'expected integer, got ' + repr({var}))"]
+        elif base in FLOAT_TYPES:
+            lines += [f"{pad}elif type({var}) not in (int, float):",
+                      f"{pad}    err({path}, 'expected number, got ' + repr({var}))"]
+        elif base == "bool":
+            lines += [f"{pad}elif type({var}) is not bool:",
+                      f"{pad}    err({path}, 'expected boolean, got ' + repr({var}))"]
+        elif base == "string":
+            lines += [f"{pad}elif type({var}) is not str:",
+                      f"{pad}    err({path}, 'expected string, got ' + repr({var}))"]
+        elif base in self.enums:
+            names = self.const(frozenset(m.lower() for m in self.enums[base]))
+            lines += [f"{pad}elif type({var}) is str:",
+                      f"{pad}    if {var}.lower() not in {names}:",
+                      f"{pad}        err({path}, 'unknown {base} ' + repr({var}))",
+                      f"{pad}elif type({var}) is not int:",
+                      f"{pad}    err({path}, 'expected {base} name, got ' + repr({var}))"]
+        elif base.endswith("[]") or base.split("<")[0] in COLLECTIONS:
+            item_type = base[:-2] if base.endswith("[]") else split_generic(base)[1][0]
+            i, item = self.temp(), self.temp()
+            lines += [f"{pad}elif type({var}) is not list:",
+                      f"{pad}    err({path}, 'expected array')",
+                      f"{pad}else:",
+                      f"{pad}    for {i}, {item} in enumerate({var}):"]
+            lines += self.check(item_type, item, f"{path} + '[' + str({i}) + ']'", indent + 8)
+        elif base.startswith("Dictionary<"):
+            key_type, value_type_name = split_generic(base)[1]
+            k, v = self.temp(), self.temp()
+            lines += [f"{pad}elif type({var}) is not dict:",
+                      f"{pad}    err({path}, 'expected object')",
+                      f"{pad}else:",
+                      f"{pad}    for {k}, {v} in {var}.items():"]
+            if key_type in INT_TYPES:
+                lines += [f"{pad}        if not {k}.lstrip('-').isdigit():",
+                          f"{pad}            err({path} + '.' + {k}, 'key is not an integer')"]
+            lines += self.check(value_type_name, v, f"{path} + '.' + {k}", indent + 8)
+        elif base in self.classes:
+            lines += [f"{pad}else:",
+                      f"{pad}    check_{base}({var}, {path}, err, warn)"]
+        # Anything else (TimeSpan, Direction of another assembly...) is not checked
+        return lines
+
+    def function(self, class_name):
+        props = self.classes[class_name]
+        lines = [f"def check_{class_name}(obj, path, err, warn):",
+                 "    if type(obj) is not dict:",
+                 f"        err(path, 'expected {class_name} object')",
+                 "        return",
+                 "    for key, value in obj.items():",
+                 "        name = key.lower()"]
+        keyword = "if"
+        for type_name, prop in props:
+            lines.append(f"        {keyword} name == {prop.lower()!r}:")
+            lines += self.check(type_name, "value", "path + '.' + key", 12)
+            keyword = "elif"
+        lines += [f"        {'else' if props else 'if True'}:",
+                  f"            warn(path + '.' + key, 'ignored: no {class_name} property')"]
+        return "\n".join(lines)
+
+    def module(self):
+        return "\n\n".join(self.function(c) for c in sorted(self.classes)) + "\n"
+
+
+def reachable_classes(classes, roots):
+    """Classes reachable through property types from the given root type names."""
+    seen, stack = set(), list(roots)
+    while stack:
+        for name in re.findall(r"\w+", stack.pop()):
+            if name in classes and name not in seen:
+                seen.add(name)
+                stack.extend(t for t, _ in classes[name])
+    return {name: classes[name] for name in seen}
+
+
+class Schema:
+    def __init__(self, enums, classes):
+        self.enums = enums
+        self.classes = reachable_classes(classes, FILE_ROOTS.values())
+        compiler = _Compiler(enums, self.classes)
+        self.source = compiler.module()
+        self.namespace = dict(compiler.constants)
+        exec(compile(self.source, "<schema_check generated>", "exec"), self.namespace)
+
+    def checker(self, class_name):
+        return self.namespace[f"check_{class_name}"]
+
+    def validate_records(self, file_name, records, errors=None, warnings=None):
+        """Validate an iterable of top-level records of one of the FILE_ROOTS lists.
+
+        Returns (errors, warnings) as lists of (path, message).
+        """
+        errors = [] if errors is None else errors
+        warnings = [] if warnings is None else warnings
+        _, (class_name,) = split_generic(FILE_ROOTS[file_name])
+        check = self.checker(class_name)
+        key = FILE_KEYS.get(file_name)
+        seen = set()
+
+        def err(path, message):
+            errors.append((path, message))
+
+        def warn(path, message):
+            warnings.append((path, message))
+
+        for index, record in enumerate(records):
+            path = f"{file_name}[{index}]"
+            check(record, path, err, warn)
+            if key and type(record) is dict:
+                value = next((v for k, v in record.items() if k.lower() == key.lower()), None)
+                if value in seen:
+                    err(path, f"duplicate {key} {value!r}")
+                seen.add(value)
+        return errors, warnings
+
+    def validate_learnsets(self, learnsets, errors, warnings):
+        def err(path, message):
+            errors.append((path, message))
+
+        def warn(path, message):
+            warnings.append((path, message))
+
+        check = self.checker("LearnsetEntry")
+        if type(learnsets) is not dict:
+            err("learnsets", "expected object")
+            return
+        for species_id, entries in learnsets.items():
+            path = f"learnsets.{species_id}"
+            if not species_id.lstrip("-").isdigit():
+                err(path, "key is not an integer")
+            if type(entries) is not list:
+                err(path, "expected array")
+                continue
+            for i, entry in enumerate(entries):
+                check(entry, f"{path}[{i}]", err, warn)
+
+    def validate_type_chart(self, chart, errors):
+        # TypeChart.LoadFromJson uses Enum.Parse, which is case-sensitive
+        types = set(self.enums.get("PokemonType", []))
+        entries = chart.get("entries") if type(chart) is dict else None
+        if type(entries) is not list:
+            errors.append(("type_chart", "missing entries array"))
+            return
+        for i, entry in enumerate(entries):
+            path = f"type_chart.entries[{i}]"
+            if type(entry) is not dict:
+                errors.append((path, "expected object"))
+                continue
+            for field in ("attacking", "defending"):
+                if entry.get(field) not in types:
+                    errors.append((f"{path}.{field}", f"unknown PokemonType {entry.get(field)!r}"))
+            if type(entry.get("multiplier")) not in (int, float):
+                errors.append((f"{path}.multiplier", "expected number"))
+
+    def validate(self, name, value, errors=None, warnings=None):
+        """Validate the parsed contents of one DATA_FILES entry."""
+        errors = [] if errors is None else errors
+        warnings = [] if warnings is None else warnings
+        if name == "learnsets":
+            self.validate_learnsets(value, errors, warnings)
+        elif name == "type_chart":
+            self.validate_type_chart(value, errors)
+        elif name in FILE_ROOTS:
+            if type(value) is not list:
+                errors.append((name, "expected array"))
+            else:
+                self.validate_records(name, value, errors, warnings)
+        return errors, warnings
+
+    def validate_directory(self, data_dir=DATA_DIR):
+        errors, warnings = [], []
+        for name in FILE_ROOTS:
+            path = data_path(data_dir, name)
+            if not os.path.exists(path):
+                continue
+            if name == "learnsets":
+                self.validate_learnsets(load_json(data_dir, name), errors, warnings)
+            else:
+                self.validate_records(name, iter_json_array(path), errors, warnings)
+        self.validate_type_chart(load_json(data_dir, "type_chart"), errors)
+        return errors, warnings
+
+
+def load_schema(src_dir=SRC_DIR):
+    return Schema(*parse_sources(src_dir))
+
+
+def print_problems(problems, label, limit=50):
+    """Print problems grouped by path with record indices collapsed."""
+    grouped = {}
+    for path, message in problems:
+        key = (re.sub(r"\[\d+\]", "[]", path), message)
+        grouped.setdefault(key, []).append(path)
+    for (pattern, message), paths in list(grouped.items())[:limit]:
+        where = paths[0] if len(paths) == 1 else f"{pattern} ({len(paths)} times)"
+        print(f"{label}: {where}: {message}")
+    if len(grouped) > limit:
+        print(f"{label}: ... {len(grouped) - limit} more")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--src-dir", default=SRC_DIR)
+    parser.add_argument("--strict", action="store_true", help="treat warnings as errors")
+    parser.add_argument("--emit", action="store_true", help="print the generated validator source")
+    args = parser.parse_args()
+
+    schema = load_schema(args.src_dir)
+    if args.emit:
+        print(schema.source)
+        return
+
+    errors, warnings = schema.validate_directory(args.data_dir)
+    print_problems(errors, "ERROR")
+    print_problems(warnings, "WARNING")
+    print(f"{len(schema.classes)} classes, {len(schema.enums)} enums checked: "
+          f"{len(errors)} errors, {len(warnings)} warnings")
+    if errors or (args.strict and warnings):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
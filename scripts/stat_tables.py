@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Precompute stat and experience lookup tables as compact binary arrays.
+
+Evaluates StatCalculator for every species at levels 1-100 under the trainer
+DV and stat-experience policy (battle_calc.TRAINER_DV / TRAINER_STAT_EXP), and
+ExperienceForLevel for every GrowthRate, with NumPy over whole arrays at once.
+Output goes to data/tables/:
+
+  stats.u16       uint16 little-endian, shape (max dex + 1, 101, 5):
+                  [dexNumber, level, stat] with stats in STAT_NAMES order
+  experience.i32  int32 little-endian, shape (4, 101): [GrowthRate, level]
+                  (MediumSlow is negative at level 1, as in the game)
+  tables.json     manifest with dtype, shape, axes and the DV policy
+
+Rows are indexed directly by dex number and level; index 0 of both is unused
+and zero. Readers can np.fromfile()/np.memmap() them or read them in C# with
+MemoryMarshal.Cast<byte, ushort>.
+
+Usage:
+    python scripts/stat_tables.py [--data-dir DIR] [--out-dir DIR] [--verify]
+"""
+import argparse, json, math, os
+
+import numpy as np
+
+from battle_calc import (STAT_NAMES, TRAINER_DV, TRAINER_STAT_EXP, battle_stats,
+                         experience_for_level, hp_dv)
+from gamedata import DATA_DIR, GROWTH_RATES, load_json
+
+MAX_LEVEL = 100
+BASE_FIELDS = ("BaseHp", "BaseAttack", "BaseDefense", "BaseSpecial", "BaseSpeed")
+
+
+def base_stat_array(species):
+    """int32 array [dexNumber, stat] of base stats; row 0 and missing numbers are zero."""
+    base = np.zeros((max(s["DexNumber"] for s in species) + 1, len(BASE_FIELDS)), dtype=np.int32)
+    for s in species:
+        base[s["DexNumber"]] = [s[f] for f in BASE_FIELDS]
+    return base
+
+
+def calculated_stats(base, levels, dv=TRAINER_DV, stat_exp=TRAINER_STAT_EXP):
+    """StatCalculator over arrays: base [..., stat] at levels broadcast against base[..., 0]."""
+    dvs = np.array([hp_dv(dv, dv, dv, dv), dv, dv, dv, dv], dtype=np.int32)
+    bonus = int(math.ceil(math.sqrt(stat_exp)) / 4.0)
+    levels = np.asarray(levels, dtype=np.int32)
+    # Every operand is non-negative, so floor division matches C#'s truncation
+    stats = ((base + dvs) * 2 + bonus) * levels[..., None] // 100 + 5
+    stats[..., 0] += levels + 10 - 5
+    return stats
+
+
+def stat_table(species, dv=TRAINER_DV, stat_exp=TRAINER_STAT_EXP):
+    """uint16 array [dexNumber, level, stat] of calculated stats."""
+    base = base_stat_array(species)
+    levels = np.arange(MAX_LEVEL + 1, dtype=np.int32)
+    stats = calculated_stats(base[:, None, :], levels[None, :], dv, stat_exp)
+    stats[0] = 0
+    stats[:, 0] = 0
+    return stats.astype(np.uint16)
+
+
+def experience_table():
+    """int32 array [GrowthRate, level] of total experience for each level."""
+    n = np.arange(MAX_LEVEL + 1, dtype=np.int64)
+    cube = n * n * n
+    table = np.stack([
+        4 * cube // 5,                                   # Fast
+        cube,                                            # MediumFast
+        6 * cube // 5 - 15 * n * n + 100 * n - 140,      # MediumSlow
+        5 * cube // 4,                                   # Slow
+    ])
+    table[:, 0] = 0
+    return table.astype(np.int32)
+
+
+def write_tables(out_dir, stats, experience, dv=TRAINER_DV, stat_exp=TRAINER_STAT_EXP):
+    os.makedirs(out_dir, exist_ok=True)
+    stats.astype("<u2").tofile(os.path.join(out_dir, "stats.u16"))
+    experience.astype("<i4").tofile(os.path.join(out_dir, "experience.i32"))
+    manifest = {
+        "stats": {"file": "stats.u16", "dtype": "<u2", "shape": list(stats.shape),
+                  "axes": ["dexNumber", "level", "stat"], "stats": list(STAT_NAMES),
+                  "dv": dv, "statExp": stat_exp},
+        "experience": {"file": "experience.i32", "dtype": "<i4", "shape": list(experience.shape),
+                       "axes": ["growthRate", "level"], "growthRates": GROWTH_RATES},
+    }
+    with open(os.path.join(out_dir, "tables.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+
+
+def load_table(out_dir, name, manifest="tables.json"):
+    """Memory-map one table described by a manifest such as the one write_tables writes."""
+    with open(os.path.join(out_dir, manifest)) as f:
+        entry = json.load(f)[name]
+    return np.memmap(os.path.join(out_dir, entry["file"]), dtype=entry["dtype"], mode="r",
+                     shape=tuple(entry["shape"]))
+
+
+def verify(species, stats, experience):
+    """Compare every table entry with the scalar ports of StatCalculator."""
+    mismatches = 0
+    for s in species:
+        for level in range(1, MAX_LEVEL + 1):
+            expected = battle_stats(s, level)
+            if [expected[name] for name in STAT_NAMES] != stats[s["DexNumber"], level].tolist():
+                mismatches += 1
+    for i, rate in enumerate(GROWTH_RATES):
+        for level in range(1, MAX_LEVEL + 1):
+            if experience[i, level] != experience_for_level(rate, level):
+                mismatches += 1
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--out-dir", default=os.path.join(DATA_DIR, "tables"))
+    parser.add_argument("--verify", action="store_true",
+                        help="check every entry against the scalar formulas")
+    args = parser.parse_args()
+
+    species = load_json(args.data_dir, "species")
+    stats = stat_table(species)
+    experience = experience_table()
+    write_tables(args.out_dir, stats, experience)
+    print(f"stats {stats.shape} ({stats.nbytes} bytes), "
+          f"experience {experience.shape} ({experience.nbytes} bytes) written to {args.out_dir}")
+    if args.verify:
+        mismatches = verify(species, stats, experience)
+        print(f"{mismatches} mismatches against StatCalculator")
+        if mismatches:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""Generate internally consistent synthetic data directories for scale testing.
+
+The output mirrors the layout of data/ (pokemon/, moves/, types/, items/,
+world/) at a multiple of the real data's size, so GameData.LoadFromDirectory,
+the battle tools and generate_trainers.py's validation can be benchmarked
+against much larger worlds:
+
+    python scripts/synth_world.py /tmp/world_x10 --scale 10 --seed 1
+    python scripts/synth_world.py /tmp/world_x100 --scale 100 --seed 1
+    python scripts/synth_world.py /tmp/world_x1000 --scale 1000 --seed 1
+
+Every record is derived from (seed, kind, index) alone, so files are streamed
+to disk one record at a time and memory stays flat whatever the scale. Areas
+sit on a grid and connect to their neighbours in both directions; gate flags
+on connections are set by the gym leader of a city that exists; trainer ids
+in areas.json match trainers.json one for one; encounters, learnsets and
+evolutions only reference generated species and moves; shops only sell items
+from items.json, which is copied along with type_chart.json.
+"""
+import argparse, json, os, random, shutil
+
+from gamedata import DATA_DIR, DATA_FILES, GROWTH_RATES, TYPES, load_json
+
+# Sizes of the real data at scale 1
+BASE_SPECIES = 151
+BASE_MOVES = 165
+BASE_AREAS = 63
+
+# One id block per area; areas hold 0-8 trainers (about 4 on average, as now)
+TRAINER_ID_BLOCK = 10
+MAX_TRAINERS_PER_AREA = 8
+
+CITY_EVERY = 9
+AREA_TYPES = ["Route", "Route", "Route", "Cave", "DungeonFloor", "Building", "Special"]
+TRAINER_CLASSES = ["Youngster", "BugCatcher", "Lass", "Sailor", "JrTrainer", "Hiker", "Biker",
+                   "Burglar", "Engineer", "Fisherman", "Swimmer", "CueBall", "Gambler", "Beauty",
+                   "Psychic", "Rocker", "Juggler", "Tamer", "Birdkeeper", "Blackbelt", "Scientist",
+                   "Gentleman", "Channeler", "RocketGrunt", "CoolTrainer", "SuperNerd", "PokeManiac"]
+MOVE_EFFECTS = ["None", "None", "None", "Burn", "Freeze", "Paralysis", "Poison", "Flinch",
+                "Confusion", "HighCrit", "MultiHit", "DoubleHit", "Recoil", "Drain",
+                "AttackDown1", "DefenseDown1", "SpeedDown1"]
+DIALOG_LINES = ["Let's battle!", "You look strong!", "My Pokemon are the best!",
+                "I've been training all day!", "Don't underestimate me!", "Here I come!"]
+AFTER_LINES = ["I lost...", "You're good!", "Not bad at all!", "Back to training."]
+
+
+def rng_for(seed, kind, index):
+    return random.Random(f"{seed}:{kind}:{index}")
+
+
+class JsonArrayWriter:
+    """Writes a JSON array one element at a time, indented like json.dump(indent=2)."""
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+
+    def __enter__(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.f = open(self.path, "w")
+        self.f.write("[")
+        return self
+
+    def write(self, record):
+        body = json.dumps(record, indent=2).replace("\n", "\n  ")
+        self.f.write(("," if self.count else "") + "\n  " + body)
+        self.count += 1
+
+    def __exit__(self, *exc):
+        self.f.write("\n]" if self.count else "]")
+        self.f.close()
+
+
+class World:
+    def __init__(self, seed, scale, item_ids):
+        self.seed = seed
+        self.species = BASE_SPECIES * scale
+        self.moves = BASE_MOVES * scale
+        self.areas = BASE_AREAS * scale
+        self.width = max(1, int(self.areas ** 0.5))
+        self.item_ids = item_ids
+
+    # ---- areas ----
+
+    def area_id(self, i):
+        return f"synth_{i}"
+
+    def is_city(self, i):
+        return i % CITY_EVERY == 0
+
+    def area_type(self, i):
+        if self.is_city(i):
+            return "City"
+        return rng_for(self.seed, "area_type", i).choice(AREA_TYPES)
+
+    def badge_flag(self, city):
+        return f"synth_badge_{city}"
+
+    def neighbours(self, i):
+        x, y = i % self.width, i // self.width
+        for dx, dy, direction in ((0, -1, "North"), (0, 1, "South"), (-1, 0, "West"), (1, 0, "East")):
+            nx, ny = x + dx, y + dy
+            j = ny * self.width + nx
+            if 0 <= nx < self.width and ny >= 0 and j < self.areas:
+                yield j, direction
+
+    def edge_flag(self, a, b):
+        # Symmetric in (a, b) so both ends of a connection agree on the gate
+        lo, hi = min(a, b), max(a, b)
+        if rng_for(self.seed, "edge", f"{lo}-{hi}").random() >= 0.2:
+            return None
+        city = (lo // CITY_EVERY) * CITY_EVERY
+        return None if city in (lo, hi) else self.badge_flag(city)
+
+    def trainer_count(self, i):
+        # Cities always hold at least their gym leader
+        low = 1 if self.is_city(i) else 0
+        return rng_for(self.seed, "trainer_count", i).randint(low, MAX_TRAINERS_PER_AREA)
+
+    def trainer_ids(self, i):
+        first = 1 + i * TRAINER_ID_BLOCK
+        return list(range(first, first + self.trainer_count(i)))
+
+    def has_encounters(self, i):
+        return not self.is_city(i) and self.area_type(i) != "Building"
+
+    def level_band(self, i):
+        # Later areas hold stronger Pokemon, as along the real story path
+        low = 2 + 60 * i // max(1, self.areas - 1)
+        return low, min(100, low + 5)
+
+    def area(self, i):
+        rng = rng_for(self.seed, "area", i)
+        city = self.is_city(i)
+        trainers = self.trainer_ids(i)
+        return {
+            "id": self.area_id(i),
+            "name": f"Synthetic Area {i}",
+            "type": self.area_type(i),
+            "description": "Generated for scale testing.",
+            "connections": [
+                {"areaId": self.area_id(j), "direction": d, "requiredFlag": self.edge_flag(i, j)}
+                for j, d in self.neighbours(i)
+            ],
+            "hasWildEncounters": self.has_encounters(i),
+            "hasPokemonCenter": city,
+            "hasPokeMart": city,
+            "shopId": self.area_id(i) if city else None,
+            "trainers": trainers,
+            "items": [
+                {"itemId": rng.choice(self.item_ids), "quantity": 1,
+                 "hidden": rng.random() < 0.3, "requiredFlag": None}
+                for _ in range(rng.randint(0, 2))
+            ],
+            "flags": [],
+        }
+
+    # ---- species, moves, learnsets, evolutions ----
+
+    def species_record(self, i):
+        rng = rng_for(self.seed, "species", i)
+        type1 = rng.choice(TYPES)
+        type2 = rng.choice([t for t in TYPES if t != type1]) if rng.random() < 0.4 else None
+        return {
+            "DexNumber": i, "Name": f"Synthmon{i}", "Type1": type1, "Type2": type2,
+            "BaseHp": rng.randint(20, 160), "BaseAttack": rng.randint(20, 140),
+            "BaseDefense": rng.randint(20, 160), "BaseSpecial": rng.randint(20, 150),
+            "BaseSpeed": rng.randint(15, 140), "CatchRate": rng.choice([3, 45, 90, 120, 190, 255]),
+            "BaseExpYield": rng.randint(40, 250), "GrowthRate": rng.choice(GROWTH_RATES),
+            "Category": "Synthetic", "HeightM": round(rng.uniform(0.2, 5.0), 1),
+            "WeightKg": round(rng.uniform(1.0, 300.0), 1),
+        }
+
+    def move_record(self, i):
+        rng = rng_for(self.seed, "move", i)
+        effect = rng.choice(MOVE_EFFECTS)
+        return {
+            "id": i, "name": f"Synth Move {i}", "type": rng.choice(TYPES),
+            "power": rng.choice([20, 35, 40, 50, 60, 70, 80, 90, 100, 120]),
+            "accuracy": rng.choice([70, 75, 80, 85, 90, 95, 100, 100, 100]),
+            "maxPP": rng.choice([5, 10, 15, 20, 25, 30, 35]),
+            "effect": effect,
+            "effectChance": 0 if effect in ("None", "HighCrit", "MultiHit", "DoubleHit",
+                                            "Recoil", "Drain") else rng.choice([10, 20, 30]),
+            "priority": 0, "highCritRate": effect == "HighCrit", "target": "SingleOpponent",
+        }
+
+    def learnset(self, i):
+        rng = rng_for(self.seed, "learnset", i)
+        levels = sorted(rng.sample(range(2, 60), 6))
+        return ([{"level": 1, "moveId": rng.randint(1, self.moves)}]
+                + [{"level": lv, "moveId": rng.randint(1, self.moves)} for lv in levels])
+
+    def evolution(self, i):
+        # Short level-up chains between consecutive dex numbers
+        if i >= self.species or i % 3 == 0:
+            return None
+        level = rng_for(self.seed, "evolution", i).randint(16, 40)
+        return {"fromSpeciesId": i, "toSpeciesId": i + 1, "method": "LevelUp",
+                "level": level, "itemId": None}
+
+    # ---- encounters, trainers, shops ----
+
+    def slot(self, rng, low, high):
+        return {"speciesId": rng.randint(1, self.species), "minLevel": low,
+                "maxLevel": high, "weight": rng.randint(1, 50)}
+
+    def encounters(self, i):
+        rng = rng_for(self.seed, "encounters", i)
+        low, high = self.level_band(i)
+        water = rng.random() < 0.3
+        return {
+            "areaId": self.area_id(i),
+            "encounterRate": rng.choice([10, 15, 20, 25]),
+            "grass": [self.slot(rng, low, high) for _ in range(rng.randint(2, 6))],
+            "surf": [self.slot(rng, low, high) for _ in range(rng.randint(1, 3))] if water else None,
+            "fishing": [self.slot(rng, low, high) for _ in range(rng.randint(1, 3))] if water else None,
+        }
+
+    def trainer(self, i, trainer_id, position):
+        rng = rng_for(self.seed, "trainer", trainer_id)
+        low, high = self.level_band(i)
+        # The first trainer of every city is its gym leader
+        leader = self.is_city(i) and position == 0
+        party = [(rng.randint(1, self.species), rng.randint(low, high + (5 if leader else 0)))
+                 for _ in range(rng.randint(1, 6))]
+        return {
+            "id": trainer_id, "areaId": self.area_id(i), "name": f"Trainer {trainer_id}",
+            "class": "GymLeader" if leader else rng.choice(TRAINER_CLASSES),
+            "title": f"Synthetic Area {i} Gym Leader" if leader else None,
+            "party": [{"speciesId": s, "level": lv} for s, lv in party],
+            "rewardMoney": max(lv for _, lv in party) * rng.choice([15, 20, 30, 35, 99]),
+            "beforeBattleDialog": [rng.choice(DIALOG_LINES)],
+            "afterBattleDialog": [rng.choice(AFTER_LINES)],
+            "isGymLeader": leader,
+            "badgeIndex": None,
+            "aiBehavior": "GymLeader" if leader else "Smart",
+            "requiredFlag": None,
+            "setsFlag": self.badge_flag(i) if leader else None,
+        }
+
+    def shop(self, i):
+        rng = rng_for(self.seed, "shop", i)
+        items = rng.sample(self.item_ids, min(len(self.item_ids), rng.randint(3, 8)))
+        return {
+            "id": self.area_id(i), "name": f"Synthetic Area {i} Poke Mart",
+            "items": [{"itemId": item, "price": rng.choice([100, 200, 300, 600, 1200])}
+                      for item in items],
+            "requiredBadges": 0,
+        }
+
+
+def generate(out_dir, scale, seed, source_dir=DATA_DIR):
+    items = load_json(source_dir, "items")
+    world = World(seed, scale, [i["id"] for i in items if not i.get("isKeyItem")])
+    counts = {}
+
+    def path(name):
+        return os.path.join(out_dir, *DATA_FILES[name])
+
+    for name in ("items", "type_chart"):
+        os.makedirs(os.path.dirname(path(name)), exist_ok=True)
+        shutil.copyfile(os.path.join(source_dir, *DATA_FILES[name]), path(name))
+
+    with JsonArrayWriter(path("species")) as w:
+        for i in range(1, world.species + 1):
+            w.write(world.species_record(i))
+        counts["species"] = w.count
+
+    with JsonArrayWriter(path("moves")) as w:
+        for i in range(1, world.moves + 1):
+            w.write(world.move_record(i))
+        counts["moves"] = w.count
+
+    with JsonArrayWriter(path("evolutions")) as w:
+        for i in range(1, world.species + 1):
+            evo = world.evolution(i)
+            if evo:
+                w.write(evo)
+        counts["evolutions"] = w.count
+
+    # learnsets.json is an object keyed by species id
+    with open(path("learnsets"), "w") as f:
+        f.write("{")
+        for i in range(1, world.species + 1):
+            body = json.dumps(world.learnset(i), indent=2).replace("\n", "\n  ")
+            f.write(("," if i > 1 else "") + f'\n  "{i}": ' + body)
+        f.write("\n}")
+    counts["learnsets"] = world.species
+
+    with JsonArrayWriter(path("areas")) as w:
+        for i in range(world.areas):
+            w.write(world.area(i))
+        counts["areas"] = w.count
+
+    with JsonArrayWriter(path("encounters")) as w:
+        for i in range(world.areas):
+            if world.has_encounters(i):
+                w.write(world.encounters(i))
+        counts["encounters"] = w.count
+
+    with JsonArrayWriter(path("trainers")) as w:
+        for i in range(world.areas):
+            for position, trainer_id in enumerate(world.trainer_ids(i)):
+                w.write(world.trainer(i, trainer_id, position))
+        counts["trainers"] = w.count
+
+    with JsonArrayWriter(path("shops")) as w:
+        for i in range(0, world.areas, CITY_EVERY):
+            w.write(world.shop(i))
+        counts["shops"] = w.count
+
+    badges = []
+    for i in range(0, world.areas, CITY_EVERY):
+        if len(badges) < 8:
+            badges.append({"index": len(badges), "name": f"Synthetic Badge {len(badges)}",
+                           "gymLeaderTrainerId": world.trainer_ids(i)[0],
+                           "areaId": world.area_id(i), "flag": world.badge_flag(i),
+                           "effect": "None."})
+    progression = load_json(source_dir, "progression")
+    with open(path("progression"), "w") as f:
+        json.dump({"badges": badges, "hmAbilities": progression.get("hmAbilities", []),
+                   "storyEvents": [], "gameProgression": []}, f, indent=2)
+
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("out_dir", help="directory to write the synthetic data/ tree into")
+    parser.add_argument("--scale", type=int, default=10, help="size multiple of the real data")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--source-dir", default=DATA_DIR,
+                        help="data directory to copy items and the type chart from")
+    args = parser.parse_args()
+
+    counts = generate(args.out_dir, args.scale, args.seed, args.source_dir)
+    print(f"Generated x{args.scale} world (seed {args.seed}) in {args.out_dir}")
+    for name, count in counts.items():
+        print(f"  {name}: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Precompute each trainer's line of sight and approach path for every area.
+
+Lays out every area with map_generator.py (which matches MapGenerator tile for
+tile) and walks from each placed trainer in the direction it faces, up to its
+sight range, stopping at the first tile that blocks: a collision tile or
+another NPC or sign. The tiles passed are the ones that trigger the trainer.
+A trainer that spots the player at distance d walks the first d - 1 tiles of
+its approach path and stops next to them.
+
+Output is data/tables/sight.json:
+
+  {"sightRange": 4, "areas": {area id: {
+      "width", "height",
+      "triggers":  union of every trainer's sight tiles,
+      "trainers":  [{"id", "x", "y", "facing", "sight", "approach": [[x, y], ...]}],
+      "overlaps":  [[x, y, [trainer ids]], ...],
+      "stacked":   [[x, y, [trainer ids]], ...]}}}
+
+"stacked" lists tiles holding more than one trainer: GenerateGym clamps every
+regular trainer after the third to the same row, so those on the same side of
+the path share a tile.
+
+Bitmaps ("triggers", "sight") are base64 of width * height bits, tile
+y * width + x in bit i % 8 of byte i // 8, so a per-step check is one bit test
+on "triggers" and a lookup in the trainers whose "sight" has the bit.
+
+Usage:
+    python scripts/trainer_sight.py [--range 4] [--out PATH]
+    python scripts/trainer_sight.py --report                 # areas with overlapping sightlines
+    python scripts/trainer_sight.py --report --area route_3
+"""
+import argparse, base64, json, os
+
+from gamedata import DATA_DIR, GameData
+from map_generator import STEP, generate
+
+# The overworld has no sight range of its own yet; Gen 1 trainers see 1-5 tiles
+SIGHT_RANGE = 4
+BLOCKING_EVENTS = ("npc", "sign")
+
+
+def pack_bits(flags):
+    packed = bytearray((len(flags) + 7) // 8)
+    for i, flag in enumerate(flags):
+        if flag:
+            packed[i >> 3] |= 1 << (i & 7)
+    return base64.b64encode(bytes(packed)).decode()
+
+
+def unpack_bits(text, size):
+    packed = base64.b64decode(text)
+    return [bool(packed[i >> 3] >> (i & 7) & 1) for i in range(size)]
+
+
+def sightline(m, event, sight_range, blockers):
+    """Tiles a trainer sees, nearest first."""
+    dx, dy = STEP[event["facing"]]
+    x, y = event["x"], event["y"]
+    tiles = []
+    for _ in range(sight_range):
+        x, y = x + dx, y + dy
+        if not (0 <= x < m.width and 0 <= y < m.height):
+            break
+        if m.collision[y * m.width + x] or (x, y) in blockers:
+            break
+        tiles.append((x, y))
+    return tiles
+
+
+def area_sight(m, sight_range=SIGHT_RANGE):
+    blockers = {(e["x"], e["y"]) for e in m.events if e["type"] in BLOCKING_EVENTS}
+    size = m.width * m.height
+    seen_by = {}
+    trainers = []
+    for event in m.trainer_events():
+        tiles = sightline(m, event, sight_range, blockers)
+        bits = [False] * size
+        for x, y in tiles:
+            bits[y * m.width + x] = True
+            seen_by.setdefault((x, y), []).append(event["trainerId"])
+        trainers.append({
+            "id": event["trainerId"], "x": event["x"], "y": event["y"], "facing": event["facing"],
+            "sight": pack_bits(bits),
+            # The last sight tile is where the player stands, never walked onto
+            "approach": [list(t) for t in tiles[:-1]],
+        })
+    standing = {}
+    for t in trainers:
+        standing.setdefault((t["x"], t["y"]), []).append(t["id"])
+    triggers = [False] * size
+    for x, y in seen_by:
+        triggers[y * m.width + x] = True
+    return {
+        "width": m.width, "height": m.height,
+        "triggers": pack_bits(triggers),
+        "trainers": trainers,
+        "overlaps": [[x, y, ids] for (x, y), ids in sorted(seen_by.items(), key=lambda i: i[0][::-1])
+                     if len(ids) > 1],
+        "stacked": [[x, y, ids] for (x, y), ids in sorted(standing.items()) if len(ids) > 1],
+    }
+
+
+def build(data, sight_range=SIGHT_RANGE):
+    areas = {}
+    for area_id, area in data.areas.items():
+        m = generate(area, data)
+        if m.trainer_events():
+            areas[area_id] = area_sight(m, sight_range)
+    return {"sightRange": sight_range, "areas": areas}
+
+
+def render(m, sight):
+    """ASCII picture of an area: trainers as letters, their sight in lower case, overlaps as *."""
+    letters = {t["id"]: chr(ord("A") + i % 26) for i, t in enumerate(sight["trainers"])}
+    size = m.width * m.height
+    cells = ["#" if blocked else "." for blocked in m.collision]
+    owners = [[] for _ in range(size)]
+    for t in sight["trainers"]:
+        for i, seen in enumerate(unpack_bits(t["sight"], size)):
+            if seen:
+                owners[i].append(t["id"])
+    for i, ids in enumerate(owners):
+        if len(ids) > 1:
+            cells[i] = "*"
+        elif ids:
+            cells[i] = letters[ids[0]].lower()
+    for t in sight["trainers"]:
+        cells[t["y"] * m.width + t["x"]] = letters[t["id"]]
+    rows = ["".join(cells[y * m.width:(y + 1) * m.width]) for y in range(m.height)]
+    legend = ", ".join(f"{letters[t['id']]}={t['id']}" for t in sight["trainers"])
+    return "\n".join(rows + [legend])
+
+
+def print_report(data, result, area_ids):
+    shown = 0
+    for area_id in area_ids:
+        sight = result["areas"].get(area_id)
+        if sight is None:
+            print(f"{area_id}: no trainers")
+            continue
+        shown += 1
+        pairs = sorted({tuple(ids) for _, _, ids in sight["overlaps"]})
+        print(f"{area_id}: {len(sight['trainers'])} trainers, "
+              f"{len(sight['overlaps'])} tiles seen by more than one ({pairs or 'none'})")
+        for x, y, ids in sight["stacked"]:
+            print(f"  trainers {ids} stand on the same tile ({x}, {y})")
+        print(render(generate(data.areas[area_id], data), sight))
+        print()
+    if not shown:
+        print("No overlapping sightlines or stacked trainers")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--out", default=os.path.join(DATA_DIR, "tables", "sight.json"))
+    parser.add_argument("--range", type=int, default=SIGHT_RANGE, help="tiles a trainer can see")
+    parser.add_argument("--report", action="store_true", help="draw the areas with overlapping sightlines")
+    parser.add_argument("--area", action="append", help="area to draw with --report (repeatable)")
+    args = parser.parse_args()
+
+    data = GameData.load_from_directory(args.data_dir)
+    result = build(data, args.range)
+    if args.report:
+        area_ids = args.area or [a for a, s in result["areas"].items() if s["overlaps"] or s["stacked"]]
+        print_report(data, result, area_ids)
+        return
+
+    os.makedirs(os.path.dirname(args.out), exist_ok=True)
+    with open(args.out, "w") as f:
+        json.dump(result, f, separators=(",", ":"))
+    trainers = sum(len(s["trainers"]) for s in result["areas"].values())
+    overlapping = sum(1 for s in result["areas"].values() if s["overlaps"])
+    stacked = sum(len(ids) - 1 for s in result["areas"].values() for _, _, ids in s["stacked"])
+    print(f"{trainers} trainers in {len(result['areas'])} areas written to {args.out}; "
+          f"{overlapping} areas have overlapping sightlines, {stacked} trainers stacked on another")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""Watch trainer definitions and data/ and keep trainers.json regenerated and valid.
+
+A long-running alternative to re-running generate_trainers.py after every
+edit. Parsed data files, the compiled C# schema and the serialized trainer
+sections stay in memory between edits:
+
+  - an edit to generate_trainers.py re-executes the module (cheap, it has no
+    side effects) and rebuilds, schema-checks and re-serializes only the
+    sections whose definitions changed;
+  - an edit to a data/ JSON file reloads and schema-checks only that file
+    (and re-runs the areas.json cross-check if areas changed);
+  - an edit to a C# model recompiles the schema and revalidates everything.
+
+trainers.json is rewritten atomically, and only when it is valid, so the game
+never reads a half-written or broken file. Changes are picked up with inotify
+on Linux and by polling modification times elsewhere or with --poll.
+
+Usage:
+    python scripts/watch_data.py [--poll] [--interval SECONDS] [--once]
+"""
+import argparse, ctypes, ctypes.util, importlib.util, json, os, select, struct, sys, tempfile, time
+
+import generate_trainers
+from gamedata import DATA_DIR, DATA_FILES, data_path
+from schema_check import SRC_DIR, load_schema, print_problems
+
+# inotify(7) event masks
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_DELETE = 0x200
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_DELETE
+
+# Files written by the watcher itself are never inputs
+INPUT_FILES = [name for name in DATA_FILES if name != "trainers"]
+
+
+class InotifyWatcher:
+    def __init__(self, directories):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = libc.inotify_init1(os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.directories = {}
+        for directory in directories:
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f"cannot watch {directory}")
+            self.directories[wd] = directory
+
+    def wait(self, debounce=0.02):
+        """Block until something changes; return the changed paths.
+
+        Events arriving within `debounce` seconds of each other are merged, so
+        an editor's write-then-rename save is handled once.
+        """
+        changed, timeout = set(), None
+        while True:
+            ready, _, _ = select.select([self.fd], [], [], timeout)
+            if not ready:
+                return changed
+            buf = os.read(self.fd, 1 << 16)
+            pos = 0
+            while pos < len(buf):
+                wd, _, _, length = struct.unpack_from("iIII", buf, pos)
+                name = buf[pos + 16:pos + 16 + length].rstrip(b"\0")
+                pos += 16 + length
+                if name and wd in self.directories:
+                    changed.add(os.path.join(self.directories[wd], os.fsdecode(name)))
+            timeout = debounce
+
+
+class PollingWatcher:
+    def __init__(self, directories, interval=0.1):
+        self.directories = directories
+        self.interval = interval
+        self.snapshot = self.scan()
+
+    def scan(self):
+        stats = {}
+        for directory in self.directories:
+            for entry in os.scandir(directory):
+                if entry.is_file():
+                    st = entry.stat()
+                    stats[entry.path] = (st.st_mtime_ns, st.st_size)
+        return stats
+
+    def wait(self):
+        while True:
+            time.sleep(self.interval)
+            current = self.scan()
+            changed = {p for p in current.keys() | self.snapshot.keys()
+                       if current.get(p) != self.snapshot.get(p)}
+            self.snapshot = current
+            if changed:
+                return changed
+
+
+def source_directories(src_dir):
+    directories = []
+    for dirpath, dirnames, _ in os.walk(src_dir):
+        dirnames[:] = [d for d in dirnames if d not in ("bin", "obj")]
+        directories.append(dirpath)
+    return directories
+
+
+def serialize_record(record):
+    """A record exactly as json.dump(trainers, f, indent=2) lays it out."""
+    return "  " + json.dumps(record, indent=2).replace("\n", "\n  ")
+
+
+def write_atomic(path, text):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".trainers.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class WatchSession:
+    def __init__(self, data_dir=DATA_DIR, source_path=generate_trainers.__file__,
+                 output_path=None, src_dir=SRC_DIR):
+        self.data_dir = data_dir
+        self.source_path = os.path.abspath(source_path)
+        self.output_path = output_path or data_path(data_dir, "trainers")
+        self.src_dir = src_dir
+        self.data_paths = {os.path.abspath(data_path(data_dir, n)): n for n in INPUT_FILES}
+        self.schema = None
+        self.data = {}            # DATA_FILES name -> parsed JSON
+        self.data_errors = {}     # DATA_FILES name -> schema errors
+        self.sections = []        # section names in trainers.json order
+        self.built = {}           # section name -> (fingerprint, records, text, errors)
+        self.written = None
+
+    def directories(self):
+        dirs = {os.path.dirname(p) for p in self.data_paths} | {os.path.dirname(self.source_path)}
+        return sorted(dirs) + source_directories(self.src_dir)
+
+    # ---- loading ----
+
+    def load_data(self, name):
+        path = data_path(self.data_dir, name)
+        try:
+            with open(path) as f:
+                self.data[name] = json.load(f)
+        except FileNotFoundError:
+            self.data.pop(name, None)
+            self.data_errors.pop(name, None)
+            return
+        except json.JSONDecodeError as e:
+            self.data_errors[name] = [(name, f"invalid JSON: {e}")]
+            return
+        self.data_errors[name], _ = self.schema.validate(name, self.data[name])
+
+    def load_sections(self):
+        """Re-execute the trainer definitions; return the names of rebuilt sections."""
+        spec = importlib.util.spec_from_file_location("_watched_trainers", self.source_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        common = module.trainer.__code__
+        rebuilt = []
+        for section in module.SECTIONS:
+            code = section.define.__code__
+            fingerprint = (common.co_code, common.co_consts, code.co_code, code.co_consts,
+                           code.co_names, section.ids, section.areas)
+            previous = self.built.get(section.name)
+            if previous and previous[0] == fingerprint:
+                continue
+            records = section.records
+            errors, _ = self.schema.validate_records("trainers", records)
+            text = ",\n".join(serialize_record(r) for r in records)
+            self.built[section.name] = (fingerprint, records, text, errors)
+            rebuilt.append(section.name)
+        self.sections = [s.name for s in module.SECTIONS]
+        for name in set(self.built) - set(self.sections):
+            del self.built[name]
+        return rebuilt
+
+    def revalidate_sections(self):
+        for name, (fingerprint, records, text, _) in self.built.items():
+            errors, _ = self.schema.validate_records("trainers", records)
+            self.built[name] = (fingerprint, records, text, errors)
+
+    # ---- checks and output ----
+
+    def cross_check(self):
+        """Duplicate ids and the areas.json cross-check, over the in-memory indexes."""
+        problems, seen = [], set()
+        for name in self.sections:
+            for record in self.built[name][1]:
+                if record["id"] in seen:
+                    problems.append((f"trainers.{record['id']}", "duplicate id"))
+                seen.add(record["id"])
+        referenced = {tid for area in self.data.get("areas") or [] for tid in area.get("trainers", [])}
+        for tid in sorted(referenced - seen):
+            problems.append((f"trainers.{tid}", "in areas.json but not generated"))
+        for tid in sorted(seen - referenced):
+            problems.append((f"trainers.{tid}", "generated but not in areas.json"))
+        return problems
+
+    def write_output(self):
+        chunks = [self.built[name][2] for name in self.sections if self.built[name][1]]
+        text = "[\n" + ",\n".join(chunks) + "\n]" if chunks else "[]"
+        if text == self.written:
+            return False
+        write_atomic(self.output_path, text)
+        self.written = text
+        return True
+
+    def refresh(self, changed=None):
+        """Apply a set of changed paths (None for a full build) and report."""
+        start = time.perf_counter()
+        changed = {os.path.abspath(p) for p in changed} if changed is not None else None
+        full = changed is None or any(p.endswith(".cs") for p in changed)
+        if full:
+            self.schema = load_schema(self.src_dir)
+        names = INPUT_FILES if full else [self.data_paths[p] for p in changed if p in self.data_paths]
+        if not full and self.source_path not in changed and not names:
+            return None
+
+        for name in names:
+            self.load_data(name)
+        rebuilt = []
+        if full or self.source_path in changed:
+            try:
+                rebuilt = self.load_sections()
+            except Exception as e:
+                print(f"ERROR: {os.path.basename(self.source_path)}: {type(e).__name__}: {e}")
+                return False
+        if full:
+            self.revalidate_sections()
+
+        errors = [e for name in self.sections for e in self.built[name][3]]
+        errors += [e for name in INPUT_FILES for e in self.data_errors.get(name, [])]
+        problems = self.cross_check()
+        written = False
+        if errors:
+            print_problems(errors, "ERROR")
+        else:
+            written = self.write_output()
+        print_problems(problems, "WARNING")
+        elapsed = (time.perf_counter() - start) * 1000
+        what = f"{len(rebuilt)} sections rebuilt" if rebuilt else ", ".join(names) or "no changes"
+        status = "written" if written else "not written" if errors else "unchanged"
+        print(f"[{time.strftime('%H:%M:%S')}] {what}: {len(errors)} errors, "
+              f"trainers.json {status} ({elapsed:.1f} ms)")
+        return not errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--src-dir", default=SRC_DIR)
+    parser.add_argument("--poll", action="store_true", help="poll instead of using inotify")
+    parser.add_argument("--interval", type=float, default=0.1, help="polling interval in seconds")
+    parser.add_argument("--once", action="store_true", help="build and validate once, then exit")
+    args = parser.parse_args()
+
+    session = WatchSession(args.data_dir, src_dir=args.src_dir)
+    ok = session.refresh()
+    if args.once:
+        sys.exit(0 if ok else 1)
+
+    watcher = None
+    if not args.poll and sys.platform.startswith("linux"):
+        try:
+            watcher = InotifyWatcher(session.directories())
+        except OSError as e:
+            print(f"inotify unavailable ({e}), polling instead")
+    if watcher is None:
+        watcher = PollingWatcher(session.directories(), args.interval)
+    print("Watching for changes, Ctrl+C to stop")
+    try:
+        while True:
+            changed = watcher.wait()
+            changed.discard(os.path.abspath(session.output_path))
+            session.refresh(changed)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+using System.Text.Json;
+using System.Text.Json.Serialization;
+using PokemonGen1.Core.Data;
+using PokemonGen1.Core.Moves;
+using PokemonGen1.Core.Pokemon;
+
+namespace PokemonGen1.Core.Battle;
+
+public class RecordedPokemon
+{
+    public int SpeciesId { get; set; }
+    public int Level { get; set; }
+    /// <summary>Attack, Defense, Speed, Special DVs.</summary>
+    public int[] Dvs { get; set; } = Array.Empty<int>();
+    public int[] Moves { get; set; } = Array.Empty<int>();
+}
+
+public class RecordedTurn
+{
+    public int PlayerMove { get; set; }
+    public int OpponentMove { get; set; }
+    /// <summary>Party index sent out after the player's active Pokemon fainted this turn.</summary>
+    public int? PlayerSwitch { get; set; }
+    /// <summary>Events as [name, fields...], e.g. ["DamageDealt", "Opponent", 12, false, 2].</summary>
+    public List<object?[]> Events { get; set; } = new();
+}
+
+public class BattleLog
+{
+    public int Seed { get; set; }
+    public int TrainerId { get; set; }
+    public List<RecordedPokemon> Player { get; set; } = new();
+    public List<RecordedPokemon> Opponent { get; set; } = new();
+    public List<RecordedTurn> Turns { get; set; } = new();
+    public string? Outcome { get; set; }
+}
+
+/// <summary>
+/// Plays a trainer battle from a seed with scripted random actions and records every
+/// BattleEvent, so other implementations of the battle rules can be checked against
+/// BattleEngine turn by turn. The engine draws from new Random(seed); team building and
+/// action choices draw from a separate generator so they never shift the engine's rolls.
+/// </summary>
+public static class BattleRecorder
+{
+    public const int TrainerDv = 8;
+    public const int PlayerTeamSize = 3;
+
+    public static readonly JsonSerializerOptions JsonOptions = new()
+    {
+        PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
+        DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull
+    };
+
+    public static BattleLog Record(GameData data, int seed, int trainerId, int maxTurns = 200)
+    {
+        var trainer = data.GetTrainer(trainerId)
+            ?? throw new ArgumentException($"Unknown trainer {trainerId}", nameof(trainerId));
+        var setup = new Random(~seed);
+        var log = new BattleLog { Seed = seed, TrainerId = trainerId };
+
+        // Trainer party as the overworld builds it, with fixed DVs
+        foreach (var tp in trainer.Party)
+        {
+            var moves = tp.MoveOverrides is { Length: > 0 }
+                ? tp.MoveOverrides
+                : DefaultMoveIds(data, tp.SpeciesId, tp.Level);
+            log.Opponent.Add(new RecordedPokemon
+            {
+                SpeciesId = tp.SpeciesId, Level = tp.Level,
+                Dvs = new[] { TrainerDv, TrainerDv, TrainerDv, TrainerDv }, Moves = moves
+            });
+        }
+
+        // Random player team at the trainer's highest level
+        int level = trainer.Party.Max(p => p.Level);
+        var speciesIds = data.Species.Keys.ToArray();
+        for (int i = 0; i < PlayerTeamSize; i++)
+        {
+            int speciesId = speciesIds[setup.Next(speciesIds.Length)];
+            log.Player.Add(new RecordedPokemon
+            {
+                SpeciesId = speciesId, Level = level,
+                Dvs = new[] { setup.Next(16), setup.Next(16), setup.Next(16), setup.Next(16) },
+                Moves = DefaultMoveIds(data, speciesId, level)
+            });
+        }
+
+        var state = CreateState(data, log, trainer);
+        var engine = new BattleEngine(state, data, new Random(seed));
+        while (!state.IsOver && log.Turns.Count < maxTurns)
+        {
+            var turn = new RecordedTurn
+            {
+                PlayerMove = ChooseMove(state.PlayerActive, setup),
+                OpponentMove = ChooseMove(state.OpponentActive, setup)
+            };
+            var events = engine.ExecuteTurn(new FightAction(turn.PlayerMove), new FightAction(turn.OpponentMove));
+            turn.Events = events.Select(ToRecord).ToList();
+
+            // The battle screen sends out the next Pokemon outside of the engine
+            if (!state.IsOver && state.PlayerActive.Pokemon.IsFainted)
+            {
+                int next = Array.FindIndex(state.PlayerParty, p => !p.IsFainted);
+                state.PlayerActiveIndex = next;
+                state.PlayerActive = new BattlePokemon(state.PlayerParty[next], data.GetSpecies(state.PlayerParty[next].SpeciesId));
+                turn.PlayerSwitch = next;
+            }
+            log.Turns.Add(turn);
+        }
+        log.Outcome = state.Outcome?.ToString();
+        return log;
+    }
+
+    public static BattleState CreateState(GameData data, BattleLog log, Trainers.TrainerData? trainer = null)
+    {
+        var player = log.Player.Select(p => CreatePokemon(data, p)).ToArray();
+        var opponent = log.Opponent.Select(p => CreatePokemon(data, p)).ToArray();
+        return new BattleState
+        {
+            Type = BattleType.Trainer,
+            PlayerParty = player,
+            PlayerActiveIndex = 0,
+            PlayerActive = new BattlePokemon(player[0], data.GetSpecies(player[0].SpeciesId)),
+            OpponentParty = opponent,
+            OpponentActiveIndex = 0,
+            OpponentActive = new BattlePokemon(opponent[0], data.GetSpecies(opponent[0].SpeciesId)),
+            OpponentTrainer = trainer ?? data.GetTrainer(log.TrainerId)
+        };
+    }
+
+    /// <summary>
+    /// Event as [name without the "Event" suffix, constructor fields in order], enums by name.
+    /// </summary>
+    public static object?[] ToRecord(BattleEvent e)
+    {
+        var type = e.GetType();
+        var name = type.Name.EndsWith("Event") ? type.Name[..^"Event".Length] : type.Name;
+        var fields = type.GetConstructors()[0].GetParameters()
+            .Select(p => type.GetProperty(p.Name!)!.GetValue(e))
+            .Select(v => v is Enum ? v.ToString() : v is float f ? (double)f : v);
+        return fields.Prepend(name).ToArray();
+    }
+
+    private static PokemonInstance CreatePokemon(GameData data, RecordedPokemon p)
+    {
+        var species = data.GetSpecies(p.SpeciesId);
+        var pokemon = new PokemonInstance
+        {
+            SpeciesId = p.SpeciesId,
+            Level = p.Level,
+            AttackDV = p.Dvs[0],
+            DefenseDV = p.Dvs[1],
+            SpeedDV = p.Dvs[2],
+            SpecialDV = p.Dvs[3],
+            Moves = p.Moves.Select(id => new MoveInstance
+            {
+                MoveId = id, CurrentPP = data.GetMove(id).MaxPP, MaxPP = data.GetMove(id).MaxPP
+            }).ToArray()
+        };
+        pokemon.CurrentHp = pokemon.MaxHp(species);
+        pokemon.Experience = StatCalculator.ExperienceForLevel(species.GrowthRate, p.Level);
+        return pokemon;
+    }
+
+    private static int[] DefaultMoveIds(GameData data, int speciesId, int level)
+    {
+        var moves = data.GetDefaultMoves(speciesId, level).Select(m => m.MoveId).ToArray();
+        return moves.Length > 0 ? moves : new[] { 33 };
+    }
+
+    /// <summary>A random move with PP left, or -1 (Struggle) when none has any.</summary>
+    private static int ChooseMove(BattlePokemon pokemon, Random rng)
+    {
+        var usable = Enumerable.Range(0, pokemon.Pokemon.Moves.Length)
+            .Where(i => pokemon.Pokemon.Moves[i].CurrentPP > 0)
+            .ToArray();
+        return usable.Length > 0 ? usable[rng.Next(usable.Length)] : -1;
+    }
+}
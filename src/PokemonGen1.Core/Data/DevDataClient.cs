@@ -0,0 +1,132 @@
+using System.Collections.Concurrent;
+using System.Net;
+using System.Net.Http.Headers;
+using System.Text.Json;
+using PokemonGen1.Core.Trainers;
+
+namespace PokemonGen1.Core.Data;
+
+/// <summary>
+/// Keeps GameData.Trainers in step with scripts/data_server.py during development.
+/// Listens for the server's change events, fetches only the trainer records whose
+/// ETag changed, and hands them to the game thread through ApplyPendingChanges.
+/// </summary>
+public sealed class DevDataClient : IDisposable
+{
+    public const string DefaultUrl = "http://127.0.0.1:8765/";
+
+    private readonly GameData _data;
+    private readonly HttpClient _http;
+    private readonly Dictionary<int, string> _etags = new();
+    private readonly ConcurrentQueue<(int Id, TrainerData? Trainer)> _pending = new();
+    private readonly CancellationTokenSource _stop = new();
+    private string? _indexEtag;
+    private Task? _watch;
+
+    public DevDataClient(GameData data, string baseUrl = DefaultUrl)
+    {
+        _data = data;
+        _http = new HttpClient { BaseAddress = new Uri(baseUrl.EndsWith('/') ? baseUrl : baseUrl + "/") };
+    }
+
+    /// <summary>Start syncing in the background; reconnects if the server restarts.</summary>
+    public void Start()
+    {
+        _watch ??= Task.Run(() => WatchAsync(_stop.Token));
+    }
+
+    /// <summary>
+    /// Apply the records fetched since the last call. Call from the game thread.
+    /// Returns the ids of the trainers that were replaced or removed.
+    /// </summary>
+    public List<int> ApplyPendingChanges()
+    {
+        var applied = new List<int>();
+        while (_pending.TryDequeue(out var change))
+        {
+            if (change.Trainer == null)
+                _data.Trainers.Remove(change.Id);
+            else
+                _data.Trainers[change.Id] = change.Trainer;
+            applied.Add(change.Id);
+        }
+        return applied;
+    }
+
+    /// <summary>
+    /// Fetch the trainer index and every record whose ETag differs from the last fetch.
+    /// Returns the number of changes queued.
+    /// </summary>
+    public async Task<int> FetchChangedTrainersAsync(CancellationToken ct = default)
+    {
+        using var request = new HttpRequestMessage(HttpMethod.Get, "trainers");
+        if (_indexEtag != null)
+            request.Headers.IfNoneMatch.Add(EntityTagHeaderValue.Parse(_indexEtag));
+        using var response = await _http.SendAsync(request, ct);
+        if (response.StatusCode == HttpStatusCode.NotModified) return 0;
+        response.EnsureSuccessStatusCode();
+
+        var index = JsonSerializer.Deserialize<TrainerIndex>(
+            await response.Content.ReadAsStringAsync(ct), GameData.Options)!;
+        int queued = 0;
+        foreach (var (id, etag) in index.Trainers)
+        {
+            if (_etags.TryGetValue(id, out var known) && known == etag) continue;
+            var json = await _http.GetStringAsync($"trainers/{id}", ct);
+            _pending.Enqueue((id, JsonSerializer.Deserialize<TrainerData>(json, GameData.Options)!));
+            _etags[id] = etag;
+            queued++;
+        }
+        foreach (var id in _etags.Keys.Where(id => !index.Trainers.ContainsKey(id)).ToList())
+        {
+            _pending.Enqueue((id, null));
+            _etags.Remove(id);
+            queued++;
+        }
+        _indexEtag = response.Headers.ETag?.ToString();
+        return queued;
+    }
+
+    private async Task WatchAsync(CancellationToken ct)
+    {
+        while (!ct.IsCancellationRequested)
+        {
+            try
+            {
+                // Subscribe first: a rebuild between the initial fetch and the
+                // subscription would otherwise go unseen until the next edit
+                using var response = await _http.GetAsync("events", HttpCompletionOption.ResponseHeadersRead, ct);
+                response.EnsureSuccessStatusCode();
+                await FetchChangedTrainersAsync(ct);
+                using var reader = new StreamReader(await response.Content.ReadAsStreamAsync(ct));
+                while (await reader.ReadLineAsync(ct) is { } line)
+                {
+                    if (line.StartsWith("data:"))
+                        await FetchChangedTrainersAsync(ct);
+                }
+            }
+            catch (OperationCanceledException) when (ct.IsCancellationRequested)
+            {
+                return;
+            }
+            catch (Exception e) when (e is HttpRequestException or IOException or JsonException)
+            {
+                // Server not running (yet) or restarting
+            }
+            await Task.Delay(TimeSpan.FromSeconds(2), ct).ContinueWith(_ => { });
+        }
+    }
+
+    public void Dispose()
+    {
+        _stop.Cancel();
+        _http.Dispose();
+        _stop.Dispose();
+    }
+
+    private class TrainerIndex
+    {
+        public int Version { get; set; }
+        public Dictionary<int, string> Trainers { get; set; } = new();
+    }
+}
@@ -12,7 +12,7 @@ namespace PokemonGen1.Core.Data;
 
 public class GameData
 {
-    private static readonly JsonSerializerOptions Options = new()
+    internal static readonly JsonSerializerOptions Options = new()
     {
         PropertyNameCaseInsensitive = true,
         Converters = { new JsonStringEnumConverter() }
@@ -128,6 +128,16 @@ public class GameData
                 var trainersJson = File.ReadAllText(trainersPath);
                 var trainersList = JsonSerializer.Deserialize<List<TrainerData>>(trainersJson, Options)!;
                 data.Trainers = trainersList.ToDictionary(t => t.Id);
+
+                // Optional string table the trainers reference dialog lines from
+                var dialogPath = Path.Combine(worldDir, "dialog_strings.json");
+                DialogStringTable? dialog = null;
+                if (File.Exists(dialogPath))
+                {
+                    var dialogJson = File.ReadAllText(dialogPath);
+                    dialog = JsonSerializer.Deserialize<DialogStringTable>(dialogJson, Options)!;
+                }
+                ResolveDialog(trainersList, dialog);
             }
 
             var shopsPath = Path.Combine(worldDir, "shops.json");
@@ -141,6 +151,56 @@ public class GameData
 
         return data;
     }
+
+    /// <summary>
+    /// Replace dialog ids with lines from the string table, and make identical
+    /// lines across trainers share one string instance. An id missing from the
+    /// table (dialog_strings.json absent or stale) falls back to the trainer's
+    /// inline lines, and is an error when there are none.
+    /// </summary>
+    private static void ResolveDialog(List<TrainerData> trainers, DialogStringTable? table)
+    {
+        var byId = table?.Strings ?? new Dictionary<int, string>();
+        var pool = new Dictionary<string, string>();
+
+        string[] Resolve(TrainerData trainer, string[] lines, int[]? ids)
+        {
+            var resolved = lines;
+            if (ids != null)
+            {
+                resolved = new string[ids.Length];
+                for (int i = 0; i < ids.Length; i++)
+                {
+                    if (byId.TryGetValue(ids[i], out var line))
+                    {
+                        resolved[i] = line;
+                        continue;
+                    }
+                    if (lines.Length > 0)
+                    {
+                        resolved = lines;
+                        break;
+                    }
+                    throw new InvalidDataException(
+                        $"Trainer {trainer.Id} references dialog string {ids[i]}, which is not in " +
+                        "dialog_strings.json; regenerate it with scripts/generate_trainers.py --string-table");
+                }
+            }
+            return resolved.Select(line => pool.TryGetValue(line, out var shared) ? shared : pool[line] = line).ToArray();
+        }
+
+        foreach (var trainer in trainers)
+        {
+            trainer.BeforeBattleDialog = Resolve(trainer, trainer.BeforeBattleDialog, trainer.BeforeBattleDialogIds);
+            trainer.AfterBattleDialog = Resolve(trainer, trainer.AfterBattleDialog, trainer.AfterBattleDialogIds);
+        }
+    }
+}
+
+public class DialogStringTable
+{
+    public string Language { get; set; } = "en";
+    public Dictionary<int, string> Strings { get; set; } = new();
 }
 
 public class LearnsetEntry
@@ -21,6 +21,9 @@ public class TrainerData
     public int RewardMoney { get; set; }
     public string[] BeforeBattleDialog { get; set; } = Array.Empty<string>();
     public string[] AfterBattleDialog { get; set; } = Array.Empty<string>();
+    /// <summary>Ids into dialog_strings.json; replace the inline dialog when present.</summary>
+    public int[]? BeforeBattleDialogIds { get; set; }
+    public int[]? AfterBattleDialogIds { get; set; }
     public bool IsGymLeader { get; set; }
     public int? BadgeIndex { get; set; }
     public AIBehavior AiBehavior { get; set; }
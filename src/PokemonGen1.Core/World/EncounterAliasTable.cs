@@ -0,0 +1,61 @@
+namespace PokemonGen1.Core.World;
+
+/// <summary>
+/// Walker/Vose alias table over encounter slot weights, in integers so the
+/// distribution is exactly Weight / TotalWeight. Picking a slot takes two draws:
+/// a column, then a roll against that column's threshold. scripts/alias_tables.py
+/// builds the same tables for the Python simulators.
+/// </summary>
+public sealed class EncounterAliasTable
+{
+    public int TotalWeight { get; }
+    public int[] Threshold { get; }
+    public int[] Alias { get; }
+
+    public EncounterAliasTable(IReadOnlyList<int> weights)
+    {
+        int n = weights.Count;
+        Threshold = new int[n];
+        Alias = new int[n];
+        TotalWeight = weights.Sum();
+
+        // Each column holds TotalWeight; slot i brings weights[i] * n of it
+        var scaled = weights.Select(w => (long)w * n).ToArray();
+        var small = new Stack<int>();
+        var large = new Stack<int>();
+        for (int i = 0; i < n; i++)
+        {
+            if (scaled[i] < TotalWeight) small.Push(i);
+            else large.Push(i);
+        }
+
+        while (small.Count > 0 && large.Count > 0)
+        {
+            int less = small.Pop();
+            int more = large.Pop();
+            Threshold[less] = (int)scaled[less];
+            Alias[less] = more;
+            scaled[more] -= TotalWeight - scaled[less];
+            if (scaled[more] < TotalWeight) small.Push(more);
+            else large.Push(more);
+        }
+        // The columns left always hold exactly TotalWeight each
+        while (large.Count > 0)
+        {
+            int i = large.Pop();
+            Threshold[i] = TotalWeight;
+            Alias[i] = i;
+        }
+    }
+
+    public static EncounterAliasTable FromSlots(EncounterSlot[] slots) =>
+        new(slots.Select(s => s.Weight).ToArray());
+
+    /// <summary>Index of the picked slot, or the last slot when every weight is zero.</summary>
+    public int Pick(Random rng)
+    {
+        if (TotalWeight <= 0) return Threshold.Length - 1;
+        int column = rng.Next(Threshold.Length);
+        return rng.Next(TotalWeight) < Threshold[column] ? column : Alias[column];
+    }
+}
@@ -7,6 +7,8 @@ public class EncounterSystem
 {
     private readonly GameData _data;
     private readonly Random _rng;
+    private readonly Dictionary<EncounterSlot[], EncounterAliasTable> _aliasTables =
+        new(ReferenceEqualityComparer.Instance);
 
     public EncounterSystem(GameData data, Random? rng = null)
     {
@@ -75,20 +77,12 @@ public class EncounterSystem
 
     private EncounterSlot PickSlot(EncounterSlot[] slots)
     {
-        int totalWeight = 0;
-        foreach (var slot in slots)
-            totalWeight += slot.Weight;
-
-        int roll = _rng.Next(totalWeight);
-        int cumulative = 0;
-        foreach (var slot in slots)
+        if (!_aliasTables.TryGetValue(slots, out var alias))
         {
-            cumulative += slot.Weight;
-            if (roll < cumulative)
-                return slot;
+            alias = EncounterAliasTable.FromSlots(slots);
+            _aliasTables[slots] = alias;
         }
-
-        return slots[^1];
+        return slots[alias.Pick(_rng)];
     }
 
     private PokemonInstance GenerateFromSlot(EncounterSlot slot)
@@ -4,11 +4,33 @@ namespace PokemonGen1.Core.World;
 
 public class MapGenerator
 {
-    private readonly Random _rng;
+    private readonly Random? _rng;
 
+    /// <summary>
+    /// Without an rng every layout is a pure function of the area, so the same
+    /// map comes back on every visit and scripts/map_generator.py can rebuild it.
+    /// </summary>
     public MapGenerator(Random? rng = null)
     {
-        _rng = rng ?? new Random();
+        _rng = rng;
+    }
+
+    /// <summary>
+    /// FNV-1a over the UTF-16 code units of a string. Unlike string.GetHashCode,
+    /// which is randomized per process, this is the same in every run.
+    /// </summary>
+    public static int StableHash(string value)
+    {
+        unchecked
+        {
+            uint hash = 2166136261;
+            foreach (char c in value)
+            {
+                hash ^= c;
+                hash *= 16777619;
+            }
+            return (int)hash;
+        }
     }
 
     public MapData Generate(AreaData area, GameData gameData)
@@ -178,10 +200,11 @@ public class MapGenerator
         FillLayer(map.GroundLayer, w, 2, 2, w - 4, h - 4, TileType.Path);
 
         // Random rock pillars
+        var rng = _rng ?? new Random(StableHash(area.Id));
         for (int i = 0; i < 6; i++)
         {
-            int rx = _rng.Next(3, w - 3);
-            int ry = _rng.Next(3, h - 3);
+            int rx = rng.Next(3, w - 3);
+            int ry = rng.Next(3, h - 3);
             SetTile(map.ObjectLayer, w, rx, ry, TileType.RockWall);
             map.CollisionLayer[ry * w + rx] = true;
         }
@@ -566,7 +589,7 @@ public class MapGenerator
     {
         int w = map.Width, h = map.Height;
         // Deterministic placement based on seed for consistency
-        var localRng = new Random(map.Id.GetHashCode() + seed);
+        var localRng = new Random(unchecked(StableHash(map.Id) + seed));
 
         for (int attempt = 0; attempt < 100; attempt++)
         {
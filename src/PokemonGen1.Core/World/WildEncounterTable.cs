@@ -1,11 +1,17 @@
+using System.Text.Json.Serialization;
+
 namespace PokemonGen1.Core.World;
 
 public class WildEncounterTable
 {
     public string AreaId { get; set; } = "";
     public int EncounterRate { get; set; }
+    // encounters.json names the slot lists by method
+    [JsonPropertyName("grass")]
     public EncounterSlot[] GrassEncounters { get; set; } = Array.Empty<EncounterSlot>();
+    [JsonPropertyName("surf")]
     public EncounterSlot[]? SurfEncounters { get; set; }
+    [JsonPropertyName("fishing")]
     public EncounterSlot[]? FishingEncounters { get; set; }
 }
 
@@ -18,6 +18,7 @@ public class PokemonGame : Microsoft.Xna.Framework.Game
     private RenderTarget2D _renderTarget = null!;
     private InputManager _input = null!;
     private ScreenManager _screens = null!;
+    private DevDataClient? _devData;
 
     public GameData GameData { get; private set; } = null!;
     public SpriteFont Font { get; private set; } = null!;
@@ -54,6 +55,15 @@ public class PokemonGame : Microsoft.Xna.Framework.Game
         // Load game data
         string dataDir = FindDataDirectory();
         GameData = GameData.LoadFromDirectory(dataDir);
+#if DEBUG
+        // Hot-reload trainers from scripts/data_server.py when it is pointed at
+        var dataServer = Environment.GetEnvironmentVariable("POKEMON_DATA_SERVER");
+        if (!string.IsNullOrEmpty(dataServer))
+        {
+            _devData = new DevDataClient(GameData, dataServer);
+            _devData.Start();
+        }
+#endif
 
         // Initialize sprite manager
         var spritesDir = Path.Combine(dataDir, "sprites");
@@ -68,11 +78,18 @@ public class PokemonGame : Microsoft.Xna.Framework.Game
 
     protected override void Update(GameTime gameTime)
     {
+        _devData?.ApplyPendingChanges();
         _input.Update();
         _screens.Update(gameTime, _input);
         base.Update(gameTime);
     }
 
+    protected override void UnloadContent()
+    {
+        _devData?.Dispose();
+        base.UnloadContent();
+    }
+
     protected override void Draw(GameTime gameTime)
     {
         // Draw to virtual resolution render target
@@ -66,7 +66,7 @@ public class OverworldScreen : IScreen
         _game = game;
         _save = save;
         _encounters = new EncounterSystem(game.GameData, _rng);
-        _mapGenerator = new MapGenerator(_rng);
+        _mapGenerator = new MapGenerator();
         _tileset = new ProceduralTileset(game.GraphicsDevice);
         _sprites = new ProceduralSprites(game.GraphicsDevice);
         _tileRenderer = new TileRenderer(_tileset, _sprites);
@@ -0,0 +1,70 @@
+using System.Text.Json;
+using PokemonGen1.Core.Battle;
+using PokemonGen1.Core.Data;
+
+namespace PokemonGen1.Core.Tests.Battle;
+
+public class BattleRecorderTests
+{
+    // Battle logs the Python engine is checked against (scripts/parity_harness.py).
+    // Regenerate after changing battle rules with: RECORD_BATTLE_FIXTURES=1 dotnet test
+    private const string FixtureFile = "battle_logs.jsonl";
+    private const int FixtureBattles = 200;
+
+    private readonly GameData _data;
+
+    public BattleRecorderTests()
+    {
+        _data = GameData.LoadFromDirectory(FindDataDir());
+    }
+
+    [Fact]
+    public void SameSeed_RecordsSameBattle()
+    {
+        var first = JsonSerializer.Serialize(BattleRecorder.Record(_data, 7, 1), BattleRecorder.JsonOptions);
+        var second = JsonSerializer.Serialize(BattleRecorder.Record(_data, 7, 1), BattleRecorder.JsonOptions);
+
+        Assert.Equal(first, second);
+    }
+
+    [Fact]
+    public void Record_EndsWithBattleEnded()
+    {
+        var log = BattleRecorder.Record(_data, 3, 200);
+
+        Assert.NotNull(log.Outcome);
+        Assert.Equal("BattleEnded", log.Turns[^1].Events[^1][0]);
+    }
+
+    [Fact]
+    public void Fixtures_MatchEngine()
+    {
+        var path = Path.Combine(Path.GetDirectoryName(FindDataDir())!, "tests", "fixtures", FixtureFile);
+        var trainerIds = _data.Trainers.Keys.OrderBy(id => id).ToArray();
+        var expected = Enumerable.Range(1, FixtureBattles)
+            .Select(seed => BattleRecorder.Record(_data, seed, trainerIds[(seed - 1) % trainerIds.Length]))
+            .Select(log => JsonSerializer.Serialize(log, BattleRecorder.JsonOptions))
+            .ToList();
+
+        if (Environment.GetEnvironmentVariable("RECORD_BATTLE_FIXTURES") == "1")
+        {
+            Directory.CreateDirectory(Path.GetDirectoryName(path)!);
+            File.WriteAllLines(path, expected);
+        }
+
+        Assert.Equal(expected, File.ReadAllLines(path));
+    }
+
+    private static string FindDataDir()
+    {
+        var dir = Directory.GetCurrentDirectory();
+        while (dir != null)
+        {
+            var candidate = Path.Combine(dir, "data");
+            if (Directory.Exists(candidate) && File.Exists(Path.Combine(candidate, "pokemon", "species.json")))
+                return candidate;
+            dir = Directory.GetParent(dir)?.FullName;
+        }
+        throw new DirectoryNotFoundException("Cannot find data directory");
+    }
+}
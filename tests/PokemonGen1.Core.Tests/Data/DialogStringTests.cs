@@ -0,0 +1,74 @@
+using System.Text.Json.Nodes;
+using PokemonGen1.Core.Data;
+
+namespace PokemonGen1.Core.Tests.Data;
+
+public class DialogStringTests : IDisposable
+{
+    private readonly string _dataDir;
+
+    public DialogStringTests()
+    {
+        // A scratch copy of data/ whose first trainer references dialog string 999999
+        _dataDir = Path.Combine(Path.GetTempPath(), "pkdata-" + Guid.NewGuid().ToString("N"));
+        CopyDirectory(FindDataDir(), _dataDir);
+        File.Delete(Path.Combine(_dataDir, "world", "dialog_strings.json"));
+    }
+
+    public void Dispose() => Directory.Delete(_dataDir, recursive: true);
+
+    [Fact]
+    public void MissingString_FallsBackToInlineLines()
+    {
+        var trainer = EditFirstTrainer(keepInlineLines: true);
+
+        var data = GameData.LoadFromDirectory(_dataDir);
+
+        var expected = trainer["beforeBattleDialog"]!.AsArray().Select(n => n!.GetValue<string>());
+        Assert.Equal(expected, data.Trainers[trainer["id"]!.GetValue<int>()].BeforeBattleDialog);
+    }
+
+    [Fact]
+    public void MissingString_WithoutInlineLines_NamesTrainerAndString()
+    {
+        var trainer = EditFirstTrainer(keepInlineLines: false);
+
+        var error = Assert.Throws<InvalidDataException>(() => GameData.LoadFromDirectory(_dataDir));
+        Assert.Contains($"Trainer {trainer["id"]}", error.Message);
+        Assert.Contains("999999", error.Message);
+    }
+
+    private JsonObject EditFirstTrainer(bool keepInlineLines)
+    {
+        var path = Path.Combine(_dataDir, "world", "trainers.json");
+        var trainers = JsonNode.Parse(File.ReadAllText(path))!.AsArray();
+        var trainer = trainers[0]!.AsObject();
+        trainer["beforeBattleDialogIds"] = new JsonArray(999999);
+        if (!keepInlineLines)
+            trainer["beforeBattleDialog"] = new JsonArray();
+        File.WriteAllText(path, trainers.ToJsonString());
+        return trainer;
+    }
+
+    private static void CopyDirectory(string source, string target)
+    {
+        Directory.CreateDirectory(target);
+        foreach (var file in Directory.GetFiles(source))
+            File.Copy(file, Path.Combine(target, Path.GetFileName(file)));
+        foreach (var dir in Directory.GetDirectories(source))
+            CopyDirectory(dir, Path.Combine(target, Path.GetFileName(dir)));
+    }
+
+    private static string FindDataDir()
+    {
+        var dir = Directory.GetCurrentDirectory();
+        while (dir != null)
+        {
+            var candidate = Path.Combine(dir, "data");
+            if (Directory.Exists(candidate) && File.Exists(Path.Combine(candidate, "pokemon", "species.json")))
+                return candidate;
+            dir = Directory.GetParent(dir)?.FullName;
+        }
+        throw new DirectoryNotFoundException("Cannot find data directory");
+    }
+}
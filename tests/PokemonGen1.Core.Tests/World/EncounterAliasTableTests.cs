@@ -0,0 +1,40 @@
+using PokemonGen1.Core.World;
+
+namespace PokemonGen1.Core.Tests.World;
+
+public class EncounterAliasTableTests
+{
+    [Theory]
+    [InlineData(new[] { 20, 20, 15, 15, 10, 10, 5, 5 })]
+    [InlineData(new[] { 1, 99 })]
+    [InlineData(new[] { 7, 0, 3, 0, 11 })]
+    [InlineData(new[] { 25 })]
+    public void Table_GivesEachSlotExactlyItsWeight(int[] weights)
+    {
+        var table = new EncounterAliasTable(weights);
+        var mass = new long[weights.Length];
+        for (int column = 0; column < weights.Length; column++)
+        {
+            mass[column] += table.Threshold[column];
+            mass[table.Alias[column]] += table.TotalWeight - table.Threshold[column];
+        }
+
+        Assert.Equal(weights.Select(w => (long)w * weights.Length), mass);
+    }
+
+    [Fact]
+    public void Pick_NeverReturnsZeroWeightSlots()
+    {
+        var table = new EncounterAliasTable(new[] { 0, 5, 0, 5 });
+        var rng = new Random(42);
+        for (int i = 0; i < 1000; i++)
+            Assert.Contains(table.Pick(rng), new[] { 1, 3 });
+    }
+
+    [Fact]
+    public void Pick_AllZeroWeights_ReturnsLastSlot()
+    {
+        var table = new EncounterAliasTable(new[] { 0, 0, 0 });
+        Assert.Equal(2, table.Pick(new Random(1)));
+    }
+}
@@ -0,0 +1,63 @@
+using PokemonGen1.Core.Data;
+using PokemonGen1.Core.World;
+
+namespace PokemonGen1.Core.Tests.World;
+
+public class MapGeneratorTests
+{
+    private readonly GameData _data;
+
+    public MapGeneratorTests()
+    {
+        _data = GameData.LoadFromDirectory(FindDataDir());
+    }
+
+    [Fact]
+    public void StableHash_MatchesFnv1a()
+    {
+        // Same value as map_generator.stable_hash("route_1") in scripts/
+        Assert.Equal(2141160262, MapGenerator.StableHash("route_1"));
+        Assert.Equal(unchecked((int)2166136261), MapGenerator.StableHash(""));
+    }
+
+    [Fact]
+    public void Generate_PlacesTrainersTheSameEveryTime()
+    {
+        foreach (var area in _data.Areas.Values)
+        {
+            var first = new MapGenerator().Generate(area, _data);
+            var second = new MapGenerator().Generate(area, _data);
+
+            Assert.Equal(first.CollisionLayer, second.CollisionLayer);
+            Assert.Equal(
+                first.Events.Select(e => (e.X, e.Y, e.TrainerId, e.ItemId)),
+                second.Events.Select(e => (e.X, e.Y, e.TrainerId, e.ItemId)));
+        }
+    }
+
+    [Fact]
+    public void Generate_PlacesEveryAreaTrainer()
+    {
+        foreach (var area in _data.Areas.Values)
+        {
+            var map = new MapGenerator().Generate(area, _data);
+            var placed = map.Events.Where(e => e.TrainerId.HasValue).Select(e => e.TrainerId!.Value);
+            var expected = area.Trainers.Where(id => _data.GetTrainer(id) != null);
+
+            Assert.Equal(expected.OrderBy(id => id), placed.OrderBy(id => id));
+        }
+    }
+
+    private static string FindDataDir()
+    {
+        var dir = Directory.GetCurrentDirectory();
+        while (dir != null)
+        {
+            var candidate = Path.Combine(dir, "data");
+            if (Directory.Exists(candidate) && File.Exists(Path.Combine(candidate, "pokemon", "species.json")))
+                return candidate;
+            dir = Directory.GetParent(dir)?.FullName;
+        }
+        throw new DirectoryNotFoundException("Cannot find data directory");
+    }
+}